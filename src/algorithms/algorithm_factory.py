@@ -8,6 +8,12 @@ from src.algorithms.base_algorithm import LoadingAlgorithm
 from src.algorithms.xy_axis_loading import XYAxisLoading
 from src.algorithms.x_distribution import XDistributionLoading
 from src.algorithms.y_distribution import YDistributionLoading
+from src.algorithms.lane_dp_loading import LaneDPLoading
+from src.algorithms.row_milp_loading import RowMILPLoading
+from src.algorithms.beam_search_loading import BeamSearchLoading
+from src.algorithms.genetic_loading import GeneticLoading
+from src.algorithms.lns_loading import LNSLoading
+from src.algorithms.portfolio_loading import PortfolioLoading
 # Import algorytmu uczenia ze wzmocnieniem
 from src.algorithms.reinforcement_learning import ReinforcementLearningLoading
 
@@ -31,6 +37,12 @@ def get_algorithm(algorithm_name: str, config: Optional[Dict[str, Any]] = None)
         "XY_Axis_Loading": XYAxisLoading,
         "X_Distribution": XDistributionLoading,
         "Y_Distribution": YDistributionLoading,
+        "Lane_DP_Loading": LaneDPLoading,
+        "Row_MILP_Loading": RowMILPLoading,
+        "Beam_Search_Loading": BeamSearchLoading,
+        "Genetic_Loading": GeneticLoading,
+        "LNS_Loading": LNSLoading,
+        "Portfolio_Loading": PortfolioLoading,
         "RL_Loading": ReinforcementLearningLoading
     }
     
@@ -54,6 +66,12 @@ def list_available_algorithms() -> Dict[str, str]:
         "XY_Axis_Loading": "Metoda załadunku wzdłuż osi X oraz osi Y, która optymalizuje wykorzystanie przestrzeni naczepy.",
         "X_Distribution": "Metoda załadunku optymalizująca rozkład masy wzdłuż osi X naczepy.",
         "Y_Distribution": "Metoda załadunku optymalizująca rozkład masy wzdłuż osi Y naczepy.",
+        "Lane_DP_Loading": "Metoda załadunku pasami wzdłużnymi, których zawartość jest wybierana programowaniem dynamicznym (minimalizacja LDM).",
+        "Row_MILP_Loading": "Metoda załadunku rzędami poprzecznymi dobieranymi programowaniem całkowitoliczbowym (MILP) z limitem czasu i raportem luki optymalności.",
+        "Beam_Search_Loading": "Metoda przeszukiwania wiązkowego: utrzymuje kilka najlepszych częściowych załadunków i rozszerza je równolegle.",
+        "Genetic_Loading": "Metoda ewolucyjna: algorytm genetyczny dobiera kolejność i rotacje palet, oceniając populację równolegle.",
+        "LNS_Loading": "Metoda przeszukiwania dużego sąsiedztwa: wielokrotnie usuwa fragment załadunku i ustawia palety ponownie, zachowując poprawy.",
+        "Portfolio_Loading": "Portfel algorytmów: uruchamia pozostałe algorytmy równolegle na tym samym zestawie i wybiera najlepszy plan.",
         "RL_Loading": "Metoda załadunku wykorzystująca algorytm uczenia ze wzmocnieniem (reinforcement learning)."
     }
     
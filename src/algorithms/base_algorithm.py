@@ -3,11 +3,26 @@ Moduł zawierający definicję klasy bazowej dla algorytmów załadunku palet.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Tuple, Optional
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import List, Dict, Any, Tuple, Optional, Callable, Iterable, Iterator, Type
+import itertools
+import os
+import threading
+import time
 
 from src.data.pallet import Pallet
+from src.data.pallet_array import PalletArray
 from src.data.trailer import Trailer
+from src.algorithms.simulated_annealing import SimulatedAnnealingImprover
 from src.config import TRAILER_CONFIG
+from src.utils.parallel import create_context_executor
+from src.utils.plan_cache import PlanCache
+
+# Plan załadunku: identyfikator palety -> (pozycja (x, y, z), rotacja)
+LoadingPlan = Dict[str, Tuple[Tuple[int, int, int], int]]
+
+# Funkcja raportująca postęp: słownik z nazwą algorytmu, czasem od startu, liczbą palet i LDM najlepszego planu
+ProgressCallback = Callable[[Dict[str, Any]], None]
 
 
 class LoadingAlgorithm(ABC):
@@ -18,6 +33,7 @@ class LoadingAlgorithm(ABC):
         name: Nazwa algorytmu
         trailer: Obiekt naczepy, która ma być załadowana
         config: Konfiguracja algorytmu
+        plan: Plan ostatniego załadunku (identyfikator palety -> pozycja, rotacja)
     """
     
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
@@ -31,6 +47,12 @@ class LoadingAlgorithm(ABC):
         self.name = name
         self.trailer = Trailer()
         self.config = config or {}
+        self.plan: LoadingPlan = {}
+        
+        # Budżet czasu i raportowanie postępu bieżącego uruchomienia (ustawiane w `run`)
+        self._start_time = 0.0
+        self._deadline: Optional[float] = None
+        self._progress: Optional[ProgressCallback] = None
     
     @abstractmethod
     def load_pallets(self, pallets: List[Pallet]) -> List[Pallet]:
@@ -45,46 +67,239 @@ class LoadingAlgorithm(ABC):
         """
         pass
     
-    def run(self, pallets: List[Pallet], reset: bool = True) -> List[Pallet]:
+    def run(self, pallets: List[Pallet], reset: bool = True, time_budget_s: Optional[float] = None,
+            progress: Optional[ProgressCallback] = None, plan_cache: Optional[PlanCache] = None) -> List[Pallet]:
         """
         Uruchamia algorytm załadunku palet.
-        
+
+        Gdy konfiguracja algorytmu zawiera "polish": True, plan jest na koniec
+        poprawiany metodą symulowanego wyżarzania (patrz `_polish`).
+
+        Algorytmy iteracyjne (genetyczny, LNS, przeszukiwanie wiązkowe, poprawianie
+        planu) po przekroczeniu `time_budget_s` kończą obliczenia i zwracają najlepszy
+        dotychczasowy plan, a kolejne najlepsze wyniki pośrednie przekazują do `progress`.
+        Budżet ogranicza też budżety czasu z konfiguracji algorytmu.
+
+        Z pamięcią podręczną `plan_cache` plan manifestu o tej samej sygnaturze
+        (algorytm, konfiguracja, naczepa, typy i przedziały mas palet) jest
+        przypisywany paletom bez ponownego załadunku, a nowy plan jest zapamiętywany -
+        chyba że obliczenia przerwał budżet czasu (plan mógłby być gorszy niż bez limitu).
+
         Args:
             pallets: Lista palet do załadunku
             reset: Czy zresetować naczepę przed załadunkiem
+            time_budget_s: Budżet czasu w sekundach (None - bez limitu)
+            progress: Funkcja wywoływana z wynikami pośrednimi (opcjonalna)
+            plan_cache: Pamięć podręczna planów (opcjonalna)
             
         Returns:
             List[Pallet]: Lista załadowanych palet z przypisanymi pozycjami
+            
+        Raises:
+            ValueError: Gdy podano `plan_cache`, a konfiguracja zawiera funkcje (patrz `PlanCache`)
         """
+        self._start_time = time.perf_counter()
+        self._deadline = None if time_budget_s is None else self._start_time + time_budget_s
+        self._progress = progress
+        
         # Resetowanie naczepy jeśli wymagane
         if reset:
             self.trailer.reset()
         
-        # Głęboka kopia palet, aby nie modyfikować oryginałów
-        pallets_to_load = [
-            Pallet(
-                pallet_id=p.pallet_id,
-                pallet_type=p.pallet_type,
-                length=p.length,
-                width=p.width,
-                height=p.height,
-                weight=p.weight,
-                cargo_weight=p.cargo_weight,
-                max_stack_weight=p.max_stack_weight,
-                stackable=p.stackable,
-                fragile=p.fragile,
-                color=p.color
-            ) for p in pallets
-        ]
-        
-        # Przeprowadzenie załadunku
-        loaded_pallets = self.load_pallets(pallets_to_load)
+        # Płytkie kopie palet bez pozycji i rotacji, aby nie modyfikować oryginałów
+        pallets_to_load = [_unplaced_copy(p) for p in pallets]
+        
+        # Plan z pamięci podręcznej (jeśli manifest już planowano)
+        loaded_pallets = None
+        if plan_cache is not None:
+            loaded_pallets = self._load_cached_plan(plan_cache, pallets_to_load)
+        
+        if loaded_pallets is None:
+            # Przeprowadzenie załadunku
+            loaded_pallets = self.load_pallets(pallets_to_load)
+            
+            # Opcjonalne poprawianie planu metodą symulowanego wyżarzania
+            if self.config.get("polish", False) and self._remaining_time() != 0:
+                loaded_pallets = self._polish(loaded_pallets)
+            
+            # Plan przerwany budżetem czasu nie trafia do pamięci - kolejne uruchomienia liczą go od nowa
+            if plan_cache is not None and self._remaining_time() != 0:
+                plan_cache.store(self.name, self.config, self.trailer, pallets_to_load, loaded_pallets)
         
         # Aktualizacja naczepy
-        self.trailer.loaded_pallets = loaded_pallets
+        self.trailer.set_loaded_pallets(loaded_pallets)
         
+        # Zapamiętanie planu, aby można go było odtworzyć bez ponownego załadunku
+        self.plan = {p.pallet_id: (p.position, p.rotation) for p in loaded_pallets}
+        
+        loading_meters = max((p.position[0] + p.dimensions[0] for p in loaded_pallets), default=0) / 1000
+        self._report_progress(len(loaded_pallets), loading_meters, final=True)
         return loaded_pallets
     
+    def run_many(self, manifests: Iterable[List[Pallet]], workers: Optional[int] = None,
+                 time_budget_s: Optional[float] = None, executor_type: str = "process") -> Iterator[Dict[str, Any]]:
+        """
+        Planuje załadunek wielu naczep równolegle, w puli procesów lub wątków.
+        
+        Każdy proces (wątek) roboczy tworzy algorytm tej samej klasy i z tą samą
+        konfiguracją tylko raz i używa go dla kolejnych manifestów. Palety są
+        przesyłane między procesami jako `PalletArray`, a wyniki są zwracane
+        w kolejności zakończenia, zanim zaplanowane zostaną pozostałe manifesty.
+        
+        Args:
+            manifests: Manifesty (listy palet) do zaplanowania
+            workers: Liczba procesów/wątków (None - liczba rdzeni); 1 oznacza obliczenia sekwencyjne
+            time_budget_s: Budżet czasu planowania jednego manifestu w sekundach (None - bez limitu)
+            executor_type: Rodzaj puli: "process" lub "thread"
+            
+        Yields:
+            Dict[str, Any]: Wynik manifestu: indeks manifestu, załadowane palety (`PalletArray`),
+                liczba palet, LDM i czas w sekundach albo komunikat błędu
+        """
+        workers = workers or os.cpu_count() or 1
+        
+        # Równoległość zapewnia pula manifestów, więc algorytmy nie tworzą własnych pul
+        config = {**self.config, "workers": 1} if workers > 1 else self.config
+        executor, run_item = create_context_executor(
+            workers, executor_type, _run_batch_item, _BatchWorker(type(self), config)
+        )
+        
+        numbered = enumerate(manifests)
+        pending = set()
+        with executor:
+            while True:
+                # Ograniczona liczba zadań w puli - manifesty nie są konwertowane z góry, a wyniki płyną na bieżąco
+                for index, pallets in itertools.islice(numbered, 2 * workers - len(pending)):
+                    pending.add(executor.submit(run_item, index, PalletArray.from_pallets(pallets), time_budget_s))
+                if not pending:
+                    break
+                
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+    
+    def _load_cached_plan(self, plan_cache: PlanCache, pallets: List[Pallet]) -> Optional[List[Pallet]]:
+        """
+        Ładuje palety według planu z pamięci podręcznej.
+        
+        Args:
+            plan_cache: Pamięć podręczna planów
+            pallets: Palety do załadunku
+            
+        Returns:
+            Optional[List[Pallet]]: Załadowane palety lub None, gdy planu nie ma albo nie pasuje do naczepy
+                (np. masy w tych samych przedziałach przekraczają ładowność)
+        """
+        cached_pallets = plan_cache.lookup(self.name, self.config, self.trailer, pallets)
+        if cached_pallets is None:
+            return None
+        
+        if self.trailer.add_pallets(cached_pallets):
+            return cached_pallets
+        
+        # Plan nie pasuje - palety wracają do stanu sprzed próby (naczepa nie została zmieniona)
+        for pallet in pallets:
+            pallet.position = (0, 0, 0)
+            pallet.rotation = 0
+        return None
+    
+    def _polish(self, loaded_pallets: List[Pallet]) -> List[Pallet]:
+        """
+        Poprawia plan załadunku za pomocą `SimulatedAnnealingImprover`.
+        
+        Konfiguracja wyżarzania jest brana z klucza "polish_config" konfiguracji algorytmu.
+        
+        Args:
+            loaded_pallets: Palety załadowane przez algorytm
+            
+        Returns:
+            List[Pallet]: Palety po poprawie (bez zmian, jeśli planu nie da się odtworzyć w naczepie)
+        """
+        # Naczepa musi odpowiadać planowi, bo ruchy są wykonywane na jej strukturach
+        self.trailer.reset()
+        if not all(self.trailer.add_pallet(p) for p in loaded_pallets):
+            # Naczepa nie może zostać z częścią planu - wraca do planu algorytmu
+            self.trailer.set_loaded_pallets(loaded_pallets)
+            return loaded_pallets
+        
+        improver = SimulatedAnnealingImprover(self.config.get("polish_config"))
+        return improver.improve(
+            self.trailer,
+            time_budget_s=self._budget_within_run(improver.config.get("time_budget_s")),
+            progress=lambda trailer: self._report_progress(
+                len(trailer.loaded_pallets), trailer.get_loading_meters(), stage="polish"
+            )
+        )
+    
+    def _remaining_time(self) -> Optional[float]:
+        """
+        Zwraca czas pozostały z budżetu bieżącego uruchomienia.
+        
+        Returns:
+            Optional[float]: Pozostały czas w sekundach (nie mniej niż 0) lub None, jeśli budżetu nie podano
+        """
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - time.perf_counter())
+    
+    def _budget_within_run(self, time_budget_s: Optional[float]) -> Optional[float]:
+        """
+        Ogranicza budżet czasu etapu (np. z konfiguracji algorytmu) do czasu pozostałego z budżetu `run`.
+        
+        Args:
+            time_budget_s: Budżet czasu etapu w sekundach (None - bez limitu)
+            
+        Returns:
+            Optional[float]: Budżet w sekundach lub None, jeśli żaden budżet nie obowiązuje
+        """
+        remaining = self._remaining_time()
+        if remaining is None:
+            return time_budget_s
+        if time_budget_s is None:
+            return remaining
+        return min(time_budget_s, remaining)
+    
+    def _report_progress(self, pallets_count: int, loading_meters: float, **details: Any) -> None:
+        """
+        Przekazuje wynik pośredni do funkcji `progress` podanej w `run` (jeśli ją podano).
+        
+        Args:
+            pallets_count: Liczba palet w najlepszym dotychczasowym planie
+            loading_meters: LDM najlepszego dotychczasowego planu
+            **details: Dodatkowe informacje zależne od algorytmu (np. ocena, etap)
+        """
+        if self._progress is None:
+            return
+        self._progress({
+            "algorithm": self.name,
+            "elapsed_s": time.perf_counter() - self._start_time,
+            "pallets_count": pallets_count,
+            "loading_meters": loading_meters,
+            **details
+        })
+    
+    def apply_plan(self, pallets: List[Pallet], plan: Optional[LoadingPlan] = None) -> List[Pallet]:
+        """
+        Odtwarza załadunek z planu na kopiach podanych palet.
+        
+        Args:
+            pallets: Lista palet (oryginały nie są modyfikowane)
+            plan: Plan załadunku (domyślnie plan ostatniego uruchomienia algorytmu)
+            
+        Returns:
+            List[Pallet]: Kopie palet ujętych w planie, z przypisanymi pozycjami i rotacjami
+        """
+        if plan is None:
+            plan = self.plan
+        
+        placed = []
+        for pallet in pallets:
+            if pallet.pallet_id in plan:
+                placed_pallet = pallet.copy()
+                placed_pallet.position, placed_pallet.rotation = plan[pallet.pallet_id]
+                placed.append(placed_pallet)
+        return placed
+    
     def get_statistics(self) -> Dict[str, Any]:
         """
         Zwraca statystyki załadunku dla bieżącego stanu naczepy.
@@ -167,4 +382,73 @@ class LoadingAlgorithm(ABC):
             pallet.rotate()
             return True
         
-        return False 
\ No newline at end of file
+        return False 
+
+
+def _unplaced_copy(pallet: Pallet) -> Pallet:
+    """Zwraca kopię palety w pozycji początkowej (0, 0, 0) i bez rotacji."""
+    clone = pallet.copy()
+    clone.position = (0, 0, 0)
+    clone.rotation = 0
+    return clone
+
+
+class _BatchWorker:
+    """
+    Klasa i konfiguracja algorytmu jednego wywołania `run_many`.
+    
+    Instancja algorytmu jest tworzona raz na wątek (proces) roboczy i używana
+    dla kolejnych manifestów. Przy przesyłaniu do procesu roboczego przekazywane
+    są tylko klasa i konfiguracja.
+    """
+    
+    def __init__(self, algorithm_class: Type[LoadingAlgorithm], config: Dict[str, Any]):
+        self.algorithm_class = algorithm_class
+        self.config = config
+        self._local = threading.local()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"algorithm_class": self.algorithm_class, "config": self.config}
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["algorithm_class"], state["config"])
+    
+    def algorithm(self) -> LoadingAlgorithm:
+        """Zwraca algorytm bieżącego wątku, tworząc go przy pierwszym użyciu."""
+        algorithm = getattr(self._local, "algorithm", None)
+        if algorithm is None:
+            algorithm = self.algorithm_class(self.config)
+            self._local.algorithm = algorithm
+        return algorithm
+
+
+def _run_batch_item(worker: _BatchWorker, index: int, pallets: PalletArray,
+                    time_budget_s: Optional[float]) -> Dict[str, Any]:
+    """
+    Planuje załadunek jednego manifestu algorytmem wątku (procesu) roboczego.
+    
+    Args:
+        worker: Algorytm wywołania `run_many` (z `create_context_executor`)
+        index: Indeks manifestu
+        pallets: Palety manifestu
+        time_budget_s: Budżet czasu w sekundach (None - bez limitu)
+        
+    Returns:
+        Dict[str, Any]: Wynik manifestu (jak w `LoadingAlgorithm.run_many`)
+    """
+    start_time = time.perf_counter()
+    
+    algorithm = worker.algorithm()
+    
+    try:
+        loaded_pallets = algorithm.run(pallets.to_pallets(), time_budget_s=time_budget_s)
+    except Exception as error:
+        return {"index": index, "time_s": time.perf_counter() - start_time, "error": str(error)}
+    
+    return {
+        "index": index,
+        "pallets": PalletArray.from_pallets(loaded_pallets),
+        "pallets_count": len(loaded_pallets),
+        "loading_meters": algorithm.trailer.get_loading_meters(),
+        "time_s": time.perf_counter() - start_time
+    }
@@ -0,0 +1,296 @@
+"""
+Moduł zawierający implementację algorytmu załadunku metodą przeszukiwania wiązkowego (beam search).
+"""
+
+from dataclasses import dataclass
+from typing import List, Dict, Any, Tuple, Optional, FrozenSet
+import logging
+import os
+import time
+
+from src.algorithms.base_algorithm import LoadingAlgorithm
+from src.data.pallet import Pallet
+from src.data.trailer import Trailer
+from src.config import ALGORITHM_DEFAULTS
+from src.utils.pallet_classes import class_indices, rotation_options
+from src.utils.parallel import create_context_executor
+
+# Konfiguracja loggera
+logger = logging.getLogger(__name__)
+
+# Ruch: (ocena dziecka, indeks palety, rotacja, pozycja)
+Move = Tuple[float, int, int, Tuple[int, int, int]]
+
+
+@dataclass
+class _BeamState:
+    """
+    Częściowy załadunek w wiązce.
+
+    Attributes:
+        trailer: Naczepa z paletami ustawionymi w tym stanie (własna kopia)
+        remaining: Indeksy palet, które można jeszcze załadować (w kolejności rozważania)
+        signature: Zbiór (klasa palety, pozycja, rotacja) - identyczne układy są scalane
+        score: Ocena stanu
+    """
+
+    trailer: Trailer
+    remaining: Tuple[int, ...]
+    signature: FrozenSet[Tuple[int, Tuple[int, int, int], int]]
+    score: float
+
+
+class BeamSearchLoading(LoadingAlgorithm):
+    """
+    Algorytm załadunku metodą przeszukiwania wiązkowego.
+
+    Zamiast jednego zachłannego załadunku algorytm utrzymuje `beam_width`
+    najlepszych częściowych załadunków. W każdym kroku każdy z nich jest
+    rozszerzany o jedną z `expansion_width` kolejnych palet (od największej
+    objętości, a gdy podstawy palet nie zmieszczą się na podłodze - od najmniejszej
+    podstawy), w każdej rotacji, ustawioną w pierwszej wolnej pozycji od przodu
+    i lewej ściany. Dzieci są oceniane metrykami `get_loading_efficiency`
+    (wypełnienie zajętej długości naczepy i balans boczny), a do następnego
+    kroku przechodzi `beam_width` najlepszych.
+
+    Palety równoważne (ten sam typ, rotacje i przedział masy - `group_pallets`)
+    są rozważane raz na stan, a sygnatury stanów używają klas zamiast palet,
+    więc permutacje identycznych palet nie zajmują miejsc w wiązce.
+
+    Dzieci jednego stanu są oceniane na jego naczepie przez punkt kontrolny
+    i cofnięcie, a tylko wybrane stany dostają kopię naczepy. Rozszerzanie
+    stanów wiązki odbywa się równolegle w puli procesów lub wątków.
+
+    Po przekroczeniu budżetu czasu przeszukiwanie jest przerywane, a wynikiem
+    jest najlepszy z dotychczasowych częściowych załadunków, uzupełniony zachłannie
+    pozostałymi paletami.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Inicjalizuje algorytm przeszukiwania wiązkowego.
+
+        Args:
+            config: Słownik konfiguracyjny algorytmu (opcjonalny)
+        """
+        # Domyślna konfiguracja
+        default_config = ALGORITHM_DEFAULTS.get("Beam_Search_Loading", {})
+
+        # Połączenie domyślnej konfiguracji z konfiguracją dostarczoną przez użytkownika
+        merged_config = {**default_config, **(config or {})}
+
+        super().__init__("Beam Search Loading", merged_config)
+
+    def load_pallets(self, pallets: List[Pallet]) -> List[Pallet]:
+        """
+        Przeprowadza załadunek palet metodą przeszukiwania wiązkowego.
+
+        Args:
+            pallets: Lista palet do załadunku
+
+        Returns:
+            List[Pallet]: Lista załadowanych palet z przypisanymi pozycjami
+        """
+        logger.info(f"Rozpoczynam załadunek {len(pallets)} palet metodą Beam_Search")
+
+        beam_width = self.config.get("beam_width", 16)
+        expansion_width = self.config.get("expansion_width", 4)
+        balance_weight = self.config.get("balance_weight", 0.5)
+        # Gdy podstawy palet nie zmieszczą się na podłodze, liczy się liczba załadowanych palet
+        floor_area = self.trailer.length * self.trailer.width
+        if sum(p.length * p.width for p in pallets) > floor_area:
+            ordered = self._sort_pallets_by_footprint(pallets, reverse=False)
+        else:
+            ordered = self._sort_pallets_by_volume(pallets)
+        classes = class_indices(ordered, self.config.get("weight_bucket_kg", 10))
+
+        time_budget = self._budget_within_run(self.config.get("time_budget_s"))
+        start_time = time.perf_counter()
+
+        self.trailer.reset()
+        beam = [_BeamState(self.trailer.copy(), tuple(range(len(ordered))), frozenset(), 0.0)]
+        finished: List[_BeamState] = []
+
+        workers = min(self.config.get("workers") or os.cpu_count() or 1, beam_width)
+        executor, expand = create_context_executor(
+            workers, self.config.get("executor", "process"), _expand_in_worker, (ordered, classes)
+        )
+        with executor:
+            while beam:
+                if time_budget is not None and time.perf_counter() - start_time > time_budget:
+                    # Po przekroczeniu budżetu najlepszy jest jeden z bieżących częściowych załadunków
+                    logger.info(f"Przekroczono budżet czasu, przerwano po {len(beam[0].trailer.loaded_pallets)} krokach")
+                    finished.extend(beam)
+                    break
+
+                expansions = list(executor.map(
+                    expand,
+                    [state.trailer for state in beam],
+                    [state.remaining for state in beam],
+                    [expansion_width] * len(beam),
+                    [balance_weight] * len(beam)
+                ))
+
+                children = []
+                for state, (moves, dropped) in zip(beam, expansions):
+                    remaining = tuple(i for i in state.remaining if i not in dropped)
+                    if not moves:
+                        # Żadna z pozostałych palet się nie mieści - załadunek zakończony
+                        finished.append(state)
+                    for move in moves:
+                        children.append((state, remaining, move))
+
+                beam = self._select_children(ordered, classes, children, beam_width)
+                if beam:
+                    leader = max(beam, key=_rank)
+                    self._report_progress(
+                        len(leader.trailer.loaded_pallets), leader.trailer.get_loading_meters(), score=leader.score
+                    )
+
+        best = max(finished, key=_rank)
+
+        # Przeniesienie najlepszego załadunku do naczepy algorytmu
+        loaded_pallets = []
+        for pallet in best.trailer.loaded_pallets:
+            if self.trailer.add_pallet(pallet):
+                loaded_pallets.append(pallet)
+
+        # Przerwany załadunek jest uzupełniany zachłannie pozostałymi paletami
+        for index in best.remaining:
+            pallet = ordered[index]
+            for rotation in rotation_options(pallet):
+                pallet.rotation = rotation
+                position = self.trailer.find_free_space_position(pallet)
+                if position is not None:
+                    pallet.set_position(*position)
+                    if self.trailer.add_pallet(pallet):
+                        loaded_pallets.append(pallet)
+                        break
+
+        logger.info(
+            f"Zakończono załadunek, załadowano {len(loaded_pallets)} palet, "
+            f"LDM: {self.trailer.get_loading_meters():.2f}"
+        )
+        return loaded_pallets
+
+    def _select_children(self, pallets: List[Pallet], classes: List[int],
+                         children: List[Tuple[_BeamState, Tuple[int, ...], Move]],
+                         beam_width: int) -> List[_BeamState]:
+        """
+        Wybiera `beam_width` najlepszych dzieci o różnych układach i tworzy dla nich stany.
+
+        Args:
+            pallets: Palety manifestu w kolejności rozważania
+            classes: Klasy równoważności palet
+            children: Trójki (stan rodzica, pozostałe palety rodzica, ruch)
+            beam_width: Szerokość wiązki
+
+        Returns:
+            List[_BeamState]: Stany następnego kroku
+        """
+        children.sort(key=lambda child: -child[2][0])
+
+        selected = []
+        seen = set()
+        for parent, remaining, (score, index, rotation, position) in children:
+            signature = parent.signature | {(classes[index], position, rotation)}
+            if signature in seen:
+                continue
+            seen.add(signature)
+
+            pallet = pallets[index].copy()
+            pallet.rotation = rotation
+            pallet.set_position(*position)
+            trailer = parent.trailer.copy()
+            trailer.add_pallet(pallet)
+
+            selected.append(_BeamState(trailer, tuple(i for i in remaining if i != index), signature, score))
+            if len(selected) == beam_width:
+                break
+        return selected
+
+
+def _rank(state: _BeamState) -> Tuple[int, float, float]:
+    """Zwraca klucz porównania stanów: liczba palet, potem mniejszy LDM, potem ocena."""
+    return len(state.trailer.loaded_pallets), -state.trailer.get_loading_meters(), state.score
+
+
+def _expand_in_worker(context: Tuple[List[Pallet], List[int]], trailer: Trailer, remaining: Tuple[int, ...],
+                      expansion_width: int, balance_weight: float) -> Tuple[List[Move], List[int]]:
+    """Rozszerza stan w puli; `context` to palety manifestu i ich klasy (z `create_context_executor`)."""
+    pallets, classes = context
+    return _expand_state(pallets, classes, trailer, remaining, expansion_width, balance_weight)
+
+
+def _expand_state(pallets: List[Pallet], classes: List[int], trailer: Trailer, remaining: Tuple[int, ...],
+                  expansion_width: int, balance_weight: float) -> Tuple[List[Move], List[int]]:
+    """
+    Wyznacza i ocenia ruchy dla `expansion_width` pierwszych pozostałych klas palet, które się mieszczą.
+
+    Każdy ruch jest oceniany na naczepie stanu: paleta jest dodawana po punkcie
+    kontrolnym, a po ocenie cofana. Z każdej klasy równoważności rozważana jest
+    tylko pierwsza pozostała paleta. Palety oryginalne nie są modyfikowane.
+
+    Args:
+        pallets: Palety manifestu
+        classes: Klasy równoważności palet
+        trailer: Naczepa stanu
+        remaining: Indeksy pozostałych palet
+        expansion_width: Liczba rozważanych palet
+        balance_weight: Waga kary za nierównowagę boczną w ocenie
+
+    Returns:
+        Tuple[List[Move], List[int]]: Ruchy oraz indeksy palet, które nigdzie się nie mieszczą
+            (miejsca w naczepie już nie przybędzie, więc można je pominąć w dalszych krokach)
+    """
+    moves: List[Move] = []
+    dropped: List[int] = []
+    candidates = 0
+    tried: Dict[int, bool] = {}
+    token = trailer.checkpoint()
+    for index in remaining:
+        if candidates == expansion_width:
+            break
+
+        # Paleta równoważna już rozważanej dałaby te same ruchy (i tak samo by się nie zmieściła)
+        if classes[index] in tried:
+            if not tried[classes[index]]:
+                dropped.append(index)
+            continue
+
+        pallet = pallets[index].copy()
+        fits = False
+        for rotation in rotation_options(pallet):
+            pallet.rotation = rotation
+            position = trailer.find_free_space_position(pallet)
+            if position is None:
+                continue
+            pallet.set_position(*position)
+            if not trailer.add_pallet(pallet):
+                continue
+            fits = True
+            moves.append((_score(trailer, balance_weight), index, rotation, position))
+            trailer.rollback(token)
+
+        tried[classes[index]] = fits
+        if fits:
+            candidates += 1
+        else:
+            dropped.append(index)
+    trailer.release(token)
+    return moves, dropped
+
+
+def _score(trailer: Trailer, balance_weight: float) -> float:
+    """
+    Ocenia częściowy załadunek na podstawie `get_loading_efficiency`.
+
+    Ocena to wypełnienie objętości zajętej części naczepy (do LDM) w procentach,
+    pomniejszone o karę za odchylenie balansu bocznego od 0.5.
+    """
+    efficiency = trailer.get_loading_efficiency()
+    ldm = trailer.get_loading_meters()
+    if ldm == 0:
+        return 0.0
+    fill = efficiency["space_utilization"] * trailer.length / (ldm * 1000)
+    return fill - balance_weight * 100 * abs(efficiency["weight_balance_side"] - 0.5)
@@ -0,0 +1,385 @@
+"""
+Moduł zawierający implementację algorytmu genetycznego doboru kolejności i rotacji palet.
+"""
+
+from typing import List, Dict, Any, Tuple, Optional
+import logging
+import math
+import os
+import random
+import time
+
+from src.algorithms.base_algorithm import LoadingAlgorithm
+from src.data.max_rects import MaxRects
+from src.data.pallet import Pallet
+from src.config import ALGORITHM_DEFAULTS, CONSTRAINTS
+from src.utils.pallet_classes import class_indices, rotation_options
+from src.utils.parallel import create_context_executor
+
+# Konfiguracja loggera
+logger = logging.getLogger(__name__)
+
+# Chromosom: (kolejność indeksów palet, bity obrotu palet wg indeksu)
+Chromosome = Tuple[Tuple[int, ...], Tuple[int, ...]]
+
+# Paleta w dekoderze: (długość, szerokość, wysokość, masa całkowita)
+PalletSpec = Tuple[int, int, int, float]
+
+# Ustawienie w dekoderze: (indeks palety, x, y, obrót)
+Placement = Tuple[int, int, int, int]
+
+
+class GeneticLoading(LoadingAlgorithm):
+    """
+    Algorytm genetyczny doboru kolejności i rotacji palet.
+
+    Algorytmy zachłanne różnią się głównie kolejnością, w jakiej podają palety
+    procedurze ustawiania. Tutaj kolejność i bity obrotu palet są ewoluowane:
+    chromosom jest dekodowany deterministycznie (każda paleta w pierwszej wolnej
+    pozycji od przodu i lewej ściany wg prostokątów maksymalnych, w drugiej
+    rotacji, jeśli w zadanej się nie mieści), a przystosowanie łączy liczbę
+    załadowanych palet, LDM i przekroczenia progów balansu masy liczonego tak
+    jak w `Trailer`.
+
+    Chromosomy są sprowadzane do postaci kanonicznej: palety równoważne (ten sam
+    typ, rotacje i przedział masy - `group_pallets`) występują w kolejności
+    indeksów, a palety kwadratowe nie mają bitu obrotu. Chromosomy różniące się
+    tylko permutacją identycznych palet są więc tym samym osobnikiem i są
+    oceniane raz.
+
+    Populacja każdego pokolenia jest oceniana w puli procesów. Ewolucja kończy
+    się po zadanej liczbie pokoleń lub po przekroczeniu budżetu czasu.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Inicjalizuje algorytm genetyczny.
+
+        Args:
+            config: Słownik konfiguracyjny algorytmu (opcjonalny)
+        """
+        # Domyślna konfiguracja
+        default_config = ALGORITHM_DEFAULTS.get("Genetic_Loading", {})
+
+        # Połączenie domyślnej konfiguracji z konfiguracją dostarczoną przez użytkownika
+        merged_config = {**default_config, **(config or {})}
+
+        super().__init__("Genetic Loading", merged_config)
+
+    def load_pallets(self, pallets: List[Pallet]) -> List[Pallet]:
+        """
+        Przeprowadza załadunek palet w kolejności i rotacjach wyznaczonych algorytmem genetycznym.
+
+        Args:
+            pallets: Lista palet do załadunku
+
+        Returns:
+            List[Pallet]: Lista załadowanych palet z przypisanymi pozycjami
+        """
+        logger.info(f"Rozpoczynam załadunek {len(pallets)} palet metodą Genetic")
+        if not pallets:
+            return []
+
+        start_time = time.perf_counter()
+        population_size = self.config.get("population_size", 40)
+        generations = self.config.get("generations", 60)
+        time_budget = self._budget_within_run(self.config.get("time_budget_s"))
+        elite_size = self.config.get("elite_size", 2)
+        rng = random.Random(self.config.get("seed"))
+
+        specs = [(p.length, p.width, p.height, p.total_weight) for p in pallets]
+        context = {
+            "specs": specs,
+            "trailer": (self.trailer.length, self.trailer.width, self.trailer.height, self.trailer.max_load),
+            "balance_weight": self.config.get("balance_weight", 1.0)
+        }
+
+        classes = class_indices(pallets, self.config.get("weight_bucket_kg", 10))
+        square = tuple(len(rotation_options(p)) == 1 for p in pallets)
+        population = [
+            _canonical(chromosome, classes, square)
+            for chromosome in self._initial_population(pallets, population_size, rng)
+        ]
+        # Przystosowanie ocenionych już chromosomów kanonicznych
+        known_fitness: Dict[Chromosome, float] = {}
+
+        workers = self.config.get("workers") or os.cpu_count() or 1
+        executor, evaluate = create_context_executor(
+            workers, self.config.get("executor", "process"), _evaluate_in_worker, context
+        )
+        with executor:
+            # Jedna paczka chromosomów na proces roboczy w każdym pokoleniu
+            chunk_size = max(1, math.ceil(population_size / workers))
+
+            def evaluate_all(chromosomes: List[Chromosome]) -> List[float]:
+                new = list(dict.fromkeys(c for c in chromosomes if c not in known_fitness))
+                known_fitness.update(zip(new, executor.map(evaluate, new, chunksize=chunk_size)))
+                return [known_fitness[c] for c in chromosomes]
+
+            fitness = evaluate_all(population)
+            best_fitness = self._report_best(population, fitness, context, -math.inf, 0)
+
+            for generation in range(generations):
+                if time_budget is not None and time.perf_counter() - start_time > time_budget:
+                    logger.info(f"Przekroczono budżet czasu po {generation} pokoleniach")
+                    break
+
+                # Elita przechodzi bez zmian, reszta populacji to potomstwo
+                ranking = sorted(range(len(population)), key=lambda i: -fitness[i])
+                next_population = [population[i] for i in ranking[:elite_size]]
+                next_fitness = [fitness[i] for i in ranking[:elite_size]]
+                offspring = [
+                    _canonical(self._breed(population, fitness, rng), classes, square)
+                    for _ in range(population_size - len(next_population))
+                ]
+                next_population.extend(offspring)
+                next_fitness.extend(evaluate_all(offspring))
+                population, fitness = next_population, next_fitness
+                best_fitness = self._report_best(population, fitness, context, best_fitness, generation + 1)
+
+        best = population[max(range(len(population)), key=lambda i: fitness[i])]
+        loaded_pallets = self._apply_chromosome(pallets, best)
+
+        logger.info(
+            f"Zakończono załadunek, załadowano {len(loaded_pallets)} palet, "
+            f"LDM: {self.trailer.get_loading_meters():.2f}, czas: {time.perf_counter() - start_time:.2f} s"
+        )
+        return loaded_pallets
+
+    def _report_best(self, population: List[Chromosome], fitness: List[float], context: Dict[str, Any],
+                     best_fitness: float, generation: int) -> float:
+        """
+        Przekazuje do funkcji `progress` najlepszego osobnika, jeśli jest lepszy od dotychczasowego.
+
+        Args:
+            population: Bieżąca populacja
+            fitness: Przystosowanie osobników populacji
+            context: Dane dekodera (palety, naczepa)
+            best_fitness: Przystosowanie dotychczasowego najlepszego osobnika
+            generation: Numer pokolenia
+
+        Returns:
+            float: Przystosowanie najlepszego osobnika po uwzględnieniu bieżącej populacji
+        """
+        best = max(range(len(population)), key=lambda i: fitness[i])
+        if fitness[best] <= best_fitness:
+            return best_fitness
+
+        specs = context["specs"]
+        placements = _decode(specs, context["trailer"], population[best])
+        ldm = max(
+            (x + (specs[index][1] if rotated else specs[index][0]) for index, x, _, rotated in placements),
+            default=0
+        )
+        self._report_progress(len(placements), ldm / 1000, fitness=fitness[best], generation=generation)
+        return fitness[best]
+
+    def _initial_population(self, pallets: List[Pallet], population_size: int, rng: random.Random) -> List[Chromosome]:
+        """
+        Tworzy populację początkową: kolejności heurystyczne (jak w algorytmach zachłannych) i losowe.
+
+        Args:
+            pallets: Palety do załadunku
+            population_size: Liczność populacji
+            rng: Generator liczb losowych
+
+        Returns:
+            List[Chromosome]: Populacja początkowa
+        """
+        indices = list(range(len(pallets)))
+        no_rotation = (0,) * len(pallets)
+        population = [
+            (tuple(sorted(indices, key=lambda i: -pallets[i].volume)), no_rotation),
+            (tuple(sorted(indices, key=lambda i: -pallets[i].total_weight)), no_rotation),
+            (tuple(sorted(indices, key=lambda i: pallets[i].length * pallets[i].width)), no_rotation)
+        ][:population_size]
+
+        while len(population) < population_size:
+            order = indices[:]
+            rng.shuffle(order)
+            population.append((tuple(order), tuple(rng.randint(0, 1) for _ in indices)))
+        return population
+
+    def _breed(self, population: List[Chromosome], fitness: List[float], rng: random.Random) -> Chromosome:
+        """
+        Tworzy potomka: selekcja turniejowa, krzyżowanie i mutacja.
+
+        Kolejność jest krzyżowana operatorem OX (fragment od pierwszego rodzica,
+        reszta w kolejności z drugiego), bity obrotu - równomiernie. Mutacja zamienia
+        dwie pozycje w kolejności i odwraca bity obrotu.
+
+        Args:
+            population: Bieżąca populacja
+            fitness: Przystosowanie osobników populacji
+            rng: Generator liczb losowych
+
+        Returns:
+            Chromosome: Potomek
+        """
+        tournament_size = self.config.get("tournament_size", 3)
+
+        def select() -> Chromosome:
+            contestants = rng.sample(range(len(population)), min(tournament_size, len(population)))
+            return population[max(contestants, key=lambda i: fitness[i])]
+
+        (order_a, rotations_a), (order_b, rotations_b) = select(), select()
+        size = len(order_a)
+
+        if size > 1 and rng.random() < self.config.get("crossover_rate", 0.9):
+            start, end = sorted(rng.sample(range(size + 1), 2))
+            segment = order_a[start:end]
+            in_segment = set(segment)
+            rest = [gene for gene in order_b if gene not in in_segment]
+            order = rest[:start] + list(segment) + rest[start:]
+            rotations = [a if rng.random() < 0.5 else b for a, b in zip(rotations_a, rotations_b)]
+        else:
+            order, rotations = list(order_a), list(rotations_a)
+
+        mutation_rate = self.config.get("mutation_rate", 0.2)
+        if size > 1 and rng.random() < mutation_rate:
+            i, j = rng.sample(range(size), 2)
+            order[i], order[j] = order[j], order[i]
+        for i in range(size):
+            if rng.random() < mutation_rate / size:
+                rotations[i] = 1 - rotations[i]
+
+        return tuple(order), tuple(rotations)
+
+    def _apply_chromosome(self, pallets: List[Pallet], chromosome: Chromosome) -> List[Pallet]:
+        """
+        Dekoduje chromosom i ustawia palety w naczepie algorytmu.
+
+        Args:
+            pallets: Palety do załadunku
+            chromosome: Kolejność i bity obrotu
+
+        Returns:
+            List[Pallet]: Lista załadowanych palet
+        """
+        specs = [(p.length, p.width, p.height, p.total_weight) for p in pallets]
+        trailer = (self.trailer.length, self.trailer.width, self.trailer.height, self.trailer.max_load)
+
+        loaded_pallets = []
+        for index, x, y, rotated in _decode(specs, trailer, chromosome):
+            pallet = pallets[index]
+            pallet.rotation = 90 if rotated else 0
+            pallet.set_position(x, y, 0)
+            if self.trailer.add_pallet(pallet):
+                loaded_pallets.append(pallet)
+            else:
+                logger.debug(f"Nie udało się załadować palety {pallet.pallet_id}")
+        return loaded_pallets
+
+
+def _canonical(chromosome: Chromosome, classes: List[int], square: Tuple[bool, ...]) -> Chromosome:
+    """
+    Sprowadza chromosom do postaci kanonicznej względem klas równoważności palet.
+
+    Kolejne wystąpienia palet danej klasy w kolejności chromosomu są zastępowane
+    paletami tej klasy w kolejności indeksów (bit obrotu przechodzi razem z miejscem
+    w kolejności), a bity obrotu palet kwadratowych są zerowane.
+
+    Args:
+        chromosome: Kolejność i bity obrotu
+        classes: Numer klasy równoważności każdej palety (`class_indices`)
+        square: Czy paleta ma tylko jedną rotację
+
+    Returns:
+        Chromosome: Chromosom kanoniczny
+    """
+    order, rotations = chromosome
+    members: Dict[int, List[int]] = {}
+    for index in sorted(order):
+        members.setdefault(classes[index], []).append(index)
+
+    taken: Dict[int, int] = {}
+    canonical_order = []
+    canonical_rotations = list(rotations)
+    for index in order:
+        number = taken.get(classes[index], 0)
+        taken[classes[index]] = number + 1
+        canonical = members[classes[index]][number]
+        canonical_order.append(canonical)
+        canonical_rotations[canonical] = 0 if square[index] else rotations[index]
+    return tuple(canonical_order), tuple(canonical_rotations)
+
+
+def _evaluate_in_worker(context: Dict[str, Any], chromosome: Chromosome) -> float:
+    """Dekoduje i ocenia chromosom; `context` to dane dekodera (z `create_context_executor`)."""
+    placements = _decode(context["specs"], context["trailer"], chromosome)
+    return _fitness(context["specs"], context["trailer"], placements, context["balance_weight"])
+
+
+def _decode(specs: List[PalletSpec], trailer: Tuple[int, int, int, float], chromosome: Chromosome) -> List[Placement]:
+    """
+    Deterministycznie dekoduje chromosom na ustawienia palet na podłodze.
+
+    Palety są ustawiane w kolejności chromosomu w pierwszej wolnej pozycji od
+    przodu i lewej ściany (prostokąty maksymalne). Zamiast pełnej naczepy używana
+    jest tylko struktura wolnej podłogi, bo prostokąty maksymalne z definicji nie
+    nachodzą na ustawione palety.
+
+    Args:
+        specs: Wymiary i masy palet
+        trailer: Wymiary naczepy i maksymalna masa ładunku
+        chromosome: Kolejność i bity obrotu
+
+    Returns:
+        List[Placement]: Ustawienia załadowanych palet
+    """
+    length, width, height, max_load = trailer
+    order, rotations = chromosome
+    free_floor = MaxRects(length, width)
+
+    placements = []
+    load = 0.0
+    for index in order:
+        pallet_length, pallet_width, pallet_height, weight = specs[index]
+        if pallet_height > height or load + weight > max_load:
+            continue
+
+        # Najpierw rotacja z chromosomu, potem druga
+        for rotated in (rotations[index], 1 - rotations[index]):
+            footprint = (pallet_width, pallet_length) if rotated else (pallet_length, pallet_width)
+            position = free_floor.find_position(*footprint)
+            if position is not None:
+                free_floor.place(*position, *footprint)
+                placements.append((index, position[0], position[1], rotated))
+                load += weight
+                break
+    return placements
+
+
+def _fitness(specs: List[PalletSpec], trailer: Tuple[int, int, int, float], placements: List[Placement],
+             balance_weight: float) -> float:
+    """
+    Ocenia zdekodowany załadunek (większa wartość jest lepsza).
+
+    Liczba załadowanych palet dominuje (każda jest warta dwie długości naczepy),
+    potem liczy się LDM i kara za przekroczenie progów balansu bok do boku
+    i przód-tył (środek palety po lewej/z przodu - jak w `Trailer`).
+    """
+    length, width, _, _ = trailer
+    if not placements:
+        return 0.0
+
+    ldm = 0
+    left = front = total = 0.0
+    for index, x, y, rotated in placements:
+        pallet_length, pallet_width, _, weight = specs[index]
+        if rotated:
+            pallet_length, pallet_width = pallet_width, pallet_length
+        ldm = max(ldm, x + pallet_length)
+        total += weight
+        if y + pallet_width / 2 < width / 2:
+            left += weight
+        if x + pallet_length / 2 < length / 2:
+            front += weight
+
+    threshold = CONSTRAINTS["weight_distribution_threshold"]
+    side_excess = max(0.0, abs((total - left) / total - 0.5) - threshold) if total else 0.0
+    front_back_excess = max(
+        0.0, abs(front / total - CONSTRAINTS["front_to_back_weight_distribution"]) - threshold
+    ) if total else 0.0
+
+    return len(placements) * 2 * length - ldm - balance_weight * length * (side_excess + front_back_excess)
@@ -0,0 +1,471 @@
+"""
+Moduł zawierający implementację algorytmu załadunku pasami wzdłużnymi z programowaniem dynamicznym.
+"""
+
+from typing import List, Dict, Any, Iterator, Tuple, Optional
+import logging
+import math
+
+from src.algorithms.base_algorithm import LoadingAlgorithm
+from src.data.pallet import Pallet
+from src.data.trailer import Trailer
+from src.config import ALGORITHM_DEFAULTS
+
+# Konfiguracja loggera
+logger = logging.getLogger(__name__)
+
+# Wzorzec poprzeczny: szerokości kolejnych pasów wzdłużnych (w mm)
+LanePattern = Tuple[int, ...]
+
+
+class LaneDPLoading(LoadingAlgorithm):
+    """
+    Algorytm załadunku podłogi naczepy pasami wzdłużnymi.
+
+    Szerokości wszystkich typów palet mieszczą się po kilka w poprzek naczepy,
+    więc załadunek podłogi sprowadza się do podziału szerokości naczepy na pasy
+    wzdłużne (wzorzec poprzeczny) i rozdzielenia palet między pasy tak, aby
+    najdłuższy pas (LDM) był jak najkrótszy.
+
+    Algorytm wylicza wzorce poprzeczne z szerokości palet (ustawionych wzdłuż lub
+    obróconych w poprzek, jeśli pas jest dość szeroki), a zawartość kolejnych pasów
+    wybiera programowaniem dynamicznym po długości naczepy (suma podzbioru na
+    bitach liczby całkowitej). Orientacja palety wynika z szerokości pasu. Wynik
+    jest poprawiany przenoszeniem palet z najdłuższego pasa.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Inicjalizuje algorytm załadunku pasami wzdłużnymi.
+
+        Args:
+            config: Słownik konfiguracyjny algorytmu (opcjonalny)
+        """
+        # Domyślna konfiguracja
+        default_config = ALGORITHM_DEFAULTS.get("Lane_DP_Loading", {})
+
+        # Połączenie domyślnej konfiguracji z konfiguracją dostarczoną przez użytkownika
+        merged_config = {**default_config, **(config or {})}
+
+        super().__init__("Lane DP Loading", merged_config)
+
+    def load_pallets(self, pallets: List[Pallet]) -> List[Pallet]:
+        """
+        Przeprowadza załadunek palet pasami wzdłużnymi (wszystkie palety na poziomie z=0).
+
+        Args:
+            pallets: Lista palet do załadunku
+
+        Returns:
+            List[Pallet]: Lista załadowanych palet z przypisanymi pozycjami
+        """
+        logger.info(f"Rozpoczynam załadunek {len(pallets)} palet metodą Lane_DP")
+
+        # Palety mieszczące się w naczepie, od najcięższej (cięższe trafiają bliżej przodu)
+        fitting = [
+            p for p in self._sort_pallets_by_weight(pallets)
+            if max(p.length, p.width) <= self.trailer.length
+            and min(p.length, p.width) <= self.trailer.width
+            and p.height <= self.trailer.height
+        ]
+        if not fitting:
+            return []
+
+        best_pattern, best_lanes, best_score = None, None, None
+        for pattern, lower_bound in self._lane_patterns(fitting):
+            # Wzorce są uporządkowane wg dolnego ograniczenia - dalsze nie mogą być lepsze
+            if best_score is not None and lower_bound >= best_score:
+                break
+
+            lanes, unplaced = self._pack_lanes(fitting, pattern)
+            score = (len(unplaced), max(_lane_length(lane, width) for lane, width in zip(lanes, pattern)))
+            if best_score is None or score < best_score:
+                best_pattern, best_lanes, best_score = pattern, lanes, score
+
+        if best_pattern is None:
+            logger.warning("Nie znaleziono żadnego wzorca pasów")
+            return []
+
+        loaded_pallets = self._place_lanes(best_pattern, best_lanes)
+
+        # Dogęszczenie układu pasów - zostaje, jeśli skraca załadunek
+        if self.config.get("compact", True) and loaded_pallets:
+            loaded_pallets = self._compact(loaded_pallets)
+
+        logger.info(
+            f"Zakończono załadunek, załadowano {len(loaded_pallets)} palet, "
+            f"wzorzec pasów: {best_pattern}, LDM: {self.trailer.get_loading_meters():.2f}"
+        )
+        return loaded_pallets
+
+    def _lane_patterns(self, pallets: List[Pallet]) -> List[Tuple[LanePattern, Tuple[int, float]]]:
+        """
+        Wylicza wzorce poprzeczne - podziały szerokości naczepy na pasy.
+
+        Szerokością pasa może być krótszy bok palety (paleta wzdłuż) lub dłuższy
+        (paleta obrócona w poprzek). Rozważane są tylko wzorce maksymalne, do których
+        nie da się dodać kolejnego pasa.
+
+        Args:
+            pallets: Palety do załadunku
+
+        Returns:
+            List: Pary (wzorzec, dolne ograniczenie oceny) rosnąco wg ograniczenia
+        """
+        widths = sorted(
+            {min(p.length, p.width) for p in pallets} |
+            {max(p.length, p.width) for p in pallets if max(p.length, p.width) <= self.trailer.width}
+        )
+        max_lanes = min(self.config.get("max_lanes", 6), self.trailer.width // widths[0])
+
+        footprints = _footprint_counts(pallets)
+        patterns = [
+            (pattern, self._lower_bound(footprints, pattern))
+            for pattern in _maximal_patterns(widths, self.trailer.width, max_lanes)
+            if pattern
+        ]
+
+        patterns.sort(key=lambda item: item[1])
+        return patterns
+
+    def _lower_bound(self, footprints: Dict[Tuple[int, int], int], pattern: LanePattern) -> Tuple[int, float]:
+        """
+        Dolne ograniczenie oceny wzorca: palety bez pasującego pasa oraz średnia długość pasa.
+
+        Każda paleta jest liczona z najmniejszą głębokością, jaką może mieć w którymkolwiek pasie.
+
+        Args:
+            footprints: Liczby palet wg podstawy (krótszy bok, dłuższy bok)
+            pattern: Szerokości pasów
+        """
+        unplaceable = 0
+        total_depth = 0
+        longest = 0
+        for (short_side, long_side), count in footprints.items():
+            depths = [_footprint_depth(short_side, long_side, width) for width in pattern]
+            depths = [depth for depth in depths if depth is not None]
+            if not depths:
+                unplaceable += count
+                continue
+            depth = min(depths)
+            total_depth += depth * count
+            longest = max(longest, depth)
+
+        average_length = total_depth / len(pattern)
+        if average_length > self.trailer.length:
+            # Palety nie mieszczą się w pasach nawet przy idealnym podziale
+            unplaceable = max(unplaceable, 1)
+        return unplaceable, max(longest, average_length)
+
+    def _pack_lanes(self, pallets: List[Pallet], pattern: LanePattern) -> Tuple[List[List[Pallet]], List[Pallet]]:
+        """
+        Rozdziela palety między pasy wzorca.
+
+        Pasy są wypełniane od najwęższego (najmniej palet może do niego trafić)
+        podzbiorem o największej łącznej głębokości nieprzekraczającej progu. Jeśli
+        wszystkie palety mieszczą się w naczepie, najmniejszy próg, przy którym
+        wszystkie palety zostaną rozdzielone, jest wyszukiwany binarnie wśród
+        osiągalnych sum głębokości (od dolnego ograniczenia), a wynik jest
+        poprawiany przenoszeniem palet z najdłuższego pasa.
+
+        Args:
+            pallets: Palety do rozdzielenia
+            pattern: Szerokości pasów (rosnąco)
+
+        Returns:
+            Tuple[List[List[Pallet]], List[Pallet]]: Pasy w kolejności wzorca i palety, które się nie zmieściły
+        """
+        capacity = self.trailer.length
+        depths = _lane_depths(pallets, pattern)
+
+        # Przy braku miejsca na wszystkie palety - maksymalne wypełnienie kolejnych pasów
+        lanes, unplaced = _fill_lanes(pallets, pattern, capacity, depths)
+        if unplaced:
+            return lanes, unplaced
+
+        # Najdłuższy pas ma długość równą pewnej sumie głębokości palet w tym pasie
+        reachable = 0
+        for lane_depths in depths.values():
+            reachable |= _subset_sums([d for d in lane_depths if d is not None], capacity)
+
+        lower_bound = math.ceil(self._lower_bound(_footprint_counts(pallets), pattern)[1])
+        current_length = max(_lane_length(lane, width) for lane, width in zip(lanes, pattern))
+        bits = bin(reachable)[:1:-1]
+        targets = [t for t in range(lower_bound, min(current_length, len(bits))) if bits[t] == "1"]
+
+        # Wyszukiwanie binarne najmniejszego progu, przy którym wszystkie palety mieszczą się w pasach
+        low, high = 0, len(targets)
+        while low < high:
+            middle = (low + high) // 2
+            balanced_lanes, balanced_unplaced = _fill_lanes(pallets, pattern, targets[middle], depths)
+            if balanced_unplaced:
+                low = middle + 1
+            else:
+                lanes = balanced_lanes
+                high = middle
+
+        return _improve_lanes(lanes, pattern), []
+
+    def _place_lanes(self, pattern: LanePattern, lanes: List[List[Pallet]]) -> List[Pallet]:
+        """
+        Ustawia palety w pasach i dodaje je do naczepy.
+
+        Wolna szerokość jest rozdzielana równo między pasy, a najcięższe pasy trafiają
+        na przemian pod lewą i prawą ścianę, co równoważy rozkład masy na boki.
+        W każdym pasie cięższe palety stoją bliżej przodu naczepy.
+
+        Args:
+            pattern: Szerokości pasów
+            lanes: Palety w kolejnych pasach
+
+        Returns:
+            List[Pallet]: Lista załadowanych palet
+        """
+        # Kolejność pasów w poprzek naczepy: najcięższe na zewnątrz, na przemian lewa/prawa
+        by_weight = sorted(range(len(lanes)), key=lambda i: -sum(p.total_weight for p in lanes[i]))
+        order = [None] * len(lanes)
+        left, right = 0, len(lanes) - 1
+        for rank, lane_idx in enumerate(by_weight):
+            if rank % 2 == 0:
+                order[left] = lane_idx
+                left += 1
+            else:
+                order[right] = lane_idx
+                right -= 1
+
+        gap = (self.trailer.width - sum(pattern)) / (len(pattern) - 1) if len(pattern) > 1 else 0
+        loaded_pallets = []
+        lane_y = 0.0
+        for lane_idx in order:
+            width = pattern[lane_idx]
+            x = 0
+            for pallet in sorted(lanes[lane_idx], key=lambda p: -p.total_weight):
+                # Obrót w poprzek, jeśli pas jest dość szeroki, w przeciwnym razie paleta wzdłuż
+                if max(pallet.length, pallet.width) <= width:
+                    pallet.rotation = 90 if pallet.length >= pallet.width else 0
+                else:
+                    pallet.rotation = 0 if pallet.length >= pallet.width else 90
+
+                # Paleta wyśrodkowana w swoim pasie
+                y = int(lane_y) + (width - pallet.dimensions[1]) // 2
+                pallet.set_position(x, y, 0)
+                x += pallet.dimensions[0]
+
+                if self.trailer.add_pallet(pallet):
+                    loaded_pallets.append(pallet)
+                else:
+                    logger.debug(f"Nie udało się załadować palety {pallet.pallet_id} w pasie o szerokości {width}")
+            lane_y += width + gap
+
+        return loaded_pallets
+
+    def _compact(self, loaded_pallets: List[Pallet]) -> List[Pallet]:
+        """
+        Dogęszcza układ pasów: palety (w orientacji z planu) są kolejno dosuwane do przodu i lewej ściany.
+
+        Granice pasów przestają obowiązywać, więc paleta może wejść w wolne miejsce
+        obok krótszego sąsiedniego pasa. Palety są ustawiane w pomocniczej naczepie
+        w kolejności od przodu układu pasów; wynik zastępuje układ pasów tylko wtedy,
+        gdy mieści co najmniej tyle samo palet na krótszej długości.
+
+        Args:
+            loaded_pallets: Palety ustawione w pasach i załadowane do naczepy
+
+        Returns:
+            List[Pallet]: Lista załadowanych palet (z układu pasów lub dogęszczonego)
+        """
+        lanes_layout = [(p, p.position) for p in loaded_pallets]
+        lanes_score = (-len(loaded_pallets), self.trailer.get_loading_meters())
+
+        scratch = Trailer(self.trailer.length, self.trailer.width, self.trailer.height, self.trailer.max_load)
+        compacted_pallets = []
+        for pallet in sorted(loaded_pallets, key=lambda p: (p.position[0], p.position[1])):
+            # Pozycja najbliżej przodu i lewej ściany (wolne prostokąty maksymalne)
+            position = scratch.find_free_space_position(pallet)
+            if position is None:
+                continue
+            pallet.set_position(*position)
+            if scratch.add_pallet(pallet):
+                compacted_pallets.append(pallet)
+
+        if (-len(compacted_pallets), scratch.get_loading_meters()) < lanes_score:
+            # Przeniesienie dogęszczonego układu do naczepy algorytmu
+            self.trailer.reset()
+            for pallet in compacted_pallets:
+                self.trailer.add_pallet(pallet)
+            return compacted_pallets
+
+        # Przywrócenie pozycji z układu pasów (palety pozostają w naczepie algorytmu)
+        for pallet, position in lanes_layout:
+            pallet.set_position(*position)
+        return loaded_pallets
+
+
+def _maximal_patterns(widths: List[int], free_width: int, max_lanes: int,
+                      start: int = 0, prefix: LanePattern = ()) -> Iterator[LanePattern]:
+    """
+    Generuje wzorce maksymalne: niemalejące ciągi szerokości pasów (z listy `widths`,
+    posortowanej rosnąco), po których zostaje mniej wolnej szerokości niż najwęższy pas
+    albo które osiągnęły limit `max_lanes` pasów.
+
+    Args:
+        widths: Dostępne szerokości pasów (rosnąco)
+        free_width: Szerokość naczepy pozostała po pasach z `prefix`
+        max_lanes: Maksymalna liczba pasów we wzorcu
+        start: Indeks najmniejszej szerokości, którą można dodać (ciągi niemalejące)
+        prefix: Dotychczas wybrane szerokości pasów
+    """
+    if free_width < widths[0] or len(prefix) >= max_lanes:
+        yield prefix
+        return
+    for i in range(start, len(widths)):
+        if widths[i] > free_width:
+            break
+        yield from _maximal_patterns(widths, free_width - widths[i], max_lanes, i, prefix + (widths[i],))
+
+
+def _footprint_counts(pallets: List[Pallet]) -> Dict[Tuple[int, int], int]:
+    """Zlicza palety wg podstawy (krótszy bok, dłuższy bok)."""
+    counts: Dict[Tuple[int, int], int] = {}
+    for pallet in pallets:
+        key = (min(pallet.length, pallet.width), max(pallet.length, pallet.width))
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def _depth_in_lane(pallet: Pallet, lane_width: int) -> Optional[int]:
+    """Zwraca długość zajmowaną przez paletę w pasie o podanej szerokości (None, jeśli się nie mieści)."""
+    return _footprint_depth(min(pallet.length, pallet.width), max(pallet.length, pallet.width), lane_width)
+
+
+def _footprint_depth(short_side: int, long_side: int, lane_width: int) -> Optional[int]:
+    """Zwraca długość zajmowaną przez podstawę w pasie o podanej szerokości (None, jeśli się nie mieści)."""
+    if long_side <= lane_width:
+        return short_side
+    if short_side <= lane_width:
+        return long_side
+    return None
+
+
+def _lane_length(lane: List[Pallet], lane_width: int) -> int:
+    """Zwraca łączną długość palet w pasie."""
+    return sum(_depth_in_lane(p, lane_width) for p in lane)
+
+
+def _subset_sums(lengths: List[int], capacity: int) -> int:
+    """Zwraca osiągalne sumy podzbiorów długości (nie większe niż `capacity`) jako bity liczby całkowitej."""
+    mask = (1 << (capacity + 1)) - 1
+    reachable = 1
+    for length in lengths:
+        reachable |= (reachable << length) & mask
+    return reachable
+
+
+def _best_subset(lengths: List[int], capacity: int) -> List[int]:
+    """
+    Wybiera podzbiór długości o największej sumie nieprzekraczającej `capacity`.
+
+    Programowanie dynamiczne po długości: osiągalne sumy po rozważeniu kolejnych
+    elementów są przechowywane jako bity liczby całkowitej, a wybór jest
+    odtwarzany od końca.
+
+    Returns:
+        List[int]: Indeksy wybranych elementów (rosnąco)
+    """
+    mask = (1 << (capacity + 1)) - 1
+    history = [1]
+    for length in lengths:
+        history.append(history[-1] | ((history[-1] << length) & mask))
+
+    total = history[-1].bit_length() - 1
+    chosen = []
+    for i in range(len(lengths), 0, -1):
+        if not (history[i - 1] >> total) & 1:
+            total -= lengths[i - 1]
+            chosen.append(i - 1)
+    return chosen[::-1]
+
+
+def _fill_lanes(pallets: List[Pallet], pattern: LanePattern, capacity: int,
+                depths: Optional[Dict[int, List[Optional[int]]]] = None) -> Tuple[List[List[Pallet]], List[Pallet]]:
+    """
+    Wypełnia kolejne pasy (od najwęższego) podzbiorami o największej łącznej głębokości nieprzekraczającej `capacity`.
+
+    Args:
+        pallets: Palety do rozdzielenia
+        pattern: Szerokości pasów
+        capacity: Maksymalna długość pasa w mm
+        depths: Głębokości palet dla każdej szerokości pasa (wyliczane, jeśli nie podano)
+    """
+    if depths is None:
+        depths = _lane_depths(pallets, pattern)
+
+    remaining = list(range(len(pallets)))
+    lanes: List[List[Pallet]] = [[] for _ in pattern]
+    for lane_idx in sorted(range(len(pattern)), key=lambda i: pattern[i]):
+        lane_depths = depths[pattern[lane_idx]]
+        eligible = [i for i in remaining if lane_depths[i] is not None]
+        chosen = {eligible[i] for i in _best_subset([lane_depths[i] for i in eligible], capacity)}
+        lanes[lane_idx] = [pallets[i] for i in eligible if i in chosen]
+        remaining = [i for i in remaining if i not in chosen]
+    return lanes, [pallets[i] for i in remaining]
+
+
+def _lane_depths(pallets: List[Pallet], pattern: LanePattern) -> Dict[int, List[Optional[int]]]:
+    """Zwraca głębokości palet (lub None) dla każdej szerokości pasa występującej we wzorcu."""
+    return {width: [_depth_in_lane(p, width) for p in pallets] for width in set(pattern)}
+
+
+def _improve_lanes(lanes: List[List[Pallet]], pattern: LanePattern) -> List[List[Pallet]]:
+    """
+    Skraca najdłuższy pas, przenosząc z niego palety do innych pasów lub zamieniając je parami.
+
+    Ruch jest wykonywany tylko wtedy, gdy oba zmienione pasy są po nim krótsze
+    od dotychczasowego najdłuższego pasa.
+    """
+    lanes = [list(lane) for lane in lanes]
+    lengths = [_lane_length(lane, width) for lane, width in zip(lanes, pattern)]
+
+    improved = True
+    while improved:
+        improved = False
+        longest = max(range(len(lanes)), key=lambda i: lengths[i])
+        limit = lengths[longest]
+
+        for pallet in list(lanes[longest]):
+            depth = _depth_in_lane(pallet, pattern[longest])
+            for other in range(len(lanes)):
+                other_depth = _depth_in_lane(pallet, pattern[other])
+                if other == longest or other_depth is None:
+                    continue
+
+                # Przeniesienie palety do innego pasa
+                if lengths[other] + other_depth < limit:
+                    lanes[longest].remove(pallet)
+                    lanes[other].append(pallet)
+                    lengths[longest] -= depth
+                    lengths[other] += other_depth
+                    improved = True
+                    break
+
+                # Zamiana z krótszą paletą z innego pasa
+                for swapped in lanes[other]:
+                    swapped_depth = _depth_in_lane(swapped, pattern[longest])
+                    if swapped_depth is None:
+                        continue
+                    new_longest = lengths[longest] - depth + swapped_depth
+                    new_other = lengths[other] - _depth_in_lane(swapped, pattern[other]) + other_depth
+                    if new_longest < limit and new_other < limit:
+                        lanes[longest].remove(pallet)
+                        lanes[other].remove(swapped)
+                        lanes[longest].append(swapped)
+                        lanes[other].append(pallet)
+                        lengths[longest], lengths[other] = new_longest, new_other
+                        improved = True
+                        break
+                if improved:
+                    break
+            if improved:
+                break
+
+    return lanes
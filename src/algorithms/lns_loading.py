@@ -0,0 +1,190 @@
+"""
+Moduł zawierający implementację algorytmu załadunku metodą przeszukiwania dużego sąsiedztwa (LNS).
+"""
+
+from typing import List, Dict, Any, Tuple, Optional
+import logging
+import math
+import random
+import time
+
+from src.algorithms.base_algorithm import LoadingAlgorithm
+from src.data.pallet import Pallet
+from src.config import ALGORITHM_DEFAULTS
+from src.utils.pallet_classes import rotation_options
+
+# Konfiguracja loggera
+logger = logging.getLogger(__name__)
+
+
+class LNSLoading(LoadingAlgorithm):
+    """
+    Algorytm załadunku metodą przeszukiwania dużego sąsiedztwa (destroy-and-repair).
+
+    Po zachłannym załadunku początkowym algorytm w każdej iteracji usuwa z naczepy
+    (`Trailer.remove_pallet`) fragment załadunku - wszystkie palety z losowego
+    zakresu osi X albo losowy podzbiór palet - i ponownie ustawia je razem
+    z paletami niezaładowanymi szybką naprawą zachłanną (pierwsza wolna pozycja
+    wg prostokątów maksymalnych, rotacja kończąca się bliżej przodu naczepy).
+    Zmiana jest zachowywana, gdy nie pogarsza liczby załadowanych palet ani LDM,
+    w przeciwnym razie jest cofana punktem kontrolnym naczepy.
+
+    Przeszukiwanie kończy się po zadanej liczbie iteracji lub po przekroczeniu
+    budżetu czasu. Kolejne poprawy są zapisywane w `improvement_curve`
+    i przekazywane do funkcji `progress` z `run`.
+
+    Attributes:
+        improvement_curve: Lista (czas w s, liczba załadowanych palet, LDM) kolejnych popraw
+            ostatniego uruchomienia
+    """
+
+    DESTROY_METHODS = ("x_range", "random")
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Inicjalizuje algorytm przeszukiwania dużego sąsiedztwa.
+
+        Args:
+            config: Słownik konfiguracyjny algorytmu (opcjonalny)
+        """
+        # Domyślna konfiguracja
+        default_config = ALGORITHM_DEFAULTS.get("LNS_Loading", {})
+
+        # Połączenie domyślnej konfiguracji z konfiguracją dostarczoną przez użytkownika
+        merged_config = {**default_config, **(config or {})}
+
+        super().__init__("LNS Loading", merged_config)
+        self.improvement_curve: List[Tuple[float, int, float]] = []
+        self._small_first = False
+
+    def load_pallets(self, pallets: List[Pallet]) -> List[Pallet]:
+        """
+        Przeprowadza załadunek palet metodą przeszukiwania dużego sąsiedztwa.
+
+        Args:
+            pallets: Lista palet do załadunku
+
+        Returns:
+            List[Pallet]: Lista załadowanych palet z przypisanymi pozycjami
+        """
+        logger.info(f"Rozpoczynam załadunek {len(pallets)} palet metodą LNS")
+
+        start_time = time.perf_counter()
+        max_iterations = self.config.get("max_iterations", 5000)
+        time_budget = self._budget_within_run(self.config.get("time_budget_s"))
+        rng = random.Random(self.config.get("seed"))
+
+        # Gdy podstawy palet nie zmieszczą się na podłodze, liczy się liczba załadowanych palet,
+        # więc naprawa zaczyna od najmniejszych podstaw
+        floor_area = self.trailer.length * self.trailer.width
+        self._small_first = sum(p.length * p.width for p in pallets) > floor_area
+
+        # Załadunek początkowy
+        self._repair(self._perturbed_order(pallets, rng, noise=0.0))
+        best_count, best_ldm = len(self.trailer.loaded_pallets), self.trailer.get_loading_meters()
+        self.improvement_curve = [(time.perf_counter() - start_time, best_count, best_ldm)]
+        self._report_progress(best_count, best_ldm)
+
+        for iteration in range(max_iterations):
+            if time_budget is not None and time.perf_counter() - start_time > time_budget:
+                logger.info(f"Przekroczono budżet czasu po {iteration} iteracjach")
+                break
+
+            token = self.trailer.checkpoint()
+            removed = self._destroy(rng)
+            placed_ids = {id(p) for p in self.trailer.loaded_pallets + removed}
+            unloaded = [p for p in pallets if id(p) not in placed_ids]
+            self._repair(self._perturbed_order(removed + unloaded, rng))
+
+            count, ldm = len(self.trailer.loaded_pallets), self.trailer.get_loading_meters()
+            if count > best_count or (count == best_count and ldm <= best_ldm):
+                if count > best_count or ldm < best_ldm:
+                    best_count, best_ldm = count, ldm
+                    self.improvement_curve.append((time.perf_counter() - start_time, count, ldm))
+                    self._report_progress(count, ldm, iteration=iteration)
+            else:
+                self.trailer.rollback(token)
+            self.trailer.release(token)
+
+        loaded_pallets = list(self.trailer.loaded_pallets)
+        logger.info(
+            f"Zakończono załadunek, załadowano {len(loaded_pallets)} palet, "
+            f"LDM: {self.trailer.get_loading_meters():.2f}, popraw: {len(self.improvement_curve) - 1}, "
+            f"czas: {time.perf_counter() - start_time:.2f} s"
+        )
+        return loaded_pallets
+
+    def _destroy(self, rng: random.Random) -> List[Pallet]:
+        """
+        Usuwa z naczepy fragment załadunku.
+
+        Args:
+            rng: Generator liczb losowych
+
+        Returns:
+            List[Pallet]: Usunięte palety
+        """
+        loaded = self.trailer.loaded_pallets
+        if not loaded:
+            return []
+
+        destroy_fraction = self.config.get("destroy_fraction", 0.2)
+        if rng.choice(self.DESTROY_METHODS) == "x_range":
+            # Wszystkie palety zachodzące na losowy zakres osi X zajętej części naczepy
+            used_length = self.trailer.get_loading_meters() * 1000
+            window = max(destroy_fraction * used_length, 1)
+            x_start = rng.uniform(0, max(used_length - window, 0))
+            removed = [
+                p for p in loaded
+                if p.position[0] < x_start + window and x_start < p.position[0] + p.dimensions[0]
+            ]
+        else:
+            removed = rng.sample(loaded, max(1, math.ceil(destroy_fraction * len(loaded))))
+
+        for pallet in removed:
+            self.trailer.remove_pallet(pallet.pallet_id)
+        return removed
+
+    def _repair(self, pallets: List[Pallet]) -> None:
+        """
+        Ustawia palety w naczepie zachłannie, w podanej kolejności.
+
+        Każda paleta trafia do pierwszej wolnej pozycji od przodu i lewej ściany,
+        w rotacji, w której kończy się bliżej przodu naczepy.
+
+        Args:
+            pallets: Palety do ustawienia
+        """
+        for pallet in pallets:
+            best = None
+            for rotation in rotation_options(pallet):
+                pallet.rotation = rotation
+                position = self.trailer.find_free_space_position(pallet)
+                if position is None:
+                    continue
+                key = (position[0] + pallet.dimensions[0], position[1])
+                if best is None or key < best[0]:
+                    best = (key, rotation, position)
+
+            if best is not None:
+                _, pallet.rotation, position = best
+                pallet.set_position(*position)
+                self.trailer.add_pallet(pallet)
+
+    def _perturbed_order(self, pallets: List[Pallet], rng: random.Random,
+                         noise: Optional[float] = None) -> List[Pallet]:
+        """
+        Zwraca palety od największej (lub najmniejszej) podstawy, z losowym zaburzeniem kolejności.
+
+        Args:
+            pallets: Palety do uporządkowania
+            rng: Generator liczb losowych
+            noise: Względne zaburzenie pola podstawy (domyślnie z konfiguracji)
+
+        Returns:
+            List[Pallet]: Palety w kolejności naprawy
+        """
+        if noise is None:
+            noise = self.config.get("order_noise", 3.0)
+        sign = 1 if self._small_first else -1
+        return sorted(pallets, key=lambda p: sign * p.length * p.width * (1 + noise * rng.random()))
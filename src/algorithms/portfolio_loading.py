@@ -0,0 +1,202 @@
+"""
+Moduł zawierający portfel algorytmów załadunku uruchamianych równolegle na tym samym manifeście.
+"""
+
+from concurrent.futures import as_completed
+from typing import List, Dict, Any, Tuple, Optional, Callable
+import logging
+import os
+import time
+
+from src.algorithms.base_algorithm import LoadingAlgorithm, LoadingPlan
+from src.data.pallet import Pallet
+from src.config import ALGORITHM_DEFAULTS
+from src.utils.parallel import create_context_executor
+
+# Konfiguracja loggera
+logger = logging.getLogger(__name__)
+
+# Funkcje celu portfela: wynik algorytmu -> klucz porównania (większy jest lepszy)
+OBJECTIVES: Dict[str, Callable[[Dict[str, Any]], Tuple]] = {
+    # Najwięcej palet, potem najmniejszy LDM
+    "pallets_then_ldm": lambda result: (result["pallets_count"], -result["loading_meters"]),
+    # Największe wykorzystanie przestrzeni naczepy
+    "space_utilization": lambda result: (result["space_utilization"], -result["loading_meters"]),
+    # Poprawny rozkład masy, potem najwięcej palet i najmniejszy LDM
+    "balanced": lambda result: (
+        result["weight_distribution_valid"], result["pallets_count"], -result["loading_meters"]
+    )
+}
+
+
+class PortfolioLoading(LoadingAlgorithm):
+    """
+    Portfel algorytmów załadunku.
+
+    Uruchamia wszystkie zarejestrowane algorytmy (albo podzbiór z konfiguracji)
+    na tym samym manifeście w puli procesów i wybiera najlepszy plan według
+    funkcji celu ("objective": nazwa z `OBJECTIVES` albo funkcja wyniku).
+    Czas odpowiedzi jest więc bliski czasowi najwolniejszego algorytmu,
+    a nie sumie czasów.
+
+    Algorytmy w portfelu dostają domyślnie "workers": 1, bo równoległość
+    zapewnia już sam portfel. Błąd jednego algorytmu nie przerywa pozostałych -
+    jest zapisywany w jego wyniku.
+
+    Budżet czasu jest wspólnym terminem całego portfela: algorytm czekający na
+    wolny proces dostaje tylko czas pozostały do terminu, a algorytm, dla którego
+    czasu nie starczyło, nie jest uruchamiany (wynik z błędem).
+
+    Attributes:
+        results: Wyniki ostatniego uruchomienia wg nazwy algorytmu (czas, liczba palet, LDM,
+            wykorzystanie przestrzeni, poprawność rozkładu masy, ocena lub błąd)
+        best_algorithm: Nazwa algorytmu, którego plan wybrano
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Inicjalizuje portfel algorytmów.
+
+        Args:
+            config: Słownik konfiguracyjny (opcjonalny)
+
+        Raises:
+            ValueError: Gdy nazwa funkcji celu jest nieznana
+        """
+        # Domyślna konfiguracja
+        default_config = ALGORITHM_DEFAULTS.get("Portfolio_Loading", {})
+
+        # Połączenie domyślnej konfiguracji z konfiguracją dostarczoną przez użytkownika
+        merged_config = {**default_config, **(config or {})}
+
+        objective = merged_config.get("objective", "pallets_then_ldm")
+        if not callable(objective) and objective not in OBJECTIVES:
+            raise ValueError(
+                f"Nieznana funkcja celu: {objective}. Dostępne: {', '.join(OBJECTIVES.keys())}"
+            )
+
+        super().__init__("Portfolio Loading", merged_config)
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.best_algorithm: Optional[str] = None
+
+    def load_pallets(self, pallets: List[Pallet]) -> List[Pallet]:
+        """
+        Uruchamia algorytmy portfela i ładuje plan najlepszego z nich.
+
+        Args:
+            pallets: Lista palet do załadunku
+
+        Returns:
+            List[Pallet]: Lista załadowanych palet z przypisanymi pozycjami
+        """
+        names = self._algorithm_names()
+        logger.info(f"Rozpoczynam załadunek {len(pallets)} palet portfelem algorytmów: {', '.join(names)}")
+
+        objective = self.config.get("objective", "pallets_then_ldm")
+        score = objective if callable(objective) else OBJECTIVES[objective]
+        algorithm_configs = self.config.get("algorithm_configs") or {}
+
+        self.results = {}
+        self.best_algorithm = None
+        plans: Dict[str, LoadingPlan] = {}
+
+        workers = min(self.config.get("workers") or os.cpu_count() or 1, len(names))
+        executor, run_algorithm = create_context_executor(
+            workers, self.config.get("executor", "process"), _run_in_worker, pallets
+        )
+        # Wspólny termin wszystkich algorytmów (czas zegarowy - porównywalny między procesami).
+        # Algorytmy czekające w kolejce puli dostają tylko czas pozostały do terminu.
+        time_budget = self._budget_within_run(self.config.get("time_budget_s"))
+        deadline = None if time_budget is None else time.time() + time_budget
+        with executor:
+            futures = {
+                executor.submit(run_algorithm, name, {"workers": 1, **algorithm_configs.get(name, {})}, deadline): name
+                for name in names
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                plan, result = future.result()
+                self.results[name] = result
+                if plan is None:
+                    logger.warning(f"Algorytm {name} zakończył się błędem: {result['error']}")
+                    continue
+
+                result["score"] = score(result)
+                plans[name] = plan
+                if self.best_algorithm is None or result["score"] > self.results[self.best_algorithm]["score"]:
+                    self.best_algorithm = name
+                    self._report_progress(result["pallets_count"], result["loading_meters"], candidate=name)
+
+        if self.best_algorithm is None:
+            logger.warning("Żaden algorytm portfela nie zwrócił planu")
+            return []
+
+        # Odtworzenie najlepszego planu w naczepie portfela
+        loaded_pallets = []
+        best_plan = plans[self.best_algorithm]
+        for pallet in pallets:
+            if pallet.pallet_id in best_plan:
+                pallet.position, pallet.rotation = best_plan[pallet.pallet_id]
+                if self.trailer.add_pallet(pallet):
+                    loaded_pallets.append(pallet)
+
+        logger.info(
+            f"Zakończono załadunek, najlepszy algorytm: {self.best_algorithm}, "
+            f"załadowano {len(loaded_pallets)} palet, LDM: {self.trailer.get_loading_meters():.2f}"
+        )
+        return loaded_pallets
+
+    def _algorithm_names(self) -> List[str]:
+        """
+        Zwraca nazwy algorytmów portfela: podane w konfiguracji albo wszystkie zarejestrowane (poza wykluczonymi).
+
+        Returns:
+            List[str]: Nazwy algorytmów (jak w `get_algorithm`)
+        """
+        # Import lokalny - fabryka algorytmów importuje ten moduł
+        from src.algorithms.algorithm_factory import list_available_algorithms
+
+        names = self.config.get("algorithms")
+        if names is None:
+            excluded = set(self.config.get("exclude") or [])
+            names = [name for name in list_available_algorithms() if name not in excluded]
+        return [name for name in names if name != "Portfolio_Loading"]
+
+
+def _run_in_worker(pallets: List[Pallet], name: str, config: Dict[str, Any],
+                   deadline: Optional[float]) -> Tuple[Optional[LoadingPlan], Dict[str, Any]]:
+    """
+    Uruchamia algorytm na paletach manifestu z budżetem czasu pozostałym do terminu.
+
+    Args:
+        pallets: Palety manifestu (z `create_context_executor`)
+        name: Nazwa algorytmu (jak w `get_algorithm`)
+        config: Konfiguracja algorytmu
+        deadline: Termin zakończenia jako znacznik `time.time()` (None - bez limitu)
+
+    Returns:
+        Tuple[Optional[LoadingPlan], Dict[str, Any]]: Plan (None w razie błędu lub
+            gdy termin minął przed uruchomieniem) i wynik algorytmu
+    """
+    # Import lokalny - fabryka algorytmów importuje ten moduł
+    from src.algorithms.algorithm_factory import get_algorithm
+
+    start_time = time.perf_counter()
+    time_budget_s = None if deadline is None else deadline - time.time()
+    if time_budget_s is not None and time_budget_s <= 0:
+        return None, {"time_s": 0.0, "error": "Nie uruchomiono - termin portfela minął w kolejce"}
+
+    try:
+        algorithm = get_algorithm(name, config)
+        algorithm.run(pallets, time_budget_s=time_budget_s)
+    except Exception as error:
+        return None, {"time_s": time.perf_counter() - start_time, "error": str(error)}
+
+    statistics = algorithm.get_statistics()
+    return algorithm.plan, {
+        "time_s": time.perf_counter() - start_time,
+        "pallets_count": statistics["pallets_count"],
+        "loading_meters": algorithm.trailer.get_loading_meters(),
+        "space_utilization": statistics["efficiency"]["space_utilization"],
+        "weight_distribution_valid": bool(statistics["weight_distribution_valid"]["overall_valid"])
+    }
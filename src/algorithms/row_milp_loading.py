@@ -0,0 +1,483 @@
+"""
+Moduł zawierający implementację algorytmu załadunku rzędami poprzecznymi wybieranymi programowaniem całkowitoliczbowym (MILP).
+"""
+
+from typing import List, Dict, Any, Tuple, Optional
+import logging
+import time
+
+import numpy as np
+from scipy.optimize import milp, LinearConstraint, Bounds
+
+from src.algorithms.base_algorithm import LoadingAlgorithm
+from src.data.pallet import Pallet
+from src.config import ALGORITHM_DEFAULTS, CONSTRAINTS
+
+# Konfiguracja loggera
+logger = logging.getLogger(__name__)
+
+# Podstawa palety: (krótszy bok, dłuższy bok)
+Footprint = Tuple[int, int]
+
+# Gniazdo rzędu: (indeks podstawy, obrót w poprzek, liczba palet jedna za drugą)
+Slot = Tuple[int, bool, int]
+
+
+class RowMILPLoading(LoadingAlgorithm):
+    """
+    Algorytm załadunku podłogi naczepy rzędami poprzecznymi.
+
+    Rząd to zestaw gniazd ustawionych obok siebie w poprzek naczepy. Gniazdo
+    mieści palety o jednej podstawie, w jednej orientacji, ustawione jedna za
+    drugą, a długość rzędu wyznacza jego najgłębsze gniazdo. Algorytm wylicza
+    wzorce rzędów z podstaw palet w manifeście i rozwiązuje zadanie pokrycia
+    manifestu wzorcami o minimalnej łącznej długości (LDM) jako zadanie MILP
+    (`scipy.optimize.milp`, HiGHS) z limitem czasu. Palety, które nie mieszczą
+    się w naczepie, są dopuszczane z karą większą niż długość naczepy.
+
+    Opcjonalnie (klucz konfiguracji "front_back_balance") rzędy są dzielone na
+    sekcję przednią i tylną tak, aby udział masy z przodu mieścił się w progu
+    `CONSTRAINTS["weight_distribution_threshold"]` wokół
+    `CONSTRAINTS["front_to_back_weight_distribution"]`.
+
+    Attributes:
+        solution_info: Informacje o ostatnim rozwiązaniu (status, wartość celu,
+            ograniczenie dolne, względna luka optymalności, czas, liczba wzorców)
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Inicjalizuje algorytm załadunku rzędami poprzecznymi.
+
+        Args:
+            config: Słownik konfiguracyjny algorytmu (opcjonalny)
+        """
+        # Domyślna konfiguracja
+        default_config = ALGORITHM_DEFAULTS.get("Row_MILP_Loading", {})
+
+        # Połączenie domyślnej konfiguracji z konfiguracją dostarczoną przez użytkownika
+        merged_config = {**default_config, **(config or {})}
+
+        super().__init__("Row MILP Loading", merged_config)
+        self.solution_info: Dict[str, Any] = {}
+
+    def load_pallets(self, pallets: List[Pallet]) -> List[Pallet]:
+        """
+        Przeprowadza załadunek palet rzędami poprzecznymi (wszystkie palety na poziomie z=0).
+
+        Args:
+            pallets: Lista palet do załadunku
+
+        Returns:
+            List[Pallet]: Lista załadowanych palet z przypisanymi pozycjami
+        """
+        logger.info(f"Rozpoczynam załadunek {len(pallets)} palet metodą Row_MILP")
+        start_time = time.perf_counter()
+
+        # Palety mieszczące się w naczepie, pogrupowane wg podstawy (od najcięższej)
+        groups: Dict[Footprint, List[Pallet]] = {}
+        for pallet in self._sort_pallets_by_weight(pallets):
+            short_side, long_side = sorted((pallet.length, pallet.width))
+            if long_side <= self.trailer.length and short_side <= self.trailer.width and pallet.height <= self.trailer.height:
+                groups.setdefault((short_side, long_side), []).append(pallet)
+        if not groups:
+            self.solution_info = {}
+            return []
+
+        footprints = list(groups)
+        counts = np.array([len(groups[footprint]) for footprint in footprints])
+        patterns = self._row_patterns(footprints, counts)
+
+        solution = None
+        if self.config.get("front_back_balance", False):
+            solution = self._solve_balanced(footprints, counts, groups, patterns)
+            if solution is None:
+                logger.warning("Brak rozwiązania z ograniczeniem rozkładu masy przód-tył, rozwiązuję bez niego")
+        if solution is None:
+            solution = self._solve(counts, patterns)
+        if solution is None:
+            logger.warning("Solver MILP nie znalazł rozwiązania w limicie czasu")
+            self.solution_info["time_s"] = time.perf_counter() - start_time
+            return []
+
+        front_rows, back_rows, back_start, section_counts = solution
+        loaded_pallets = self._place_rows(footprints, groups, patterns, front_rows, back_rows, back_start, section_counts)
+
+        self.solution_info["patterns"] = len(patterns)
+        self.solution_info["time_s"] = time.perf_counter() - start_time
+        logger.info(
+            f"Zakończono załadunek, załadowano {len(loaded_pallets)} palet, "
+            f"LDM: {self.trailer.get_loading_meters():.2f}, status: {self.solution_info['status']}, "
+            f"luka optymalności: {self.solution_info['gap']:.2%}"
+        )
+        return loaded_pallets
+
+    def _row_patterns(self, footprints: List[Footprint], counts: np.ndarray) -> List[Tuple[int, np.ndarray, List[Slot]]]:
+        """
+        Wylicza wzorce rzędów poprzecznych.
+
+        Dla każdej głębokości rzędu (głębokość palety w jednej z orientacji)
+        rozważane są gniazda z paletami nie głębszymi od rzędu, wypełnione tyloma
+        paletami jedna za drugą, ile się zmieści. Zostają wzorce maksymalne (nie da
+        się dodać gniazda) i niezdominowane: żaden inny wzorzec nie mieści co
+        najmniej tylu palet każdej podstawy przy nie większej długości.
+
+        Args:
+            footprints: Podstawy palet
+            counts: Liczby palet każdej podstawy
+
+        Returns:
+            List: Wzorce (długość rzędu, liczby palet wg podstawy, gniazda)
+        """
+        trailer_width = self.trailer.width
+        max_slots = self.config.get("max_row_slots", 6)
+
+        # Orientacje: wzdłuż (szerokość gniazda = krótszy bok) lub w poprzek (dłuższy bok)
+        options = []
+        for index, (short_side, long_side) in enumerate(footprints):
+            options.append((short_side, long_side, index, False))
+            if long_side <= trailer_width:
+                options.append((long_side, short_side, index, True))
+
+        patterns: Dict[Tuple[int, ...], Tuple[int, List[Slot]]] = {}
+        for row_depth in sorted({depth for _, depth, _, _ in options}):
+            items = sorted(
+                (width, index, across, min(row_depth // depth, int(counts[index])), depth)
+                for width, depth, index, across in options if depth <= row_depth
+            )
+            for chosen in _maximal_slot_sets(items, trailer_width, max_slots):
+                row_counts = [0] * len(footprints)
+                for _, index, _, stacked, _ in chosen:
+                    row_counts[index] += stacked
+                length = max(stacked * depth for _, _, _, stacked, depth in chosen)
+                key = tuple(row_counts)
+                if key not in patterns or length < patterns[key][0]:
+                    patterns[key] = (length, [(index, across, stacked) for _, index, across, stacked, _ in chosen])
+
+        # Usunięcie wzorców zdominowanych
+        keys = list(patterns)
+        matrix = np.array(keys)
+        lengths = np.array([patterns[key][0] for key in keys])
+        result = []
+        for i, key in enumerate(keys):
+            covers = np.all(matrix >= matrix[i], axis=1) & (lengths <= lengths[i])
+            dominated = covers & (np.any(matrix > matrix[i], axis=1) | (lengths < lengths[i]))
+            if not dominated.any():
+                result.append((int(lengths[i]), matrix[i], patterns[key][1]))
+        return result
+
+    def _solve(self, counts: np.ndarray, patterns: List[Tuple[int, np.ndarray, List[Slot]]]):
+        """
+        Rozwiązuje zadanie pokrycia manifestu rzędami o minimalnej łącznej długości.
+
+        Zmienne: liczby rzędów każdego wzorca oraz liczby niezaładowanych palet
+        każdej podstawy. Niezaładowana paleta kosztuje więcej niż cała długość
+        naczepy, więc w pierwszej kolejności maksymalizowana jest liczba palet.
+
+        Returns:
+            Krotka (rzędy z przodu, rzędy z tyłu, początek sekcji tylnej, liczby palet
+            z przodu i z tyłu wg podstawy lub None, gdy sekcje nie są rozróżniane)
+            lub None, jeśli solver nie znalazł rozwiązania
+        """
+        n_patterns, n_types = len(patterns), len(counts)
+        lengths = np.array([length for length, _, _ in patterns], dtype=float)
+        coverage = np.array([row_counts for _, row_counts, _ in patterns], dtype=float).T
+        penalty = self.trailer.length + 1
+
+        # Zmienne: [rzędy wzorców (P), niezaładowane palety (T)]
+        cost = np.concatenate((lengths, np.full(n_types, penalty)))
+        constraints = [
+            # Pokrycie: miejsca w rzędach + niezaładowane >= liczba palet
+            LinearConstraint(np.hstack((coverage, np.eye(n_types))), counts, np.inf),
+            # Łączna długość rzędów nie większa niż długość naczepy
+            LinearConstraint(np.concatenate((lengths, np.zeros(n_types)))[np.newaxis], 0, self.trailer.length)
+        ]
+        upper = np.concatenate((np.full(n_patterns, self.trailer.length // lengths.min()), counts))
+
+        x = self._run_milp(cost, constraints, Bounds(0, upper))
+        if x is None:
+            return None
+        rows = np.round(x[:n_patterns]).astype(int)
+        return rows, np.zeros(n_patterns, dtype=int), 0, None
+
+    def _solve_balanced(self, footprints: List[Footprint], counts: np.ndarray, groups: Dict[Footprint, List[Pallet]],
+                        patterns: List[Tuple[int, np.ndarray, List[Slot]]]):
+        """
+        Rozwiązuje zadanie pokrycia z ograniczeniem udziału masy w przedniej połowie naczepy.
+
+        Rzędy sekcji przedniej kończą się przed połową naczepy, więc ich środki leżą
+        z przodu. Sekcja tylna zaczyna się w `back_start` nie wcześniej niż koniec
+        sekcji przedniej i na tyle daleko, że środek najkrótszego rzędu leży za
+        połową naczepy. Masa palety jest przybliżana średnią masą jej podstawy.
+
+        Returns:
+            Krotka jak w `_solve` lub None, jeśli zadanie jest niewykonalne lub solver nie znalazł rozwiązania
+        """
+        n_patterns, n_types = len(patterns), len(counts)
+        lengths = np.array([length for length, _, _ in patterns], dtype=float)
+        coverage = np.array([row_counts for _, row_counts, _ in patterns], dtype=float).T
+        mean_weights = np.array([np.mean([p.total_weight for p in groups[footprint]]) for footprint in footprints])
+        target = CONSTRAINTS["front_to_back_weight_distribution"]
+        threshold = CONSTRAINTS["weight_distribution_threshold"]
+        half_length = self.trailer.length / 2
+        penalty = self.trailer.length + 1
+
+        # Zmienne: [rzędy z przodu (P), rzędy z tyłu (P), palety z przodu (T), palety z tyłu (T),
+        #           niezaładowane (T), początek sekcji tylnej, czy sekcja tylna jest użyta]
+        size = 2 * n_patterns + 3 * n_types + 2
+        front_rows = slice(0, n_patterns)
+        back_rows = slice(n_patterns, 2 * n_patterns)
+        front_count = slice(2 * n_patterns, 2 * n_patterns + n_types)
+        back_count = slice(2 * n_patterns + n_types, 2 * n_patterns + 2 * n_types)
+        unplaced = slice(2 * n_patterns + 2 * n_types, 2 * n_patterns + 3 * n_types)
+        back_start, back_used = size - 2, size - 1
+
+        cost = np.zeros(size)
+        cost[back_rows] = lengths
+        cost[unplaced] = penalty
+        cost[back_start] = 1
+
+        rows = []
+        lower = []
+        upper = []
+
+        def add(coefficients: List[Tuple[Any, Any]], low: float, high: float) -> None:
+            row = np.zeros(size)
+            for index, value in coefficients:
+                row[index] = value
+            rows.append(row)
+            lower.append(low)
+            upper.append(high)
+
+        for t in range(n_types):
+            # Palety z przodu/tyłu mieszczą się w gniazdach swojej sekcji
+            add([(front_rows, -coverage[t]), (front_count.start + t, 1)], -np.inf, 0)
+            add([(back_rows, -coverage[t]), (back_count.start + t, 1)], -np.inf, 0)
+            # Każda paleta jest z przodu, z tyłu albo niezaładowana
+            add([(front_count.start + t, 1), (back_count.start + t, 1), (unplaced.start + t, 1)], counts[t], counts[t])
+
+        # Sekcja przednia kończy się przed połową naczepy
+        add([(front_rows, lengths)], 0, half_length)
+        # Sekcja tylna zaczyna się za przednią i za połową naczepy (środek najkrótszego rzędu)
+        add([(back_start, 1), (front_rows, -lengths)], 0, np.inf)
+        add([(back_start, 1), (back_used, -(half_length - lengths.min() / 2))], 0, np.inf)
+        # Sekcja tylna mieści się w naczepie i jest pusta, jeśli nie jest użyta
+        add([(back_start, 1), (back_rows, lengths)], -np.inf, self.trailer.length)
+        add([(back_rows, lengths), (back_used, -self.trailer.length)], -np.inf, 0)
+
+        # Udział masy z przodu w przedziale target +/- threshold
+        add([(front_count, mean_weights * (1 - target + threshold)), (back_count, -mean_weights * (target - threshold))],
+            0, np.inf)
+        add([(front_count, mean_weights * (1 - target - threshold)), (back_count, -mean_weights * (target + threshold))],
+            -np.inf, 0)
+
+        max_rows = self.trailer.length // lengths.min()
+        upper_bounds = np.concatenate((
+            np.full(2 * n_patterns, max_rows), counts, counts, counts, [self.trailer.length, 1]
+        ))
+        integrality = np.ones(size)
+        integrality[back_start] = 0
+
+        x = self._run_milp(cost, [LinearConstraint(np.array(rows), lower, upper)], Bounds(0, upper_bounds), integrality)
+        if x is None:
+            return None
+        return (np.round(x[front_rows]).astype(int), np.round(x[back_rows]).astype(int),
+                int(np.ceil(x[back_start] - 1e-6)),
+                (np.round(x[front_count]).astype(int), np.round(x[back_count]).astype(int)))
+
+    def _run_milp(self, cost: np.ndarray, constraints: List[LinearConstraint], bounds: Bounds,
+                  integrality: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """
+        Uruchamia solver MILP z limitem czasu i zapisuje informacje o rozwiązaniu w `solution_info`.
+
+        Returns:
+            Optional[np.ndarray]: Wartości zmiennych lub None, jeśli solver nie znalazł rozwiązania
+        """
+        # Limit solvera nie może przekroczyć czasu pozostałego z budżetu `run`
+        time_limit = self._budget_within_run(self.config.get("time_limit", 1.0))
+        result = milp(
+            c=cost,
+            constraints=constraints,
+            integrality=np.ones_like(cost) if integrality is None else integrality,
+            bounds=bounds,
+            options={} if time_limit is None else {"time_limit": time_limit}
+        )
+        gap = result.mip_gap if result.mip_gap is not None else (0.0 if result.status == 0 else float("nan"))
+        self.solution_info = {
+            "status": result.message,
+            "optimal": result.status == 0,
+            "objective": result.fun,
+            "bound": result.mip_dual_bound,
+            "gap": gap
+        }
+        return result.x
+
+    def _place_rows(self, footprints: List[Footprint], groups: Dict[Footprint, List[Pallet]],
+                    patterns: List[Tuple[int, np.ndarray, List[Slot]]], front_rows: np.ndarray,
+                    back_rows: np.ndarray, back_start: int,
+                    section_counts: Optional[Tuple[np.ndarray, np.ndarray]]) -> List[Pallet]:
+        """
+        Ustawia palety w rzędach rozwiązania i dodaje je do naczepy.
+
+        Rzędy są układane od przodu naczepy, dłuższe najpierw. Cięższe palety trafiają
+        do wcześniejszych rzędów, a w rzędzie cięższe gniazdo stoi przy ścianie
+        strony, która jest dotąd lżejsza. Nadmiarowe gniazda pozostają puste.
+        Przy podziale na sekcje palety każdej podstawy są rozdzielane między sekcje
+        równomiernie wg masy (jak w przybliżeniu w modelu), a następnie zamieniane
+        tak, aby udział masy z przodu był jak najbliższy wartości docelowej.
+
+        Returns:
+            List[Pallet]: Lista załadowanych palet
+        """
+        # Palety przydzielone do sekcji przedniej i tylnej
+        front_queues: List[List[Pallet]] = []
+        back_queues: List[List[Pallet]] = []
+        for index, footprint in enumerate(footprints):
+            group = groups[footprint]
+            if section_counts is None:
+                front_queues.append(list(group))
+                back_queues.append([])
+            else:
+                front, rest = _split_evenly(group, int(section_counts[0][index]))
+                back, _ = _split_evenly(rest, int(section_counts[1][index]))
+                front_queues.append(front)
+                back_queues.append(back)
+        if section_counts is not None:
+            _balance_sections(front_queues, back_queues, CONSTRAINTS["front_to_back_weight_distribution"])
+
+        loaded_pallets = []
+        side_weights = [0.0, 0.0]
+        sections = ((front_rows, 0, front_queues), (back_rows, back_start, back_queues))
+        for rows, section_start, queues in sections:
+            x = section_start
+            order = sorted(range(len(patterns)), key=lambda i: -patterns[i][0])
+            for pattern_idx in order:
+                length, _, slots = patterns[pattern_idx]
+                for _ in range(rows[pattern_idx]):
+                    loaded_pallets.extend(self._place_row(x, slots, footprints, queues, side_weights))
+                    x += length
+
+        return loaded_pallets
+
+    def _place_row(self, x: int, slots: List[Slot], footprints: List[Footprint],
+                   queues: List[List[Pallet]], side_weights: List[float]) -> List[Pallet]:
+        """
+        Ustawia jeden rząd: wypełnia gniazda paletami z kolejek i rozkłada gniazda w poprzek naczepy.
+
+        Args:
+            x: Początek rzędu wzdłuż naczepy
+            slots: Gniazda rzędu
+            footprints: Podstawy palet
+            queues: Palety do ustawienia wg podstawy (pobierane od początku)
+            side_weights: Masy dotychczas ustawione po lewej i prawej stronie (aktualizowane)
+
+        Returns:
+            List[Pallet]: Palety ustawione w rzędzie i dodane do naczepy
+        """
+        filled = []
+        for index, across, stacked in slots:
+            short_side, long_side = footprints[index]
+            content = queues[index][:stacked]
+            del queues[index][:stacked]
+            filled.append((long_side if across else short_side, across, content))
+
+        # Od najcięższego gniazda: przy ścianie lżejszej strony, kolejne coraz bliżej środka
+        filled.sort(key=lambda slot: -sum(p.total_weight for p in slot[2]))
+        gap = (self.trailer.width - sum(width for width, _, _ in filled)) / max(len(filled) - 1, 1)
+        left_y, right_y = 0.0, float(self.trailer.width)
+
+        placed = []
+        for width, across, content in filled:
+            if not content:
+                continue
+            weight = sum(p.total_weight for p in content)
+            if side_weights[0] <= side_weights[1]:
+                y = int(left_y)
+                left_y += width + gap
+                side_weights[0] += weight
+            else:
+                y = int(right_y) - width
+                right_y -= width + gap
+                side_weights[1] += weight
+
+            pallet_x = x
+            for pallet in content:
+                # Obrót w poprzek albo ustawienie wzdłuż naczepy (dłuższy bok wzdłuż osi X)
+                long_along_x = pallet.length >= pallet.width
+                pallet.rotation = (90 if long_along_x else 0) if across else (0 if long_along_x else 90)
+                pallet.set_position(pallet_x, y, 0)
+                pallet_x += pallet.dimensions[0]
+                if self.trailer.add_pallet(pallet):
+                    placed.append(pallet)
+                else:
+                    logger.debug(f"Nie udało się załadować palety {pallet.pallet_id} w rzędzie x={x}")
+        return placed
+
+
+def _maximal_slot_sets(items: List[Tuple], free_width: int, max_slots: int,
+                       start: int = 0, prefix: Tuple = ()):
+    """
+    Generuje maksymalne zestawy gniazd: niemalejące ciągi elementów listy `items`
+    (posortowanej rosnąco wg szerokości gniazda), po których zostaje mniej wolnej
+    szerokości niż najwęższe gniazdo.
+
+    Args:
+        items: Gniazda (szerokość, podstawa, obrót, liczba palet, głębokość palety)
+        free_width: Szerokość naczepy pozostała po gniazdach z `prefix`
+        max_slots: Maksymalna liczba gniazd w rzędzie
+        start: Indeks najmniejszego elementu, który można dodać
+        prefix: Dotychczas wybrane gniazda
+    """
+    if free_width < items[0][0] or len(prefix) == max_slots:
+        if prefix:
+            yield prefix
+        return
+    for i in range(start, len(items)):
+        if items[i][0] > free_width:
+            break
+        yield from _maximal_slot_sets(items, free_width - items[i][0], max_slots, i, prefix + (items[i],))
+
+
+def _split_evenly(pallets: List[Pallet], count: int) -> Tuple[List[Pallet], List[Pallet]]:
+    """
+    Dzieli palety (posortowane wg masy) na `count` wybranych i pozostałe, rozkładając wybór równomiernie.
+
+    Średnia masa obu części jest wtedy zbliżona do średniej całej grupy, zgodnie z przybliżeniem w modelu MILP.
+    """
+    # Indeksy środków `count` równych przedziałów listy
+    indices = {int((j + 0.5) * len(pallets) / count) for j in range(count)} if count else set()
+    chosen = [pallet for i, pallet in enumerate(pallets) if i in indices]
+    rest = [pallet for i, pallet in enumerate(pallets) if i not in indices]
+    return chosen, rest
+
+
+def _balance_sections(front_queues: List[List[Pallet]], back_queues: List[List[Pallet]], target: float) -> None:
+    """
+    Zamienia palety o tej samej podstawie między sekcją przednią a tylną, przybliżając udział masy z przodu do `target`.
+
+    Model MILP zna tylko średnie masy podstaw, a masy ładunków w grupie mogą się
+    znacznie różnić. Zamiany nie zmieniają liczby palet w gniazdach rzędów.
+    Wykonywana jest kolejno najlepsza zamiana, dopóki poprawia wynik.
+    """
+    front_weight = sum(p.total_weight for queue in front_queues for p in queue)
+    total_weight = front_weight + sum(p.total_weight for queue in back_queues for p in queue)
+    if total_weight == 0:
+        return
+
+    while True:
+        best_error, best_swap = abs(front_weight / total_weight - target), None
+        for t, (front, back) in enumerate(zip(front_queues, back_queues)):
+            for i, front_pallet in enumerate(front):
+                for j, back_pallet in enumerate(back):
+                    shifted = front_weight - front_pallet.total_weight + back_pallet.total_weight
+                    error = abs(shifted / total_weight - target)
+                    if error < best_error - 1e-9:
+                        best_error, best_swap = error, (t, i, j, shifted)
+        if best_swap is None:
+            break
+        t, i, j, front_weight = best_swap
+        front_queues[t][i], back_queues[t][j] = back_queues[t][j], front_queues[t][i]
+
+    # Cięższe palety w każdej sekcji nadal trafiają do wcześniejszych rzędów
+    for queue in front_queues + back_queues:
+        queue.sort(key=lambda p: -p.total_weight)
@@ -0,0 +1,200 @@
+"""
+Moduł zawierający poprawianie gotowego planu załadunku metodą symulowanego wyżarzania.
+"""
+
+from typing import List, Dict, Any, Tuple, Optional, Callable
+import logging
+import math
+import random
+import time
+
+from src.data.pallet import Pallet
+from src.data.trailer import Trailer
+from src.config import ALGORITHM_DEFAULTS, CONSTRAINTS
+
+# Konfiguracja loggera
+logger = logging.getLogger(__name__)
+
+
+class SimulatedAnnealingImprover:
+    """
+    Poprawianie planu załadunku metodą symulowanego wyżarzania.
+
+    Działa na naczepie załadowanej przez dowolny algorytm (`LoadingAlgorithm.run`)
+    i przestawia palety stojące na podłodze, na których nic nie stoi. Ruchy:
+        - "move": przeniesienie palety (w bieżącej lub drugiej rotacji) do jednego
+          z pierwszych wolnych punktów narożnych,
+        - "swap": zamiana miejscami dwóch palet,
+        - "rotate": obrót palety w miejscu.
+
+    Ruch jest wykonywany na naczepie po punkcie kontrolnym i cofany, jeśli jest
+    niewykonalny lub odrzucony. Koszt (LDM w mm i kara za przekroczenie progów
+    balansu masy) jest liczony z wielkości, które naczepa utrzymuje przyrostowo
+    przy `add_pallet`/`remove_pallet` (krawędzie palet, rozkład masy), więc ocena
+    ruchu nie przelicza metryk całego załadunku.
+
+    Attributes:
+        config: Konfiguracja (klucze jak w `ALGORITHM_DEFAULTS["Simulated_Annealing"]`)
+        stats: Statystyki ostatniego przebiegu (iteracje, przyjęte ruchy, koszt początkowy i końcowy)
+    """
+
+    MOVES = ("move", "swap", "rotate")
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Inicjalizuje poprawianie planu.
+
+        Args:
+            config: Słownik konfiguracyjny (opcjonalny)
+        """
+        default_config = ALGORITHM_DEFAULTS.get("Simulated_Annealing", {})
+        self.config = {**default_config, **(config or {})}
+        self.stats: Dict[str, Any] = {}
+
+    def improve(self, trailer: Trailer, time_budget_s: Optional[float] = None,
+                progress: Optional[Callable[[Trailer], None]] = None) -> List[Pallet]:
+        """
+        Poprawia załadunek naczepy w miejscu.
+
+        Args:
+            trailer: Załadowana naczepa
+            time_budget_s: Budżet czasu w sekundach (domyślnie z konfiguracji)
+            progress: Funkcja wywoływana z naczepą po znalezieniu lepszego ułożenia (opcjonalna)
+
+        Returns:
+            List[Pallet]: Lista załadowanych palet (te same obiekty, z nowymi pozycjami)
+        """
+        start_time = time.perf_counter()
+        iterations = self.config.get("iterations", 3000)
+        if time_budget_s is None:
+            time_budget_s = self.config.get("time_budget_s")
+        initial_temperature = self.config.get("initial_temperature", 300.0)
+        final_temperature = self.config.get("final_temperature", 1.0)
+        rng = random.Random(self.config.get("seed"))
+
+        movable = self._movable_pallets(trailer)
+        current_cost = self._cost(trailer)
+        best_cost, best_layout = current_cost, self._layout(trailer)
+        self.stats = {"iterations": 0, "accepted": 0, "initial_cost": current_cost}
+
+        if len(movable) > 0:
+            for iteration in range(iterations):
+                if time_budget_s is not None and time.perf_counter() - start_time > time_budget_s:
+                    break
+
+                # Chłodzenie geometryczne od temperatury początkowej do końcowej
+                temperature = initial_temperature * (final_temperature / initial_temperature) ** (iteration / iterations)
+
+                token = trailer.checkpoint()
+                if self._apply_random_move(trailer, movable, rng):
+                    delta = self._cost(trailer) - current_cost
+                    if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+                        current_cost += delta
+                        self.stats["accepted"] += 1
+                        if current_cost < best_cost:
+                            best_cost, best_layout = current_cost, self._layout(trailer)
+                            if progress is not None:
+                                progress(trailer)
+                        trailer.release(token)
+                        self.stats["iterations"] = iteration + 1
+                        continue
+                trailer.rollback(token)
+                trailer.release(token)
+                self.stats["iterations"] = iteration + 1
+
+        if current_cost > best_cost:
+            self._restore_layout(trailer, best_layout)
+        self.stats["final_cost"] = best_cost
+        self.stats["time_s"] = time.perf_counter() - start_time
+
+        logger.info(
+            f"Wyżarzanie: koszt {self.stats['initial_cost']:.0f} -> {best_cost:.0f}, "
+            f"iteracje: {self.stats['iterations']}, przyjęte ruchy: {self.stats['accepted']}"
+        )
+        return trailer.loaded_pallets
+
+    def _apply_random_move(self, trailer: Trailer, movable: List[Pallet], rng: random.Random) -> bool:
+        """
+        Wykonuje losowy ruch na naczepie (po punkcie kontrolnym).
+
+        Returns:
+            bool: True, jeśli ruch został wykonany; False, jeśli okazał się niewykonalny
+                (stan naczepy trzeba wtedy cofnąć)
+        """
+        move = rng.choice(self.MOVES)
+        pallet = rng.choice(movable)
+
+        if move == "swap":
+            other = rng.choice(movable)
+            if other is pallet:
+                return False
+            first_position, second_position = pallet.position, other.position
+            trailer.remove_pallet(pallet.pallet_id)
+            trailer.remove_pallet(other.pallet_id)
+            pallet.position, other.position = second_position, first_position
+            return trailer.add_pallet(pallet) and trailer.add_pallet(other)
+
+        trailer.remove_pallet(pallet.pallet_id)
+        if move == "rotate":
+            pallet.rotate()
+            return trailer.add_pallet(pallet)
+
+        # Przeniesienie do jednego z pierwszych punktów narożnych (najbliżej przodu naczepy)
+        if rng.random() < 0.5:
+            pallet.rotate()
+        positions = trailer.get_corner_points(pallet)
+        if not positions:
+            return False
+        pallet.position = rng.choice(positions[:self.config.get("candidate_positions", 8)])
+        return trailer.add_pallet(pallet)
+
+    def _cost(self, trailer: Trailer) -> float:
+        """
+        Zwraca koszt załadunku w mm: LDM oraz karę za przekroczenie progów balansu masy.
+
+        Kara jest proporcjonalna do przekroczenia progu `weight_distribution_threshold`
+        przez odchylenie balansu bok do boku od 0.5 i balansu przód-tył od wartości docelowej.
+        """
+        distribution = trailer.weight_distribution
+        total = distribution["total"]
+        excess = 0.0
+        if total > 0:
+            threshold = CONSTRAINTS["weight_distribution_threshold"]
+            side = distribution["right"] / total
+            front_back = distribution["front"] / total
+            excess += max(0.0, abs(side - 0.5) - threshold)
+            excess += max(0.0, abs(front_back - CONSTRAINTS["front_to_back_weight_distribution"]) - threshold)
+        return float(trailer.get_loading_meters() * 1000 + self.config.get("balance_weight", 1.0) * trailer.length * excess)
+
+    @staticmethod
+    def _movable_pallets(trailer: Trailer) -> List[Pallet]:
+        """Zwraca palety stojące na podłodze, na których nie stoi żadna inna paleta."""
+        stacked = [p for p in trailer.loaded_pallets if p.position[2] > 0]
+        movable = []
+        for pallet in trailer.loaded_pallets:
+            if pallet.position[2] > 0:
+                continue
+            x, y, _ = pallet.position
+            length, width, _ = pallet.dimensions
+            supports = any(
+                x < s.position[0] + s.dimensions[0] and s.position[0] < x + length and
+                y < s.position[1] + s.dimensions[1] and s.position[1] < y + width
+                for s in stacked
+            )
+            if not supports:
+                movable.append(pallet)
+        return movable
+
+    @staticmethod
+    def _layout(trailer: Trailer) -> List[Tuple[Pallet, Tuple[int, int, int], int]]:
+        """Zapamiętuje ułożenie palet (paleta, pozycja, rotacja) w kolejności załadunku."""
+        return [(p, p.position, p.rotation) for p in trailer.loaded_pallets]
+
+    @staticmethod
+    def _restore_layout(trailer: Trailer, layout: List[Tuple[Pallet, Tuple[int, int, int], int]]) -> None:
+        """Odtwarza zapamiętane ułożenie palet w naczepie."""
+        trailer.reset()
+        for pallet, position, rotation in layout:
+            pallet.position = position
+            pallet.rotation = rotation
+            trailer.add_pallet(pallet)
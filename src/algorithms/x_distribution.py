@@ -69,76 +69,61 @@ class XDistributionLoading(LoadingAlgorithm):
         # Współczynnik balansowania wagi
         balancing_factor = self.config.get("balancing_factor", 0.8)
         
+        # Stan wolnej przestrzeni stref: wymiary palet, które nie zmieściły się w strefie.
+        # Palety są tylko dokładane, więc taki wymiar (i każdy większy) nie zmieści się już nigdy.
+        zone_misses = {i: [] for i in range(zones_count)}
+        
         # Załadunek palet z balansowaniem masy
         for pallet in sorted_pallets:
-            # Wybór optymalnej strefy dla palety
-            best_zone = self._select_best_zone(pallet, zones, zone_weights, zone_length, balancing_factor)
+            # Wybór strefy i pozycji w jednym przebiegu (obie rotacje)
+            selection = self._select_zone_and_position(
+                pallet, zones, zone_weights, zone_length, balancing_factor, zone_misses
+            )
+            
+            if selection is None:
+                logger.debug(f"Nie znaleziono odpowiedniej strefy dla palety {pallet.pallet_id}")
+                continue
+            
+            best_zone, (x, y, _) = selection
+            # Upewnienie się, że z=0 (rotacja palety została ustawiona przy wyborze pozycji)
+            pallet.set_position(x, y, 0)
             
-            if best_zone is not None:
-                # Próba umieszczenia palety w wybranej strefie
-                position = self._find_position_in_zone(pallet, best_zone, zone_length)
+            # Dodanie palety do naczepy
+            if self.trailer.add_pallet(pallet):
+                loaded_pallets.append(pallet)
+                zones[best_zone].append(pallet)
+                zone_weights[best_zone] += pallet.total_weight
                 
-                if position:
-                    # Ustawienie pozycji palety
-                    x, y, z = position
-                    # Upewnienie się, że z=0
-                    pallet.set_position(x, y, 0)
-                    
-                    # Dodanie palety do naczepy
-                    if self.trailer.add_pallet(pallet):
-                        loaded_pallets.append(pallet)
-                        zones[best_zone].append(pallet)
-                        zone_weights[best_zone] += pallet.total_weight
-                        
-                        logger.debug(f"Załadowano paletę {pallet.pallet_id} w strefie {best_zone} na pozycji ({x}, {y}, 0)")
-                else:
-                    # Próba obrócenia palety
-                    original_rotation = pallet.rotation
-                    pallet.rotate()
-                    
-                    position = self._find_position_in_zone(pallet, best_zone, zone_length)
-                    
-                    if position:
-                        # Ustawienie pozycji palety
-                        x, y, z = position
-                        # Upewnienie się, że z=0
-                        pallet.set_position(x, y, 0)
-                        
-                        # Dodanie palety do naczepy
-                        if self.trailer.add_pallet(pallet):
-                            loaded_pallets.append(pallet)
-                            zones[best_zone].append(pallet)
-                            zone_weights[best_zone] += pallet.total_weight
-                            
-                            logger.debug(f"Załadowano obróconą paletę {pallet.pallet_id} w strefie {best_zone} na pozycji ({x}, {y}, 0)")
-                    else:
-                        # Przywróć oryginalną rotację, jeśli nie udało się załadować
-                        if pallet.rotation != original_rotation:
-                            pallet.rotate()
-                        
-                        logger.debug(f"Nie udało się załadować palety {pallet.pallet_id} w strefie {best_zone}")
+                logger.debug(f"Załadowano paletę {pallet.pallet_id} (rotacja {pallet.rotation}) w strefie {best_zone} na pozycji ({x}, {y}, 0)")
             else:
-                logger.debug(f"Nie znaleziono odpowiedniej strefy dla palety {pallet.pallet_id}")
+                logger.debug(f"Nie udało się załadować palety {pallet.pallet_id} w strefie {best_zone}")
         
         logger.info(f"Zakończono załadunek, załadowano {len(loaded_pallets)} palet")
         return loaded_pallets
     
-    def _select_best_zone(self, pallet: Pallet, zones: Dict[int, List[Pallet]], 
-                          zone_weights: Dict[int, float], zone_length: int, 
-                          balancing_factor: float) -> Optional[int]:
+    def _select_zone_and_position(self, pallet: Pallet, zones: Dict[int, List[Pallet]],
+                                  zone_weights: Dict[int, float], zone_length: int,
+                                  balancing_factor: float,
+                                  zone_misses: Dict[int, List[Tuple[int, int, int]]]
+                                  ) -> Optional[Tuple[int, Tuple[int, int, int]]]:
         """
-        Wybiera najlepszą strefę dla palety, biorąc pod uwagę balansowanie masy.
+        Wybiera strefę i pozycję palety w jednym przebiegu, biorąc pod uwagę balansowanie masy.
         Szuka pozycji tylko na poziomie z=0 (bez stackowania).
         
+        Strefy są przeglądane od najbardziej niedociążonej; w każdej strefie spełniającej
+        kryterium balansu sprawdzana jest bieżąca, a następnie obrócona orientacja palety.
+        Znaleziona pozycja jest zwracana od razu, bez ponownego przeszukiwania strefy.
+        
         Args:
-            pallet: Paleta do umieszczenia
+            pallet: Paleta do umieszczenia (przy powodzeniu pozostaje w wybranej rotacji)
             zones: Słownik mapujący numery stref na listy palet w tych strefach
             zone_weights: Słownik mapujący numery stref na całkowitą masę w strefie
             zone_length: Długość jednej strefy
             balancing_factor: Współczynnik balansowania masy
+            zone_misses: Wymiary palet, które nie zmieściły się w danej strefie (aktualizowane)
             
         Returns:
-            Optional[int]: Numer wybranej strefy lub None, jeśli nie znaleziono odpowiedniej
+            Optional[Tuple[int, Tuple[int, int, int]]]: Numer strefy i pozycja (x, y, z) lub None
         """
         total_weight = sum(zone_weights.values()) + pallet.total_weight
         
@@ -151,51 +136,32 @@ class XDistributionLoading(LoadingAlgorithm):
             key=lambda zone_idx: abs(zone_weights[zone_idx] - ideal_zone_weight)
         )
         
-        # Próba umieszczenia palety w najlepszej strefie
+        original_rotation = pallet.rotation
+        rotations = (original_rotation, 90 if original_rotation == 0 else 0)
+        
         for zone_idx in sorted_zones:
-            # Sprawdzenie, czy paleta zmieści się w strefie
-            x_start = zone_idx * zone_length
-            x_end = (zone_idx + 1) * zone_length
+            # Kryterium balansu nie zależy od pozycji, więc sprawdzamy je przed przeszukaniem strefy
+            new_zone_weight = zone_weights[zone_idx] + pallet.total_weight
+            balance_ratio = new_zone_weight / (ideal_zone_weight * len(zones))
+            if balance_ratio > 1.0 + balancing_factor:
+                continue
             
-            # Utworzenie tymczasowej palety do sprawdzenia
-            temp_pallet = Pallet(
-                pallet_id=pallet.pallet_id,
-                pallet_type=pallet.pallet_type,
-                length=pallet.length,
-                width=pallet.width,
-                height=pallet.height,
-                weight=pallet.weight,
-                cargo_weight=pallet.cargo_weight,
-                position=(x_start, 0, 0),  # Tymczasowa pozycja w strefie na poziomie z=0
-                rotation=pallet.rotation
-            )
-            
-            # Sprawdzenie, czy są dostępne pozycje w strefie
-            available_in_zone = False
-            for x in range(x_start, x_end - temp_pallet.dimensions[0] + 1, 100):
-                for y in range(0, self.trailer.width - temp_pallet.dimensions[1] + 1, 100):
-                    # Sprawdzenie, czy paleta zmieści się na tej pozycji (zawsze z=0)
-                    temp_pallet.set_position(x, y, 0)
-                    if not any(temp_pallet.collides_with(loaded_pallet) for loaded_pallet in self.trailer.loaded_pallets):
-                        available_in_zone = True
-                        break
+            for rotation in rotations:
+                pallet.rotation = rotation
+                dimensions = pallet.dimensions
                 
-                if available_in_zone:
-                    break
-            
-            # Sprawdzenie dodatkowych kryteriów balansu
-            if available_in_zone:
-                # Obliczanie nowej masy strefy
-                new_zone_weight = zone_weights[zone_idx] + pallet.total_weight
+                # Pomijamy wymiary nie mniejsze od tych, które już się w strefie nie zmieściły
+                if any(all(d >= m for d, m in zip(dimensions, missed)) for missed in zone_misses[zone_idx]):
+                    continue
                 
-                # Obliczanie współczynnika balansu
-                balance_ratio = new_zone_weight / (ideal_zone_weight * len(zones))
+                position = self._find_position_in_zone(pallet, zone_idx, zone_length)
+                if position is not None:
+                    return zone_idx, position
                 
-                # Sprawdzenie, czy balans jest akceptowalny
-                if balance_ratio <= 1.0 + balancing_factor:
-                    return zone_idx
+                zone_misses[zone_idx].append(dimensions)
         
-        # Jeśli nie znaleziono odpowiedniej strefy, zwróć None
+        # Przywrócenie oryginalnej rotacji, jeśli nie znaleziono miejsca
+        pallet.rotation = original_rotation
         return None
     
     def _find_position_in_zone(self, pallet: Pallet, zone_idx: int, zone_length: int) -> Optional[Tuple[int, int, int]]:
@@ -215,32 +181,21 @@ class XDistributionLoading(LoadingAlgorithm):
         x_start = zone_idx * zone_length
         x_end = min((zone_idx + 1) * zone_length, self.trailer.length)
         
-        best_position = None
-        
-        # Stała wysokość z=0
-        z = 0
-        
-        # Przeszukanie potencjalnych pozycji w strefie
-        for x in range(x_start, x_end - pallet.dimensions[0] + 1, 100):
-            for y in range(0, self.trailer.width - pallet.dimensions[1] + 1, 100):
-                # Sprawdzenie czy pozycja jest dostępna na poziomie z=0
-                temp_pallet = Pallet(
-                    pallet_id=pallet.pallet_id,
-                    pallet_type=pallet.pallet_type,
-                    length=pallet.length,
-                    width=pallet.width,
-                    height=pallet.height,
-                    weight=pallet.weight,
-                    cargo_weight=pallet.cargo_weight,
-                    position=(x, y, z),
-                    rotation=pallet.rotation
-                )
-                
-                # Sprawdzenie kolizji
-                if not self.trailer._check_collision(temp_pallet):
-                    # Znaleziono odpowiednią pozycję
-                    best_position = (x, y, z)
-                    # Zwróć pozycję jak najszybciej po znalezieniu wolnego miejsca
-                    return best_position
-        
-        return best_position 
\ No newline at end of file
+        placement = self.config.get("placement", "corner_points")
+        
+        # Kandydaci w punktach narożnych zamiast pełnej siatki
+        if placement == "corner_points":
+            return next(self.trailer.iter_corner_points(pallet, x_range=(x_start, x_end)), None)
+        
+        # Pozycja wyznaczona z wolnych prostokątów maksymalnych
+        if placement == "max_rects":
+            return self.trailer.find_free_space_position(pallet, x_range=(x_start, x_end))
+        
+        # Wolne węzły siatki w strefie (na poziomie z=0), sprawdzone jednym testem wektorowym
+        free_positions = self.trailer.free_grid_positions(pallet, x_range=(x_start, x_end))
+        if len(free_positions) == 0:
+            return None
+        
+        # Pierwsza wolna pozycja w kolejności przeszukiwania (rosnąco po x, następnie po y)
+        x, y = free_positions[0]
+        return (int(x), int(y), 0) 
\ No newline at end of file
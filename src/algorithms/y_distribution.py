@@ -6,6 +6,8 @@ from typing import List, Dict, Any, Tuple, Optional
 import logging
 import math
 
+import numpy as np
+
 from src.algorithms.base_algorithm import LoadingAlgorithm
 from src.data.pallet import Pallet
 from src.data.trailer import Trailer
@@ -151,39 +153,61 @@ class YDistributionLoading(LoadingAlgorithm):
         Returns:
             Optional[Tuple[int, int, int]]: Pozycja (x, y, z) lub None, jeśli nie znaleziono miejsca
         """
-        best_position = None
-        min_distance = float('inf')
-        
-        # Zawsze ustawiamy z=0 (palety nie są piętrowane)
-        z = 0
-        
-        # Przeszukanie potencjalnych pozycji w strefie Y
-        for x in range(0, self.trailer.length - pallet.dimensions[0] + 1, 100):
-            # Szukamy pozycji y w zakresie strefy Y, uwzględniając szerokość palety
-            for y in range(y_start, y_end - pallet.dimensions[1] + 1, 100):
-                # Sprawdzenie, czy ta pozycja jest najlepsza (najbliżej środka strefy Y)
-                # Preferujemy pozycje bliżej środka strefy dla lepszego rozkładu
-                center_y = (y_start + y_end) / 2
-                
-                # Odległość od środka strefy Y
-                distance = abs(y + pallet.dimensions[1]/2 - center_y)
-                
-                if distance < min_distance:
-                    temp_pallet = Pallet(
-                        pallet_id=pallet.pallet_id,
-                        pallet_type=pallet.pallet_type,
-                        length=pallet.length,
-                        width=pallet.width,
-                        height=pallet.height,
-                        weight=pallet.weight,
-                        cargo_weight=pallet.cargo_weight,
-                        position=(x, y, z),
-                        rotation=pallet.rotation
-                    )
-                    
-                    # Sprawdzenie kolizji
-                    if not self.trailer._check_collision(temp_pallet):
-                        best_position = (x, y, z)
-                        min_distance = distance
+        placement = self.config.get("placement", "corner_points")
+        
+        # Kandydaci w punktach narożnych zamiast pełnej siatki
+        if placement == "corner_points":
+            return self._find_corner_point_in_zone(pallet, y_start, y_end)
+        
+        # Pozycja najbliżej środka strefy wyznaczona z wolnych prostokątów maksymalnych
+        if placement == "max_rects":
+            return self.trailer.find_free_space_position(
+                pallet, "closest_y", y_range=(y_start, y_end), target_y=(y_start + y_end) / 2
+            )
+        
+        # Wolne pozycje siatki w strefie Y (zawsze z=0, palety nie są piętrowane),
+        # sprawdzone jednym wektorowym testem kolizji, rosnąco po x, następnie po y
+        free_positions = self.trailer.free_grid_positions(pallet, y_range=(y_start, y_end))
+        if len(free_positions) == 0:
+            return None
+        
+        # Odległości środków palet od środka strefy Y - preferujemy pozycje bliżej
+        # środka strefy dla lepszego rozkładu (przy remisie pierwsza w kolejności przeszukiwania)
+        center_y = (y_start + y_end) / 2
+        distances = np.abs(free_positions[:, 1] + pallet.dimensions[1] / 2 - center_y)
+        x, y = free_positions[np.argmin(distances)]
+        
+        return (int(x), int(y), 0)
+
+    def _find_corner_point_in_zone(self, pallet: Pallet, y_start: int, y_end: int) -> Optional[Tuple[int, int, int]]:
+        """
+        Znajduje pozycję najbliższą środka strefy Y spośród punktów narożnych.
+        
+        Oprócz samych punktów narożnych sprawdzana jest pozycja wyśrodkowana
+        w strefie dla każdej ich współrzędnej x.
+        
+        Args:
+            pallet: Paleta do umieszczenia
+            y_start: Początek strefy Y
+            y_end: Koniec strefy Y
+            
+        Returns:
+            Optional[Tuple[int, int, int]]: Pozycja (x, y, z) lub None, jeśli nie znaleziono miejsca
+        """
+        width = pallet.dimensions[1]
+        center_y = (y_start + y_end) / 2
+        
+        candidates = self.trailer.get_corner_points(pallet, y_range=(y_start, y_end))
+        
+        # Pozycja wyśrodkowana w strefie Y
+        centered_y = int(round(center_y - width / 2))
+        if y_start <= centered_y and centered_y + width <= y_end:
+            xs = sorted({position[0] for position in candidates})
+            for x, y in self.trailer.free_floor_positions(pallet, xs, [centered_y]):
+                candidates.append((int(x), int(y), 0))
+        
+        if not candidates:
+            return None
         
-        return best_position 
\ No newline at end of file
+        # Najbliżej środka strefy, a przy remisie najbliżej przodu naczepy
+        return min(candidates, key=lambda pos: (abs(pos[1] + width / 2 - center_y), pos[0], pos[1]))
@@ -6,6 +6,8 @@ from typing import List, Dict, Any, Tuple, Optional
 import logging
 import math
 
+import numpy as np
+
 from src.algorithms.base_algorithm import LoadingAlgorithm
 from src.data.pallet import Pallet
 from src.data.trailer import Trailer
@@ -151,39 +153,16 @@ class YDistributionLoading(LoadingAlgorithm):
         Returns:
             Optional[Tuple[int, int, int]]: Pozycja (x, y, z) lub None, jeśli nie znaleziono miejsca
         """
-        best_position = None
-        min_distance = float('inf')
-        
-        # Zawsze ustawiamy z=0 (palety nie są piętrowane)
-        z = 0
-        
-        # Przeszukanie potencjalnych pozycji w strefie Y
-        for x in range(0, self.trailer.length - pallet.dimensions[0] + 1, 100):
-            # Szukamy pozycji y w zakresie strefy Y, uwzględniając szerokość palety
-            for y in range(y_start, y_end - pallet.dimensions[1] + 1, 100):
-                # Sprawdzenie, czy ta pozycja jest najlepsza (najbliżej środka strefy Y)
-                # Preferujemy pozycje bliżej środka strefy dla lepszego rozkładu
-                center_y = (y_start + y_end) / 2
-                
-                # Odległość od środka strefy Y
-                distance = abs(y + pallet.dimensions[1]/2 - center_y)
-                
-                if distance < min_distance:
-                    temp_pallet = Pallet(
-                        pallet_id=pallet.pallet_id,
-                        pallet_type=pallet.pallet_type,
-                        length=pallet.length,
-                        width=pallet.width,
-                        height=pallet.height,
-                        weight=pallet.weight,
-                        cargo_weight=pallet.cargo_weight,
-                        position=(x, y, z),
-                        rotation=pallet.rotation
-                    )
-                    
-                    # Sprawdzenie kolizji
-                    if not self.trailer._check_collision(temp_pallet):
-                        best_position = (x, y, z)
-                        min_distance = distance
-        
-        return best_position 
\ No newline at end of file
+        # Wolne pozycje siatki w strefie Y (zawsze z=0, palety nie są piętrowane),
+        # sprawdzone jednym wektorowym testem kolizji, rosnąco po x, następnie po y
+        free_positions = self.trailer.free_grid_positions(pallet, y_range=(y_start, y_end))
+        if len(free_positions) == 0:
+            return None
+        
+        # Odległości środków palet od środka strefy Y - preferujemy pozycje bliżej
+        # środka strefy dla lepszego rozkładu (przy remisie pierwsza w kolejności przeszukiwania)
+        center_y = (y_start + y_end) / 2
+        distances = np.abs(free_positions[:, 1] + pallet.dimensions[1] / 2 - center_y)
+        x, y = free_positions[np.argmin(distances)]
+        
+        return (int(x), int(y), 0) 
\ No newline at end of file
@@ -109,22 +109,83 @@ VISUALIZATION = {
     "scene_padding": 500,  # Dodatkowa przestrzeń wokół naczepy w wizualizacji (mm)
     "camera_position": {"x": 1.5, "y": 1.5, "z": 1.5},
     "trailer_color": "rgba(220, 220, 230, 0.3)",
-    "trailer_outline_color": "rgba(50, 50, 120, 1)"
+    "trailer_outline_color": "rgba(50, 50, 120, 1)",
+    "time_budget_s": 10.0  # Budżet czasu algorytmu uruchamianego z panelu (s)
 }
 
 # Domyślne parametry algorytmów
 ALGORITHM_DEFAULTS = {
     "XY_Axis_Loading": {
         "prioritize_heavy_pallets": True,
-        "start_position": "front"
+        "start_position": "front",
+        "placement": "corner_points"  # "corner_points", "max_rects" lub "grid" (siatka co 100 mm)
     },
     "X_Distribution": {
         "target_center_position": 0.5,
-        "weight_balance_factor": 0.7
+        "weight_balance_factor": 0.7,
+        "placement": "corner_points"
     },
     "Y_Distribution": {
         "side_balance_threshold": 0.1,
-        "prioritize_heavy_pallets": True
+        "prioritize_heavy_pallets": True,
+        "placement": "corner_points"
+    },
+    "Lane_DP_Loading": {
+        "max_lanes": 6,  # Maksymalna liczba pasów wzdłużnych we wzorcu poprzecznym
+        "compact": True  # Czy dogęszczać układ pasów (dosuwanie palet do przodu i lewej ściany)
+    },
+    "Row_MILP_Loading": {
+        "time_limit": 1.0,  # Limit czasu solvera MILP w sekundach
+        "max_row_slots": 6,  # Maksymalna liczba gniazd (palet obok siebie) w rzędzie poprzecznym
+        "front_back_balance": False  # Czy wymagać rozkładu masy przód-tył zgodnego z CONSTRAINTS
+    },
+    "Beam_Search_Loading": {
+        "beam_width": 16,  # Liczba częściowych załadunków utrzymywanych w każdym kroku
+        "expansion_width": 4,  # Liczba kolejnych palet rozważanych przy rozszerzaniu stanu
+        "balance_weight": 0.5,  # Waga kary za nierównowagę boczną w ocenie stanu
+        "weight_bucket_kg": 10,  # Szerokość przedziału masy palet uznawanych za równoważne (kg)
+        "time_budget_s": None,  # Budżet czasu w sekundach (None - bez limitu)
+        "workers": None,  # Liczba procesów/wątków (None - liczba rdzeni)
+        "executor": "process"  # "process" lub "thread"
+    },
+    "Genetic_Loading": {
+        "population_size": 40,  # Liczność populacji
+        "generations": 60,  # Maksymalna liczba pokoleń
+        "time_budget_s": 5.0,  # Budżet czasu w sekundach (None - bez limitu)
+        "elite_size": 2,  # Liczba najlepszych osobników przechodzących bez zmian
+        "tournament_size": 3,  # Liczba osobników w turnieju selekcji
+        "crossover_rate": 0.9,  # Prawdopodobieństwo krzyżowania
+        "mutation_rate": 0.2,  # Prawdopodobieństwo mutacji kolejności
+        "balance_weight": 1.0,  # Waga kary za przekroczenie progów balansu masy
+        "weight_bucket_kg": 10,  # Szerokość przedziału masy palet uznawanych za równoważne (kg)
+        "seed": None,  # Ziarno generatora liczb losowych (powtarzalność wyników)
+        "workers": None,  # Liczba procesów/wątków (None - liczba rdzeni)
+        "executor": "process"  # "process" lub "thread"
+    },
+    "LNS_Loading": {
+        "time_budget_s": 2.0,  # Budżet czasu w sekundach (None - bez limitu)
+        "max_iterations": 5000,  # Maksymalna liczba iteracji (usunięcie i naprawa)
+        "destroy_fraction": 0.2,  # Część załadunku usuwana w iteracji (długości zajętej naczepy lub liczby palet)
+        "order_noise": 3.0,  # Losowe zaburzenie kolejności naprawy (względne, wg pola podstawy)
+        "seed": None  # Ziarno generatora liczb losowych (powtarzalność wyników)
+    },
+    "Portfolio_Loading": {
+        "algorithms": None,  # Nazwy algorytmów portfela (None - wszystkie zarejestrowane poza wykluczonymi)
+        "exclude": ["RL_Loading"],  # Algorytmy pomijane, gdy lista algorytmów nie jest podana
+        "algorithm_configs": {},  # Konfiguracje algorytmów portfela wg nazwy
+        "objective": "pallets_then_ldm",  # "pallets_then_ldm", "space_utilization" lub "balanced"
+        "time_budget_s": None,  # Budżet czasu całego portfela w sekundach (None - bez limitu)
+        "workers": None,  # Liczba procesów/wątków (None - liczba rdzeni, nie więcej niż algorytmów)
+        "executor": "process"  # "process" lub "thread"
+    },
+    "Simulated_Annealing": {
+        "iterations": 3000,  # Maksymalna liczba iteracji (ruchów)
+        "time_budget_s": 2.0,  # Budżet czasu w sekundach (None - bez limitu)
+        "initial_temperature": 300.0,  # Temperatura początkowa (w mm kosztu)
+        "final_temperature": 1.0,  # Temperatura końcowa (chłodzenie geometryczne)
+        "candidate_positions": 8,  # Liczba pierwszych punktów narożnych losowanych przy przeniesieniu palety
+        "balance_weight": 1.0,  # Waga kary za przekroczenie progów balansu masy
+        "seed": None  # Ziarno generatora liczb losowych (powtarzalność wyników)
     },
     "RL_Loading": {
         "learning_rate": 0.1,
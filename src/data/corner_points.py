@@ -0,0 +1,106 @@
+"""
+Moduł zawierający generator punktów narożnych (corner points) dla załadunku na podłodze naczepy.
+"""
+
+from bisect import insort
+from typing import Dict, List
+
+
+class CornerPoints:
+    """
+    Zbiór współrzędnych krawędzi palet, z których powstają punkty narożne na podłodze.
+
+    Paleta dosunięta maksymalnie do przodu i do lewej ściany zawsze opiera się
+    o ścianę lub o krawędź innej palety. Wystarczy więc rozważać pozycje
+    x ∈ {0} ∪ {x_i + l_i} oraz y ∈ {0} ∪ {y_i + w_i}, zamiast pełnej siatki.
+    Dla załadunku od tyłu naczepy używane są krawędzie przednie x_i (oraz tylna
+    ściana), do których dosuwany jest tył palety.
+
+    Współrzędne są przechowywane jako posortowane listy wartości unikalnych
+    z licznikami wystąpień, dzięki czemu dodanie i usunięcie palety nie wymaga
+    przebudowy całej struktury.
+
+    Attributes:
+        length: Długość podłogi w mm
+        width: Szerokość podłogi w mm
+    """
+
+    def __init__(self, length: int, width: int):
+        """
+        Inicjalizuje zbiór zawierający tylko ściany naczepy.
+
+        Args:
+            length: Długość podłogi w mm
+            width: Szerokość podłogi w mm
+        """
+        self.length = length
+        self.width = width
+        self.clear()
+
+    def insert(self, x: int, y: int, length: int, width: int) -> None:
+        """Dodaje krawędzie prostokąta (x, y, length, width) zajętego przez paletę."""
+        self._add(self._front_edges, self._front_counts, x + length)
+        self._add(self._back_edges, self._back_counts, x)
+        self._add(self._side_edges, self._side_counts, y + width)
+
+    def remove(self, x: int, y: int, length: int, width: int) -> None:
+        """Usuwa krawędzie prostokąta dodanego wcześniej metodą `insert`."""
+        self._discard(self._front_edges, self._front_counts, x + length)
+        self._discard(self._back_edges, self._back_counts, x)
+        self._discard(self._side_edges, self._side_counts, y + width)
+
+    def clear(self) -> None:
+        """Przywraca stan początkowy (pusta podłoga, tylko ściany)."""
+        self._front_edges: List[int] = [0]
+        self._front_counts: Dict[int, int] = {0: 1}
+        self._back_edges: List[int] = [self.length]
+        self._back_counts: Dict[int, int] = {self.length: 1}
+        self._side_edges: List[int] = [0]
+        self._side_counts: Dict[int, int] = {0: 1}
+
+    def copy(self) -> 'CornerPoints':
+        """Zwraca niezależną kopię zbioru krawędzi."""
+        clone = CornerPoints.__new__(CornerPoints)
+        clone.length = self.length
+        clone.width = self.width
+        clone._front_edges = list(self._front_edges)
+        clone._front_counts = dict(self._front_counts)
+        clone._back_edges = list(self._back_edges)
+        clone._back_counts = dict(self._back_counts)
+        clone._side_edges = list(self._side_edges)
+        clone._side_counts = dict(self._side_counts)
+        return clone
+
+    def x_candidates(self, length: int, from_back: bool = False) -> List[int]:
+        """
+        Zwraca kandydujące pozycje x palety o podanej długości.
+
+        Od przodu są to krawędzie tylne palet (rosnąco), od tyłu - krawędzie przednie
+        pomniejszone o długość palety (malejąco).
+        """
+        if from_back:
+            return [edge - length for edge in reversed(self._back_edges)]
+        return list(self._front_edges)
+
+    def y_candidates(self) -> List[int]:
+        """Zwraca kandydujące pozycje y (rosnąco)."""
+        return list(self._side_edges)
+
+    @staticmethod
+    def _add(edges: List[int], counts: Dict[int, int], value: int) -> None:
+        """Zwiększa licznik krawędzi, dopisując ją do posortowanej listy przy pierwszym wystąpieniu."""
+        if value in counts:
+            counts[value] += 1
+        else:
+            counts[value] = 1
+            insort(edges, value)
+
+    @staticmethod
+    def _discard(edges: List[int], counts: Dict[int, int], value: int) -> None:
+        """Zmniejsza licznik krawędzi, usuwając ją z listy po ostatnim wystąpieniu."""
+        count = counts.get(value, 0)
+        if count > 1:
+            counts[value] = count - 1
+        elif count == 1:
+            del counts[value]
+            edges.remove(value)
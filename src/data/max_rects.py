@@ -0,0 +1,153 @@
+"""
+Moduł zawierający strukturę wolnych prostokątów maksymalnych (MaxRects) dla załadunku na podłodze naczepy.
+"""
+
+from typing import List, Optional, Tuple
+
+# Prostokąt na podłodze: (x, y, długość, szerokość)
+Rect = Tuple[int, int, int, int]
+
+
+class MaxRects:
+    """
+    Reprezentacja wolnej powierzchni podłogi jako zbiór prostokątów maksymalnych.
+
+    Każdy wolny prostokąt jest maksymalny, tj. nie da się go powiększyć w żadnym
+    kierunku bez nachodzenia na zajętą powierzchnię. Prostokąty mogą się nakładać.
+    Po ustawieniu palety każdy przecinany prostokąt jest dzielony na co najwyżej
+    cztery części, a prostokąty zawarte w innych są usuwane. Pytanie o pozycję dla
+    podstawy palety sprowadza się do przejrzenia tej listy, bez żadnej siatki.
+
+    Obsługiwane heurystyki wyboru pozycji:
+        - "bottom_left": najbliżej przodu (lub tyłu) naczepy, potem lewej ściany,
+        - "best_short_side": najmniejszy krótszy z pozostałych boków prostokąta,
+        - "closest_y": środek palety najbliżej zadanej współrzędnej `target_y`.
+
+    Attributes:
+        length: Długość podłogi w mm
+        width: Szerokość podłogi w mm
+        free_rects: Lista wolnych prostokątów maksymalnych
+    """
+
+    HEURISTICS = ("bottom_left", "best_short_side", "closest_y")
+
+    def __init__(self, length: int, width: int):
+        """
+        Inicjalizuje strukturę z całą podłogą jako jednym wolnym prostokątem.
+
+        Args:
+            length: Długość podłogi w mm
+            width: Szerokość podłogi w mm
+        """
+        self.length = length
+        self.width = width
+        self.free_rects: List[Rect] = [(0, 0, length, width)]
+
+    def reset(self) -> None:
+        """Przywraca stan początkowy (pusta podłoga)."""
+        self.free_rects = [(0, 0, self.length, self.width)]
+
+    def copy(self) -> 'MaxRects':
+        """Zwraca niezależną kopię struktury."""
+        clone = MaxRects(self.length, self.width)
+        clone.free_rects = list(self.free_rects)
+        return clone
+
+    def place(self, x: int, y: int, length: int, width: int) -> None:
+        """
+        Zajmuje prostokąt (x, y, length, width), dzieląc i przycinając wolne prostokąty.
+
+        Args:
+            x, y: Narożnik zajmowanego prostokąta
+            length, width: Wymiary zajmowanego prostokąta
+        """
+        x_end, y_end = x + length, y + width
+        split: List[Rect] = []
+        for rect in self.free_rects:
+            rx, ry, rl, rw = rect
+            if x >= rx + rl or x_end <= rx or y >= ry + rw or y_end <= ry:
+                split.append(rect)
+                continue
+
+            # Części wolnego prostokąta wystające poza zajmowany prostokąt
+            if x > rx:
+                split.append((rx, ry, x - rx, rw))
+            if x_end < rx + rl:
+                split.append((x_end, ry, rx + rl - x_end, rw))
+            if y > ry:
+                split.append((rx, ry, rl, y - ry))
+            if y_end < ry + rw:
+                split.append((rx, y_end, rl, ry + rw - y_end))
+
+        self.free_rects = self._prune(split)
+
+    def find_position(self, length: int, width: int, heuristic: str = "bottom_left",
+                      x_range: Optional[Tuple[int, int]] = None,
+                      y_range: Optional[Tuple[int, int]] = None,
+                      from_back: bool = False,
+                      target_y: Optional[float] = None) -> Optional[Tuple[int, int]]:
+        """
+        Znajduje pozycję dla podstawy o podanych wymiarach.
+
+        Args:
+            length, width: Wymiary podstawy palety (z uwzględnieniem rotacji)
+            heuristic: Heurystyka wyboru pozycji (patrz `HEURISTICS`)
+            x_range: Zakres (początek, koniec) osi X, w którym musi się zmieścić podstawa
+            y_range: Zakres (początek, koniec) osi Y, w którym musi się zmieścić podstawa
+            from_back: Czy dosuwać podstawę do tylnej krawędzi prostokąta (załadunek od tyłu)
+            target_y: Docelowa współrzędna Y środka podstawy (dla heurystyki "closest_y")
+
+        Returns:
+            Optional[Tuple[int, int]]: Pozycja (x, y) lub None, jeśli podstawa nigdzie się nie mieści
+        """
+        if heuristic not in self.HEURISTICS:
+            raise ValueError(f"Nieznana heurystyka: {heuristic}. Dostępne heurystyki: {', '.join(self.HEURISTICS)}")
+
+        x_min, x_max = x_range if x_range is not None else (0, self.length)
+        y_min, y_max = y_range if y_range is not None else (0, self.width)
+
+        best_position = None
+        best_score = None
+        for rx, ry, rl, rw in self.free_rects:
+            # Część wspólna wolnego prostokąta i dozwolonego zakresu
+            left, right = max(rx, x_min), min(rx + rl, x_max)
+            bottom, top = max(ry, y_min), min(ry + rw, y_max)
+            if right - left < length or top - bottom < width:
+                continue
+
+            x = right - length if from_back else left
+            y = bottom
+            if heuristic == "closest_y" and target_y is not None:
+                # Najbliższa celu pozycja w obrębie prostokąta
+                y = int(round(min(max(target_y - width / 2, bottom), top - width)))
+
+            if heuristic == "best_short_side":
+                leftover_x = right - left - length
+                leftover_y = top - bottom - width
+                score = (min(leftover_x, leftover_y), max(leftover_x, leftover_y), x, y)
+            elif heuristic == "closest_y" and target_y is not None:
+                score = (abs(y + width / 2 - target_y), -x if from_back else x, y)
+            else:
+                score = (-x if from_back else x, y)
+
+            if best_score is None or score < best_score:
+                best_score = score
+                best_position = (x, y)
+
+        return best_position
+
+    @staticmethod
+    def _prune(rects: List[Rect]) -> List[Rect]:
+        """Usuwa duplikaty i prostokąty zawarte w innych prostokątach."""
+        # Od największych, aby prostokąt zawierający był sprawdzany przed zawartym
+        rects = sorted(set(rects), key=lambda r: r[2] * r[3], reverse=True)
+        pruned: List[Rect] = []
+        for rect in rects:
+            rx, ry, rl, rw = rect
+            contained = any(
+                ox <= rx and oy <= ry and rx + rl <= ox + ol and ry + rw <= oy + ow
+                for ox, oy, ol, ow in pruned
+            )
+            if not contained:
+                pruned.append(rect)
+        return pruned
@@ -2,16 +2,20 @@
 Moduł zawierający definicję klasy Pallet do reprezentacji palet transportowych.
 """
 
-import copy
 from dataclasses import dataclass
 from typing import Dict, Optional, Tuple, List
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class Pallet:
     """
     Klasa reprezentująca paletę transportową.
 
+    Klasa używa `__slots__`, więc instancje są mniejsze i szybsze w tworzeniu
+    (algorytmy wielokrotnie kopiują palety przy przeszukiwaniu wariantów załadunku).
+
     Attributes:
         pallet_id: Unikalny identyfikator palety
         pallet_type: Typ palety (np. EUR, EUR2, INDUSTRIAL)
@@ -73,6 +77,11 @@ class Pallet:
         """Zwraca objętość palety w mm³."""
         return self.length * self.width * self.height
 
+    @property
+    def box(self) -> Tuple[int, int, int, int, int, int]:
+        """Zwraca prostopadłościan palety (x, y, z, długość, szerokość, wysokość) z uwzględnieniem rotacji."""
+        return (*self.position, *self.dimensions)
+
     @property
     def corners(self) -> List[Tuple[int, int, int]]:
         """Zwraca współrzędne wszystkich 8 rogów palety."""
@@ -113,6 +122,18 @@ class Pallet:
         
         return x_collision and y_collision and z_collision
 
+    def collides_with_many(self, boxes: np.ndarray) -> np.ndarray:
+        """
+        Sprawdza kolizje palety z wieloma prostopadłościanami jednocześnie.
+
+        Args:
+            boxes: Tablica (M, 6) prostopadłościanów (x, y, z, długość, szerokość, wysokość)
+
+        Returns:
+            np.ndarray: Maska (M,) - True dla prostopadłościanów kolidujących z paletą
+        """
+        return boxes_collide(self.box, boxes)
+
     @classmethod
     def from_dict(cls, data: Dict) -> 'Pallet':
         """Tworzy instancję palety z danych słownikowych."""
@@ -136,6 +157,42 @@ class Pallet:
             "color": self.color
         } 
     
-    def copy(self):
-        """Tworzy kopię palety."""
-        return copy.deepcopy(self)
\ No newline at end of file
+    def copy(self) -> 'Pallet':
+        """
+        Tworzy płytką kopię palety.
+
+        Wszystkie pola są niezmienne (liczby, napisy, krotka pozycji), więc płytka
+        kopia jest w pełni niezależna od oryginału, a jest wielokrotnie szybsza
+        od `copy.deepcopy`.
+        """
+        return Pallet(
+            self.pallet_id, self.pallet_type, self.length, self.width, self.height,
+            self.weight, self.cargo_weight, self.max_stack_weight, self.stackable,
+            self.fragile, self.position, self.rotation, self.color
+        )
+
+
+def boxes_collide(boxes: np.ndarray, others: np.ndarray) -> np.ndarray:
+    """
+    Wektorowy test kolizji prostopadłościanów (x, y, z, długość, szerokość, wysokość).
+
+    Warunek kolizji jest taki sam jak w `Pallet.collides_with`, ale wszystkie pary
+    są sprawdzane jednym rozgłoszeniem (broadcasting) NumPy.
+
+    Args:
+        boxes: Jeden prostopadłościan (6,) lub N prostopadłościanów (N, 6)
+        others: M prostopadłościanów (M, 6)
+
+    Returns:
+        np.ndarray: Maska (M,) dla jednego prostopadłościanu lub macierz (N, M) dla N prostopadłościanów
+    """
+    boxes = np.asarray(boxes)
+    others = np.asarray(others).reshape(-1, 6)
+
+    start = boxes[..., np.newaxis, :3]
+    end = start + boxes[..., np.newaxis, 3:]
+    other_start = others[:, :3]
+    other_end = other_start + others[:, 3:]
+
+    # Kolizja wymaga zachodzenia przedziałów we wszystkich trzech wymiarach
+    return np.all((start < other_end) & (end > other_start), axis=-1)
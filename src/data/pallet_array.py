@@ -0,0 +1,181 @@
+"""
+Moduł zawierający kolumnową (struct-of-arrays) reprezentację zbioru palet.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+
+from src.data.pallet import Pallet
+from src.config import PALLET_TYPES
+
+
+@dataclass
+class PalletArray:
+    """
+    Zbiór palet przechowywany jako kolumny tablic NumPy.
+
+    Zamiast odczytywać właściwości `dimensions`, `position` i `total_weight`
+    kolejnych obiektów `Pallet`, operacje na całym załadunku (walidacja, metryki,
+    testy kolizji) mogą działać wektorowo na kolumnach. Wiersz i odpowiada
+    i-tej palecie listy, z której utworzono tablicę.
+
+    Attributes:
+        ids: Identyfikatory palet (N,)
+        type_codes: Kody typów palet (N,) - indeksy w `type_names`
+        type_names: Nazwy typów palet odpowiadające kodom
+        dims: Wymiary bez uwzględnienia rotacji (N, 3): długość, szerokość, wysokość
+        weights: Masy palet (N,)
+        cargo_weights: Masy ładunków (N,)
+        rotations: Rotacje palet w stopniach (N,)
+        positions: Pozycje palet (N, 3): x, y, z
+        max_stack_weights: Maksymalne masy obciążenia (N,), NaN gdy brak ograniczenia
+        stackable: Czy palety mogą być układane w stosy (N,)
+        fragile: Czy ładunki są kruche (N,)
+        colors: Kolory palet (N,)
+    """
+
+    ids: np.ndarray
+    type_codes: np.ndarray
+    type_names: List[str]
+    dims: np.ndarray
+    weights: np.ndarray
+    cargo_weights: np.ndarray
+    rotations: np.ndarray
+    positions: np.ndarray
+    max_stack_weights: np.ndarray
+    stackable: np.ndarray
+    fragile: np.ndarray
+    colors: np.ndarray
+
+    @classmethod
+    def from_pallets(cls, pallets: List[Pallet]) -> 'PalletArray':
+        """
+        Tworzy tablicę kolumnową z listy palet.
+
+        Args:
+            pallets: Lista palet
+
+        Returns:
+            PalletArray: Tablica kolumnowa z danymi palet
+        """
+        # Kody typów zgodne z uporządkowaniem używanym w środowisku RL (alfabetycznie)
+        type_names = sorted(PALLET_TYPES.keys())
+        type_index: Dict[str, int] = {name: code for code, name in enumerate(type_names)}
+        for pallet in pallets:
+            if pallet.pallet_type not in type_index:
+                type_index[pallet.pallet_type] = len(type_names)
+                type_names.append(pallet.pallet_type)
+
+        return cls(
+            ids=np.array([p.pallet_id for p in pallets], dtype=object),
+            type_codes=np.array([type_index[p.pallet_type] for p in pallets], dtype=np.int16),
+            type_names=type_names,
+            dims=np.array([(p.length, p.width, p.height) for p in pallets], dtype=np.int32).reshape(-1, 3),
+            weights=np.array([p.weight for p in pallets], dtype=np.float64),
+            cargo_weights=np.array([p.cargo_weight for p in pallets], dtype=np.float64),
+            rotations=np.array([p.rotation for p in pallets], dtype=np.int16),
+            positions=np.array([p.position for p in pallets], dtype=np.int64).reshape(-1, 3),
+            max_stack_weights=np.array(
+                [np.nan if p.max_stack_weight is None else p.max_stack_weight for p in pallets],
+                dtype=np.float64
+            ),
+            stackable=np.array([p.stackable for p in pallets], dtype=bool),
+            fragile=np.array([p.fragile for p in pallets], dtype=bool),
+            colors=np.array([p.color for p in pallets], dtype=object)
+        )
+
+    def to_pallets(self) -> List[Pallet]:
+        """
+        Odtwarza listę palet z tablicy kolumnowej.
+
+        Returns:
+            List[Pallet]: Lista palet w kolejności wierszy
+        """
+        return [
+            Pallet(
+                pallet_id=self.ids[i],
+                pallet_type=self.type_names[self.type_codes[i]],
+                length=int(self.dims[i, 0]),
+                width=int(self.dims[i, 1]),
+                height=int(self.dims[i, 2]),
+                weight=_as_number(self.weights[i]),
+                cargo_weight=_as_number(self.cargo_weights[i]),
+                max_stack_weight=None if np.isnan(self.max_stack_weights[i]) else _as_number(self.max_stack_weights[i]),
+                stackable=bool(self.stackable[i]),
+                fragile=bool(self.fragile[i]),
+                position=tuple(int(v) for v in self.positions[i]),
+                rotation=int(self.rotations[i]),
+                color=self.colors[i]
+            )
+            for i in range(len(self))
+        ]
+
+    def __len__(self) -> int:
+        """Zwraca liczbę palet."""
+        return len(self.ids)
+
+    @property
+    def rotated_dims(self) -> np.ndarray:
+        """Zwraca wymiary (N, 3) z uwzględnieniem rotacji (odpowiednik `Pallet.dimensions`)."""
+        rotated = self.dims.copy()
+        turned = self.rotations == 90
+        rotated[turned, 0] = self.dims[turned, 1]
+        rotated[turned, 1] = self.dims[turned, 0]
+        return rotated
+
+    @property
+    def boxes(self) -> np.ndarray:
+        """Zwraca prostopadłościany (N, 6): x, y, z, długość, szerokość, wysokość."""
+        return np.hstack((self.positions, self.rotated_dims)).astype(np.int64)
+
+    @property
+    def total_weights(self) -> np.ndarray:
+        """Zwraca całkowite masy palet wraz z ładunkiem (N,)."""
+        return self.weights + self.cargo_weights
+
+    @property
+    def volumes(self) -> np.ndarray:
+        """Zwraca objętości palet w mm³ (N,)."""
+        return np.prod(self.dims.astype(np.int64), axis=1)
+
+    def in_bounds(self, length: int, width: int, height: int) -> np.ndarray:
+        """
+        Sprawdza wektorowo, czy palety mieszczą się w naczepie o podanych wymiarach.
+
+        Returns:
+            np.ndarray: Maska (N,) - True dla palet mieszczących się w naczepie
+        """
+        boxes = self.boxes
+        limits = np.array([length, width, height])
+        return np.all(boxes[:, :3] >= 0, axis=1) & np.all(boxes[:, :3] + boxes[:, 3:] <= limits, axis=1)
+
+    def weight_distribution(self, length: int, width: int) -> Dict[str, float]:
+        """
+        Oblicza rozkład masy tak jak `Trailer._update_weight_distribution`, ale wektorowo.
+
+        Args:
+            length: Długość naczepy w mm
+            width: Szerokość naczepy w mm
+
+        Returns:
+            Dict[str, float]: Masy po lewej/prawej stronie, z przodu/tyłu oraz łączna
+        """
+        boxes = self.boxes
+        weights = self.total_weights
+        left = boxes[:, 1] + boxes[:, 4] / 2 < width / 2
+        front = boxes[:, 0] + boxes[:, 3] / 2 < length / 2
+        return {
+            "left": float(weights[left].sum()),
+            "right": float(weights[~left].sum()),
+            "front": float(weights[front].sum()),
+            "back": float(weights[~front].sum()),
+            "total": float(weights.sum())
+        }
+
+
+def _as_number(value: float):
+    """Zwraca wartość całkowitą, jeśli liczba nie ma części ułamkowej (jak w danych wejściowych)."""
+    value = float(value)
+    return int(value) if value.is_integer() else value
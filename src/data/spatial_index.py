@@ -0,0 +1,129 @@
+"""
+Moduł zawierający indeks przestrzenny palet przyspieszający wykrywanie kolizji.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.data.pallet import Pallet
+
+
+class SpatialIndex:
+    """
+    Jednorodna siatka kubełków wzdłuż osi X naczepy.
+
+    Każda paleta jest zapisywana we wszystkich kubełkach, na które zachodzi jej
+    rzut na oś X. Zapytanie o przedział [x, x + length) zwraca tylko palety
+    z sąsiednich kubełków, zamiast wszystkich załadowanych palet.
+
+    Attributes:
+        length: Długość indeksowanej przestrzeni w mm
+        bucket_size: Długość jednego kubełka w mm
+    """
+
+    def __init__(self, length: int, bucket_size: int = 1000):
+        """
+        Inicjalizuje pusty indeks przestrzenny.
+
+        Args:
+            length: Długość indeksowanej przestrzeni w mm
+            bucket_size: Długość jednego kubełka w mm
+        """
+        self.length = length
+        self.bucket_size = bucket_size
+        self._buckets: List[List[Pallet]] = [[] for _ in range(-(-length // bucket_size) or 1)]
+        self._ranges: Dict[int, Tuple[int, int]] = {}
+        self._pallets: Dict[int, Pallet] = {}
+        self._boxes: Optional[np.ndarray] = None
+
+    def insert(self, pallet: Pallet) -> None:
+        """Dodaje paletę do indeksu w jej bieżącej pozycji."""
+        first, last = self._bucket_range(pallet.position[0], pallet.dimensions[0])
+        self._ranges[id(pallet)] = (first, last)
+        self._pallets[id(pallet)] = pallet
+        self._boxes = None
+        for bucket in self._buckets[first:last + 1]:
+            bucket.append(pallet)
+
+    def remove(self, pallet: Pallet) -> None:
+        """Usuwa paletę z indeksu (z kubełków, do których została dodana)."""
+        first, last = self._ranges.pop(id(pallet))
+        del self._pallets[id(pallet)]
+        self._boxes = None
+        for bucket in self._buckets[first:last + 1]:
+            for i, indexed in enumerate(bucket):
+                if indexed is pallet:
+                    bucket.pop(i)
+                    break
+
+    def clear(self) -> None:
+        """Usuwa wszystkie palety z indeksu."""
+        for bucket in self._buckets:
+            bucket.clear()
+        self._ranges.clear()
+        self._pallets.clear()
+        self._boxes = None
+
+    def copy(self) -> 'SpatialIndex':
+        """Zwraca niezależną kopię indeksu (palety są współdzielone z oryginałem)."""
+        clone = SpatialIndex.__new__(SpatialIndex)
+        clone.length = self.length
+        clone.bucket_size = self.bucket_size
+        clone._buckets = [list(bucket) for bucket in self._buckets]
+        clone._ranges = dict(self._ranges)
+        clone._pallets = dict(self._pallets)
+        # Tablica jest zastępowana (nie modyfikowana) przy zmianie, więc można ją współdzielić
+        clone._boxes = self._boxes
+        return clone
+
+    def __getstate__(self) -> Dict:
+        """Zwraca stan do serializacji - klucze `id(pallet)` nie są ważne w innym procesie."""
+        state = self.__dict__.copy()
+        state["_ranges"] = [(self._pallets[key], bucket_range) for key, bucket_range in self._ranges.items()]
+        del state["_pallets"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """Odtwarza indeks po deserializacji, wyznaczając klucze od nowa."""
+        ranges = state.pop("_ranges")
+        self.__dict__.update(state)
+        self._ranges = {id(pallet): bucket_range for pallet, bucket_range in ranges}
+        self._pallets = {id(pallet): pallet for pallet, _ in ranges}
+
+    def boxes(self) -> np.ndarray:
+        """
+        Zwraca prostopadłościany wszystkich palet w indeksie jako tablicę (M, 6).
+
+        Tablica jest budowana ponownie tylko po zmianie zawartości indeksu, więc
+        seria wektorowych testów kolizji między zmianami korzysta z tej samej kopii.
+        """
+        if self._boxes is None:
+            self._boxes = np.array(
+                [pallet.box for pallet in self._pallets.values()], dtype=np.int64
+            ).reshape(-1, 6)
+        return self._boxes
+
+    def query(self, x: int, length: int) -> List[Pallet]:
+        """
+        Zwraca palety, których kubełki zachodzą na przedział [x, x + length).
+
+        Wynik jest nadzbiorem palet faktycznie przecinających przedział, więc
+        wywołujący nadal musi wykonać dokładny test kolizji.
+        """
+        first, last = self._bucket_range(x, length)
+        if first == last:
+            return self._buckets[first]
+
+        nearby = {}
+        for bucket in self._buckets[first:last + 1]:
+            for pallet in bucket:
+                nearby[id(pallet)] = pallet
+        return list(nearby.values())
+
+    def _bucket_range(self, x: int, length: int) -> Tuple[int, int]:
+        """Zwraca indeksy pierwszego i ostatniego kubełka dla przedziału [x, x + length)."""
+        last_bucket = len(self._buckets) - 1
+        first = min(max(x // self.bucket_size, 0), last_bucket)
+        last = min(max((x + max(length, 1) - 1) // self.bucket_size, 0), last_bucket)
+        return first, last
@@ -3,10 +3,14 @@ Moduł zawierający definicję klasy Trailer do reprezentacji naczepy transporto
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
-from src.data.pallet import Pallet
+from src.data.pallet import Pallet, boxes_collide
+from src.data.spatial_index import SpatialIndex
+from src.data.corner_points import CornerPoints
+from src.data.max_rects import MaxRects
 from src.config import TRAILER_CONFIG, CONSTRAINTS
 
 
@@ -21,7 +25,7 @@ class Trailer:
         height: Wysokość naczepy w mm
         max_load: Maksymalna masa ładunku w kg
         loaded_pallets: Lista załadowanych palet
-        space_map: Trójwymiarowa macierz reprezentująca zajętość przestrzeni
+        height_map: Dwuwymiarowa mapa wysokości górnej powierzchni ładunku (w mm)
         weight_distribution: Rozkład masy w naczepie
     """
 
@@ -30,32 +34,43 @@ class Trailer:
     height: int = TRAILER_CONFIG["height"]
     max_load: int = TRAILER_CONFIG["max_load"]
     loaded_pallets: List[Pallet] = field(default_factory=list)
-    space_map: Optional[np.ndarray] = None
+    height_map: Optional[np.ndarray] = None
     weight_distribution: Dict[str, float] = field(default_factory=dict)
 
     def __post_init__(self):
-        """Inicjalizacja mapy przestrzeni i rozkładu masy."""
-        # Inicjalizacja mapy przestrzeni (0 = wolne, 1 = zajęte)
-        # Używamy nizskiej rozdzielczości dla efektywności (1 jednostka = 100mm)
+        """Inicjalizacja mapy wysokości i rozkładu masy."""
+        # Mapa wysokości: każda komórka (1 jednostka = 100mm) przechowuje wysokość
+        # górnej powierzchni ładunku w mm (0 = wolna podłoga)
         self.resolution = 100  # mm
-        self.space_map = np.zeros((
-            self.length // self.resolution + 1,
-            self.width // self.resolution + 1,
-            self.height // self.resolution + 1
-        ), dtype=np.int8)
+        self.height_map = self._empty_height_map()
         
-        # Inicjalizacja rozkładu masy
-        self.weight_distribution = {
-            "left": 0.0,    # Lewa strona naczepy
-            "right": 0.0,   # Prawa strona naczepy
-            "front": 0.0,   # Przód naczepy
-            "back": 0.0,    # Tył naczepy
-            "total": 0.0    # Łączna masa załadunku
-        }
+        # Indeks przestrzenny palet wzdłuż osi X (do szybkiego wykrywania kolizji)
+        self._spatial_index = SpatialIndex(self.length)
+        
+        # Krawędzie palet wyznaczające punkty narożne na podłodze
+        self._corner_points = CornerPoints(self.length, self.width)
+        
+        # Wolna powierzchnia podłogi jako prostokąty maksymalne (odtwarzane leniwie po usunięciu palety)
+        self._max_rects = MaxRects(self.length, self.width)
+        self._max_rects_stale = False
+        
+        for pallet in self.loaded_pallets:
+            self._index_pallet(pallet)
+        
+        # Stała objętość naczepy (mianownik metryk efektywności)
+        self._trailer_volume = self.length * self.width * self.height
+        
+        # Inicjalizacja rozkładu masy i sum bieżących (masa, objętość)
+        self._update_weight_distribution()
+        
+        # Dziennik cofania operacji i aktywne punkty kontrolne: token -> długość dziennika (checkpoint/rollback)
+        self._undo_log: List[tuple] = []
+        self._checkpoints: Dict[int, int] = {}
+        self._next_checkpoint = 0
 
     def add_pallet(self, pallet: Pallet) -> bool:
         """
-        Dodaje paletę do naczepy i aktualizuje mapę przestrzeni.
+        Dodaje paletę do naczepy i aktualizuje mapę wysokości.
         
         Args:
             pallet: Paleta do dodania
@@ -75,20 +90,65 @@ class Trailer:
         if self._current_load() + pallet.total_weight > self.max_load:
             return False
         
-        # Aktualizacja mapy przestrzeni
-        self._update_space_map(pallet, 1)  # 1 = zajęte
+        # Zapis stanu w dzienniku cofania (tylko przy aktywnym punkcie kontrolnym)
+        if self._checkpoints:
+            self._log_undo("add", pallet, len(self.loaded_pallets))
         
         # Dodaj paletę do listy
         self.loaded_pallets.append(pallet)
         
-        # Aktualizacja rozkładu masy
-        self._update_weight_distribution()
+        # Aktualizacja mapy wysokości i indeksu przestrzennego
+        self._index_pallet(pallet)
+        
+        # Przyrostowa aktualizacja rozkładu masy
+        self._accumulate_weight(pallet, 1)
         
         return True
 
+    def add_pallets(self, pallets: List[Pallet]) -> bool:
+        """
+        Dodaje do naczepy grupę palet z ustalonymi pozycjami (np. z zapisanego planu).
+
+        Granice, kolizje (z ładunkiem i wewnątrz grupy) i ładowność są sprawdzane
+        jednym testem wektorowym dla całej grupy, a prostokąty maksymalne są
+        odtwarzane dopiero przy następnym zapytaniu o wolne miejsce.
+
+        Args:
+            pallets: Palety do dodania
+
+        Returns:
+            bool: True jeśli dodano wszystkie palety; False (bez zmian w naczepie), jeśli którakolwiek się nie mieści
+        """
+        if not pallets:
+            return True
+
+        boxes = np.array([p.box for p in pallets], dtype=np.int64)
+        limits = np.array([self.length, self.width, self.height])
+        if not (np.all(boxes[:, :3] >= 0) and np.all(boxes[:, :3] + boxes[:, 3:] <= limits)):
+            return False
+
+        if self._current_load() + sum(p.total_weight for p in pallets) > self.max_load:
+            return False
+
+        # Kolizje z ładunkiem naczepy i między paletami grupy (bez par palety z samą sobą)
+        within_group = boxes_collide(boxes, boxes)
+        np.fill_diagonal(within_group, False)
+        if self._boxes_collide(boxes).any() or within_group.any():
+            return False
+
+        self._max_rects_stale = True
+        for pallet in pallets:
+            if self._checkpoints:
+                self._log_undo("add", pallet, len(self.loaded_pallets))
+            self.loaded_pallets.append(pallet)
+            self._index_pallet(pallet)
+            self._accumulate_weight(pallet, 1)
+
+        return True
+
     def remove_pallet(self, pallet_id: str) -> bool:
         """
-        Usuwa paletę z naczepy i aktualizuje mapę przestrzeni.
+        Usuwa paletę z naczepy i aktualizuje mapę wysokości.
         
         Args:
             pallet_id: ID palety do usunięcia
@@ -99,19 +159,152 @@ class Trailer:
         # Znajdź paletę po ID
         for i, pallet in enumerate(self.loaded_pallets):
             if pallet.pallet_id == pallet_id:
-                # Aktualizacja mapy przestrzeni
-                self._update_space_map(pallet, 0)  # 0 = wolne
+                # Zapis stanu w dzienniku cofania (tylko przy aktywnym punkcie kontrolnym)
+                if self._checkpoints:
+                    self._log_undo("remove", pallet, i)
                 
                 # Usuń paletę z listy
                 self.loaded_pallets.pop(i)
                 
-                # Aktualizacja rozkładu masy
-                self._update_weight_distribution()
+                # Aktualizacja mapy wysokości i indeksu przestrzennego
+                self._unindex_pallet(pallet)
+                
+                # Przyrostowa aktualizacja rozkładu masy (pusta naczepa - dokładne zera)
+                if self.loaded_pallets:
+                    self._accumulate_weight(pallet, -1)
+                else:
+                    self._update_weight_distribution()
                 
                 return True
         
         return False
 
+    def can_place(self, pallet: Pallet, x: int, y: int, z: int = 0, rotation: Optional[int] = None) -> bool:
+        """
+        Sprawdza, czy paleta zmieści się w podanej pozycji, bez tworzenia obiektów tymczasowych.
+        
+        Args:
+            pallet: Paleta do umieszczenia (jej pozycja i rotacja nie są zmieniane)
+            x, y, z: Badana pozycja palety
+            rotation: Badana rotacja (domyślnie bieżąca rotacja palety)
+            
+        Returns:
+            bool: True jeśli paleta mieści się w naczepie i nie koliduje z innymi paletami
+        """
+        if rotation is None:
+            rotation = pallet.rotation
+        
+        if rotation == 0:
+            length, width = pallet.length, pallet.width
+        else:  # 90 stopni
+            length, width = pallet.width, pallet.length
+        
+        if (x < 0 or y < 0 or z < 0 or x + length > self.length or
+                y + width > self.width or z + pallet.height > self.height):
+            return False
+        
+        return not self._box_collides(x, y, z, length, width, pallet.height)
+
+    def checkpoint(self) -> int:
+        """
+        Tworzy punkt kontrolny, do którego można później wrócić metodą `rollback`.
+        
+        Od tej chwili `add_pallet` i `remove_pallet` zapisują w dzienniku cofania
+        tylko paletę i zmieniony fragment mapy wysokości, więc cofnięcie ruchu
+        kosztuje O(rozmiar podstawy) zamiast odtwarzania całego załadunku.
+        
+        Returns:
+            int: Token punktu kontrolnego
+        """
+        token = self._next_checkpoint
+        self._next_checkpoint += 1
+        self._checkpoints[token] = len(self._undo_log)
+        return token
+
+    def rollback(self, token: int) -> None:
+        """
+        Cofa wszystkie operacje wykonane po utworzeniu punktu kontrolnego.
+        
+        Punkt kontrolny pozostaje aktywny (można do niego wracać wielokrotnie),
+        a punkty utworzone później są usuwane.
+        
+        Args:
+            token: Token zwrócony przez `checkpoint`
+            
+        Raises:
+            ValueError: Gdy token nie odpowiada aktywnemu punktowi kontrolnemu
+        """
+        if token not in self._checkpoints:
+            raise ValueError(f"Nieznany punkt kontrolny: {token}")
+        
+        while len(self._undo_log) > self._checkpoints[token]:
+            action, pallet, index, cells, heights, free_rects, position, rotation = self._undo_log.pop()
+            
+            if action == "add":
+                self.loaded_pallets.pop(index)
+                self._spatial_index.remove(pallet)
+                self._corner_points.remove(*pallet.position[:2], *pallet.footprint)
+                if self.loaded_pallets:
+                    self._accumulate_weight(pallet, -1)
+                else:
+                    self._update_weight_distribution()
+            else:
+                # Paleta mogła zostać przestawiona po usunięciu - przywracamy jej ułożenie
+                pallet.position = position
+                pallet.rotation = rotation
+                self.loaded_pallets.insert(index, pallet)
+                self._spatial_index.insert(pallet)
+                self._corner_points.insert(*pallet.position[:2], *pallet.footprint)
+                self._accumulate_weight(pallet, 1)
+            
+            self.height_map[cells] = heights
+            if free_rects is None:
+                self._max_rects_stale = True
+            else:
+                self._max_rects.free_rects = free_rects
+                self._max_rects_stale = False
+        
+        self._checkpoints = {
+            checkpoint: position for checkpoint, position in self._checkpoints.items() if checkpoint <= token
+        }
+
+    def release(self, token: int) -> None:
+        """
+        Zatwierdza zmiany od punktu kontrolnego i przestaje go śledzić.
+        
+        Pozostałe punkty kontrolne (także wcześniejsze) pozostają aktywne. Gdy nie
+        pozostał żaden aktywny punkt kontrolny, dziennik cofania jest czyszczony.
+        
+        Args:
+            token: Token zwrócony przez `checkpoint`
+        """
+        self._checkpoints.pop(token, None)
+        if not self._checkpoints:
+            self._undo_log.clear()
+
+    def copy(self) -> 'Trailer':
+        """
+        Zwraca niezależną kopię stanu naczepy bez odtwarzania załadunku.
+        
+        Kopiowane są listy, mapa wysokości i struktury pomocnicze, natomiast obiekty
+        palet są współdzielone z oryginałem (nie należy ich przestawiać w żadnej
+        z kopii). Kopia nie ma aktywnych punktów kontrolnych.
+        
+        Returns:
+            Trailer: Kopia naczepy
+        """
+        clone = Trailer.__new__(Trailer)
+        clone.__dict__.update(self.__dict__)
+        clone.loaded_pallets = list(self.loaded_pallets)
+        clone.height_map = self.height_map.copy()
+        clone.weight_distribution = dict(self.weight_distribution)
+        clone._spatial_index = self._spatial_index.copy()
+        clone._corner_points = self._corner_points.copy()
+        clone._max_rects = self._max_rects.copy()
+        clone._undo_log = []
+        clone._checkpoints = {}
+        return clone
+
     def get_loading_efficiency(self) -> Dict[str, float]:
         """
         Zwraca metryki efektywności załadunku.
@@ -119,11 +312,9 @@ class Trailer:
         Returns:
             Dict: Słownik zawierający różne metryki efektywności
         """
-        # Obliczanie objętości wszystkich palet
-        total_pallet_volume = sum(pallet.volume for pallet in self.loaded_pallets)
-        
-        # Obliczanie całkowitej objętości naczepy
-        trailer_volume = self.length * self.width * self.height
+        # Objętość wszystkich palet i naczepy (sumy utrzymywane przyrostowo)
+        total_pallet_volume = self._total_volume
+        trailer_volume = self._trailer_volume
         
         # Obliczanie wykorzystania przestrzeni
         space_utilization = total_pallet_volume / trailer_volume * 100 if trailer_volume > 0 else 0
@@ -174,60 +365,281 @@ class Trailer:
         
         Args:
             pallet: Paleta do umieszczenia
+            stacking: Czy dopuszczać pozycje na innych paletach (z > 0)
             
         Returns:
             List: Lista dostępnych pozycji (x, y, z)
         """
-        available_positions = []
+        return [tuple(position) for position in self.get_available_positions_array(pallet, stacking).tolist()]
+
+    def get_available_positions_array(self, pallet: Pallet, stacking: bool = True) -> np.ndarray:
+        """
+        Zwraca tablicę dostępnych pozycji dla palety (wektorowo, bez pętli po siatce).
+        
+        Pozycje są badane w siatce co `resolution` mm, w tej samej kolejności co
+        w `get_available_positions` (rosnąco po x, następnie po y).
         
-        # Wymiary palety
+        Args:
+            pallet: Paleta do umieszczenia
+            stacking: Czy dopuszczać pozycje na innych paletach (z > 0)
+            
+        Returns:
+            np.ndarray: Tablica o kształcie (N, 3) z pozycjami (x, y, z)
+        """
         pallet_length, pallet_width, pallet_height = pallet.dimensions
         
-        # Przeszukiwanie przestrzeni naczepy
-        for x in range(0, self.length - pallet_length + 1, self.resolution):
-            for y in range(0, self.width - pallet_width + 1, self.resolution):
-                # Znajdź najniższą możliwą wysokość z
-                z = self._find_lowest_available_height(x, y, pallet_length, pallet_width)
-                
-                if z is not None and z + pallet_height <= self.height:
-                    # Sprawdź, czy przestrzeń jest dostępna
-                    temp_pallet = Pallet(
-                        pallet_id=pallet.pallet_id,
-                        pallet_type=pallet.pallet_type,
-                        length=pallet.length,
-                        width=pallet.width,
-                        height=pallet.height,
-                        weight=pallet.weight,
-                        cargo_weight=pallet.cargo_weight,
-                        position=(x, y, z),
-                        rotation=pallet.rotation
-                    )
-                    if not stacking and z > 0:
-                        # Jeśli nie chcemy piętrować, sprawdź, czy z > 0
-                        continue
-                    
-                    if not self._check_collision(temp_pallet):
-                        available_positions.append((x, y, z))
-
-        
-        return available_positions
+        # Najniższa możliwa wysokość z dla każdego punktu siatki
+        lowest = self._lowest_heights_on_grid(pallet_length, pallet_width)
+        
+        # Paleta położona na najwyższym punkcie pod podstawą nie koliduje z żadną inną,
+        # wystarczy więc sprawdzić wysokość naczepy
+        mask = lowest + pallet_height <= self.height
+        if not stacking:
+            mask &= lowest == 0
+        
+        x_idx, y_idx = np.nonzero(mask)
+        return np.column_stack((
+            x_idx * self.resolution,
+            y_idx * self.resolution,
+            lowest[x_idx, y_idx]
+        )).astype(np.int64)
+
+    def get_corner_points(self, pallet: Pallet, x_range: Optional[Tuple[int, int]] = None,
+                          y_range: Optional[Tuple[int, int]] = None,
+                          from_back: bool = False) -> List[Tuple[int, int, int]]:
+        """
+        Zwraca dostępne pozycje palety na podłodze w punktach narożnych.
+        
+        Args:
+            pallet: Paleta do umieszczenia (z bieżącą rotacją)
+            x_range: Zakres (początek, koniec) osi X, w którym musi się zmieścić paleta
+            y_range: Zakres (początek, koniec) osi Y, w którym musi się zmieścić paleta
+            from_back: Czy pozycje mają być uporządkowane od tyłu naczepy
+            
+        Returns:
+            List: Lista pozycji (x, y, 0) w kolejności zwracanej przez `iter_corner_points`
+        """
+        length, width, height = pallet.dimensions
+        x_min, x_max = x_range if x_range is not None else (0, self.length)
+        y_min, y_max = y_range if y_range is not None else (0, self.width)
+        x_max = min(x_max, self.length)
+        y_max = min(y_max, self.width)
+        if height > self.height:
+            return []
+        
+        # Ci sami kandydaci co w `iter_corner_points`, sprawdzeni jednym testem wektorowym
+        xs = set(self._corner_points.x_candidates(length, from_back))
+        xs.add(x_max - length if from_back else x_min)
+        xs = sorted((x for x in xs if x_min <= x and x + length <= x_max), reverse=from_back)
+        ys = set(self._corner_points.y_candidates())
+        ys.add(y_min)
+        ys = sorted(y for y in ys if y_min <= y <= y_max - width)
+        
+        positions = self._free_floor_positions(xs, ys, length, width, height)
+        return [(int(x), int(y), 0) for x, y in positions]
+
+    def iter_corner_points(self, pallet: Pallet, x_range: Optional[Tuple[int, int]] = None,
+                           y_range: Optional[Tuple[int, int]] = None,
+                           from_back: bool = False) -> Iterator[Tuple[int, int, int]]:
+        """
+        Generuje dostępne pozycje palety na podłodze w punktach narożnych.
+        
+        Zamiast przeszukiwać siatkę co 100 mm, sprawdzane są tylko pozycje, w których
+        paleta opiera się o ścianę lub krawędź innej palety (także poza siatką).
+        Pozycje są generowane leniwie, od przodu naczepy (rosnąco po x, następnie po y)
+        lub od tyłu (malejąco po x, rosnąco po y), więc pierwsza z nich odpowiada
+        dosunięciu palety do przodu (tyłu) i do lewej ściany.
+        
+        Args:
+            pallet: Paleta do umieszczenia (z bieżącą rotacją)
+            x_range: Zakres (początek, koniec) osi X, w którym musi się zmieścić paleta
+            y_range: Zakres (początek, koniec) osi Y, w którym musi się zmieścić paleta
+            from_back: Czy pozycje mają być generowane od tyłu naczepy
+            
+        Yields:
+            Tuple[int, int, int]: Dostępna pozycja (x, y, 0)
+        """
+        length, width, height = pallet.dimensions
+        x_min, x_max = x_range if x_range is not None else (0, self.length)
+        y_min, y_max = y_range if y_range is not None else (0, self.width)
+        x_max = min(x_max, self.length)
+        y_max = min(y_max, self.width)
+        if height > self.height:
+            return
+        
+        # Granice zakresu również są ścianami, o które można oprzeć paletę
+        xs = set(self._corner_points.x_candidates(length, from_back))
+        xs.add(x_max - length if from_back else x_min)
+        ys = set(self._corner_points.y_candidates())
+        ys.add(y_min)
+        ys = sorted(y for y in ys if y_min <= y <= y_max - width)
+        
+        for x in sorted(xs, reverse=from_back):
+            if x < x_min or x + length > x_max:
+                continue
+            for y in ys:
+                if not self._box_collides(x, y, 0, length, width, height):
+                    yield (x, y, 0)
+
+    def free_grid_positions(self, pallet: Pallet, x_range: Optional[Tuple[int, int]] = None,
+                            y_range: Optional[Tuple[int, int]] = None,
+                            step: Optional[int] = None) -> np.ndarray:
+        """
+        Zwraca wolne pozycje palety na podłodze w węzłach siatki.
+        
+        Wszystkie węzły siatki są sprawdzane jednym wektorowym testem kolizji
+        z załadowanymi paletami, zamiast osobnego sprawdzenia dla każdego węzła.
+        
+        Args:
+            pallet: Paleta do umieszczenia (z bieżącą rotacją)
+            x_range: Zakres (początek, koniec) osi X, w którym musi się zmieścić paleta
+            y_range: Zakres (początek, koniec) osi Y, w którym musi się zmieścić paleta
+            step: Krok siatki w mm (domyślnie rozdzielczość mapy wysokości)
+            
+        Returns:
+            np.ndarray: Tablica (K, 2) wolnych pozycji (x, y), rosnąco po x, następnie po y
+        """
+        if step is None:
+            step = self.resolution
+        
+        length, width, height = pallet.dimensions
+        x_min, x_max = x_range if x_range is not None else (0, self.length)
+        y_min, y_max = y_range if y_range is not None else (0, self.width)
+        x_max = min(x_max, self.length)
+        y_max = min(y_max, self.width)
+        if height > self.height:
+            return np.empty((0, 2), dtype=np.int64)
+        
+        xs = np.arange(x_min, x_max - length + 1, step)
+        ys = np.arange(y_min, y_max - width + 1, step)
+        return self._free_floor_positions(xs, ys, length, width, height)
+
+    def free_floor_positions(self, pallet: Pallet, xs: Iterable[int], ys: Iterable[int]) -> np.ndarray:
+        """
+        Zwraca wolne pozycje palety na podłodze spośród podanych współrzędnych x i y.
+
+        Pozycje z iloczynu kartezjańskiego xs i ys mieszczące się w naczepie
+        są sprawdzane jednym wektorowym testem kolizji z załadowanymi paletami.
+
+        Args:
+            pallet: Paleta do umieszczenia (z bieżącą rotacją)
+            xs: Badane współrzędne x
+            ys: Badane współrzędne y
+
+        Returns:
+            np.ndarray: Tablica (K, 2) wolnych pozycji (x, y) w kolejności xs, następnie ys
+        """
+        length, width, height = pallet.dimensions
+        if height > self.height:
+            return np.empty((0, 2), dtype=np.int64)
+
+        xs = [x for x in xs if 0 <= x and x + length <= self.length]
+        ys = [y for y in ys if 0 <= y and y + width <= self.width]
+        return self._free_floor_positions(xs, ys, length, width, height)
+
+    def iter_grid_positions(self, pallet: Pallet, from_back: bool = False,
+                            step: Optional[int] = None, chunk_length: int = 1000) -> Iterator[Tuple[int, int, int]]:
+        """
+        Generuje wolne pozycje palety na podłodze w węzłach siatki, leniwie i w zadanej kolejności.
+        
+        Siatka jest przeglądana od przodu naczepy (rosnąco po x, następnie po y) lub od
+        tyłu (malejąco po x, rosnąco po y), pasami o długości `chunk_length`. Każdy pas
+        jest sprawdzany jednym wektorowym testem kolizji, a kolejne pasy są badane dopiero
+        wtedy, gdy wywołujący poprosi o następną pozycję - `next(...)` kończy się więc na
+        pierwszym pasie zawierającym wolne miejsce.
+        
+        Args:
+            pallet: Paleta do umieszczenia (z bieżącą rotacją)
+            from_back: Czy pozycje mają być generowane od tyłu naczepy
+            step: Krok siatki w mm (domyślnie rozdzielczość mapy wysokości)
+            chunk_length: Długość pasa siatki sprawdzanego jednym testem w mm
+            
+        Yields:
+            Tuple[int, int, int]: Wolna pozycja (x, y, 0)
+        """
+        if step is None:
+            step = self.resolution
+        
+        length, width, height = pallet.dimensions
+        if height > self.height:
+            return
+        
+        xs = np.arange(0, self.length - length + 1, step)
+        if from_back:
+            xs = xs[::-1]
+        ys = np.arange(0, self.width - width + 1, step)
+        
+        columns_per_chunk = max(chunk_length // step, 1)
+        for start in range(0, len(xs), columns_per_chunk):
+            chunk = xs[start:start + columns_per_chunk]
+            for x, y in self._free_floor_positions(chunk, ys, length, width, height):
+                yield (int(x), int(y), 0)
+
+    def find_free_space_position(self, pallet: Pallet, heuristic: str = "bottom_left",
+                                 x_range: Optional[Tuple[int, int]] = None,
+                                 y_range: Optional[Tuple[int, int]] = None,
+                                 from_back: bool = False,
+                                 target_y: Optional[float] = None) -> Optional[Tuple[int, int, int]]:
+        """
+        Znajduje pozycję palety na podłodze na podstawie wolnych prostokątów maksymalnych.
+        
+        Args:
+            pallet: Paleta do umieszczenia (z bieżącą rotacją)
+            heuristic: Heurystyka wyboru pozycji ("bottom_left", "best_short_side", "closest_y")
+            x_range: Zakres (początek, koniec) osi X, w którym musi się zmieścić paleta
+            y_range: Zakres (początek, koniec) osi Y, w którym musi się zmieścić paleta
+            from_back: Czy dosuwać paletę do tyłu naczepy
+            target_y: Docelowa współrzędna Y środka palety (dla heurystyki "closest_y")
+            
+        Returns:
+            Optional[Tuple[int, int, int]]: Pozycja (x, y, 0) lub None, jeśli nie znaleziono miejsca
+        """
+        length, width, height = pallet.dimensions
+        if height > self.height:
+            return None
+        
+        if self._max_rects_stale:
+            self._rebuild_max_rects()
+        position = self._max_rects.find_position(
+            length, width, heuristic, x_range, y_range, from_back, target_y
+        )
+        if position is None:
+            return None
+        return (position[0], position[1], 0)
+
+    def get_loading_meters(self) -> float:
+        """Zwraca liczbę metrów ładunkowych (LDM), tj. długość zajętą od przodu naczepy w m."""
+        return self._corner_points.x_candidates(0)[-1] / 1000
+
+    def set_loaded_pallets(self, pallets: List[Pallet]) -> None:
+        """
+        Zastępuje załadunek podanymi paletami, bez sprawdzania ich ułożenia.
+
+        Odtwarza mapę wysokości, struktury pomocnicze i sumy bieżące (rozkład masy,
+        objętość), z których korzystają metryki naczepy. Służy do oceny gotowych
+        planów - bezpośrednie przypisanie `loaded_pallets` tych struktur nie aktualizuje.
+
+        Args:
+            pallets: Palety z przypisanymi pozycjami i rotacjami
+        """
+        pallets = list(pallets)
+        self.reset()
+        self.loaded_pallets = pallets
+        for pallet in pallets:
+            self._index_pallet(pallet)
+        self._update_weight_distribution()
 
     def reset(self) -> None:
         """Resetuje naczepę do stanu początkowego."""
         self.loaded_pallets = []
-        self.space_map = np.zeros((
-            self.length // self.resolution + 1,
-            self.width // self.resolution + 1,
-            self.height // self.resolution + 1
-        ), dtype=np.int8)
-        
-        self.weight_distribution = {
-            "left": 0.0,
-            "right": 0.0,
-            "front": 0.0,
-            "back": 0.0,
-            "total": 0.0
-        }
+        self.height_map = self._empty_height_map()
+        self._spatial_index.clear()
+        self._corner_points.clear()
+        self._max_rects.reset()
+        self._max_rects_stale = False
+        self._update_weight_distribution()
+        self._undo_log.clear()
+        self._checkpoints.clear()
 
     def _check_bounds(self, pallet: Pallet) -> bool:
         """Sprawdza, czy paleta mieści się w granicach naczepy."""
@@ -242,34 +654,154 @@ class Trailer:
 
     def _check_collision(self, pallet: Pallet) -> bool:
         """Sprawdza, czy paleta koliduje z innymi paletami."""
-        for loaded_pallet in self.loaded_pallets:
-            if pallet.collides_with(loaded_pallet):
+        return bool(pallet.collides_with_many(self._spatial_index.boxes()).any())
+
+    def _boxes_collide(self, boxes: np.ndarray) -> np.ndarray:
+        """
+        Sprawdza wektorowo, które z N prostopadłościanów (N, 6) kolidują z paletami.
+        
+        Returns:
+            np.ndarray: Maska (N,) - True dla prostopadłościanów kolidujących z ładunkiem
+        """
+        placed = self._spatial_index.boxes()
+        if len(placed) == 0:
+            return np.zeros(len(boxes), dtype=bool)
+        return boxes_collide(boxes, placed).any(axis=1)
+
+    def _free_floor_positions(self, xs, ys, length: int, width: int, height: int) -> np.ndarray:
+        """Zwraca wolne pozycje (x, y) na podłodze z iloczynu kartezjańskiego xs i ys (w tej kolejności)."""
+        grid_x, grid_y = np.meshgrid(np.asarray(xs, dtype=np.int64), np.asarray(ys, dtype=np.int64), indexing="ij")
+        positions = np.column_stack((grid_x.ravel(), grid_y.ravel()))
+        if len(positions) == 0:
+            return positions
+        
+        boxes = np.zeros((len(positions), 6), dtype=np.int64)
+        boxes[:, :2] = positions
+        boxes[:, 3:] = (length, width, height)
+        return positions[~self._boxes_collide(boxes)]
+
+    def _box_collides(self, x: int, y: int, z: int, length: int, width: int, height: int) -> bool:
+        """Sprawdza, czy prostopadłościan o podanej pozycji i wymiarach koliduje z paletami."""
+        # Sprawdzamy tylko palety z sąsiednich kubełków indeksu przestrzennego
+        for loaded_pallet in self._spatial_index.query(x, length):
+            ox, oy, oz = loaded_pallet.position
+            ol, ow, oh = loaded_pallet.dimensions
+            if (x < ox + ol and x + length > ox and
+                    y < oy + ow and y + width > oy and
+                    z < oz + oh and z + height > oz):
                 return True
         return False
 
-    def _update_space_map(self, pallet: Pallet, value: int) -> None:
-        """Aktualizuje mapę przestrzeni dla podanej palety."""
-        x, y, z = pallet.position
-        length, width, height = pallet.dimensions
-        
-        # Konwersja do indeksów mapy przestrzeni
-        x_start = x // self.resolution
-        y_start = y // self.resolution
-        z_start = z // self.resolution
+    def _empty_height_map(self) -> np.ndarray:
+        """Tworzy pustą mapę wysokości obejmującą całą podłogę naczepy."""
+        return np.zeros((
+            -(-self.length // self.resolution),
+            -(-self.width // self.resolution)
+        ), dtype=np.int32)
+
+    def _footprint_cells(self, pallet: Pallet) -> Tuple[slice, slice]:
+        """Zwraca zakres komórek mapy wysokości przykrytych przez podstawę palety."""
+        x, y, _ = pallet.position
+        length, width, _ = pallet.dimensions
+        return self._cells(x, y, length, width)
+
+    def _cells(self, x: int, y: int, length: int, width: int) -> Tuple[slice, slice]:
+        """Zwraca zakres komórek mapy wysokości przykrytych przez prostokąt na podłodze."""
+        # Komórka jest przykryta, jeśli prostokąt zachodzi na nią choćby częściowo
+        return (
+            slice(x // self.resolution, -(-(x + length) // self.resolution)),
+            slice(y // self.resolution, -(-(y + width) // self.resolution))
+        )
+
+    def _lowest_heights_on_grid(self, length: int, width: int) -> np.ndarray:
+        """
+        Zwraca najniższą dostępną wysokość dla każdego punktu siatki co `resolution` mm.
         
-        x_end = (x + length) // self.resolution + 1
-        y_end = (y + width) // self.resolution + 1
-        z_end = (z + height) // self.resolution + 1
+        Element [i, j] odpowiada pozycji (i * resolution, j * resolution). Maksimum
+        w oknie o rozmiarze podstawy liczone jest osobno wzdłuż osi X i Y.
+        """
+        x_count = (self.length - length) // self.resolution + 1
+        y_count = (self.width - width) // self.resolution + 1
+        if length <= 0 or width <= 0 or x_count <= 0 or y_count <= 0:
+            return np.zeros((0, 0), dtype=self.height_map.dtype)
         
-        # Ustaw zajętość w mapie przestrzeni
-        x_end = min(x_end, self.space_map.shape[0])
-        y_end = min(y_end, self.space_map.shape[1])
-        z_end = min(z_end, self.space_map.shape[2])
+        x_window = -(-length // self.resolution)
+        y_window = -(-width // self.resolution)
         
-        self.space_map[x_start:x_end, y_start:y_end, z_start:z_end] = value
+        lowest = sliding_window_view(self.height_map, x_window, axis=0).max(axis=-1)
+        lowest = sliding_window_view(lowest, y_window, axis=1).max(axis=-1)
+        return lowest[:x_count, :y_count]
+
+    def _log_undo(self, action: str, pallet: Pallet, index: int) -> None:
+        """Zapisuje w dzienniku cofania stan naruszany przez dodanie lub usunięcie palety."""
+        cells = self._footprint_cells(pallet)
+        self._undo_log.append((
+            action,
+            pallet,
+            index,
+            cells,
+            self.height_map[cells].copy(),
+            # MaxRects podmienia listę przy każdej zmianie, więc wystarczy referencja (None - nieaktualne)
+            None if self._max_rects_stale else self._max_rects.free_rects,
+            pallet.position,
+            pallet.rotation
+        ))
+
+    def _index_pallet(self, pallet: Pallet) -> None:
+        """Uwzględnia paletę w mapie wysokości, indeksie przestrzennym i punktach narożnych."""
+        self._raise_height_map(pallet)
+        self._spatial_index.insert(pallet)
+        self._corner_points.insert(*pallet.position[:2], *pallet.footprint)
+        if not self._max_rects_stale:
+            self._max_rects.place(*pallet.position[:2], *pallet.footprint)
+
+    def _unindex_pallet(self, pallet: Pallet) -> None:
+        """Usuwa paletę ze struktur pomocniczych i odtwarza mapę wysokości pod nią."""
+        self._spatial_index.remove(pallet)
+        self._rebuild_height_map(*self._footprint_cells(pallet))
+        self._corner_points.remove(*pallet.position[:2], *pallet.footprint)
+        
+        # Prostokątów maksymalnych nie da się scalić - zostaną odtworzone przy następnym zapytaniu,
+        # więc seria usunięć i dodań (np. ruchy poprawiające plan) nie odtwarza ich za każdym razem
+        self._max_rects_stale = True
+
+    def _rebuild_max_rects(self) -> None:
+        """Odtwarza prostokąty maksymalne z załadowanych palet."""
+        self._max_rects.reset()
+        for loaded_pallet in self.loaded_pallets:
+            self._max_rects.place(*loaded_pallet.position[:2], *loaded_pallet.footprint)
+        self._max_rects_stale = False
+
+    def _raise_height_map(self, pallet: Pallet) -> None:
+        """Podnosi mapę wysokości do górnej powierzchni dodanej palety."""
+        x_cells, y_cells = self._footprint_cells(pallet)
+        top = pallet.position[2] + pallet.dimensions[2]
+        np.maximum(self.height_map[x_cells, y_cells], top, out=self.height_map[x_cells, y_cells])
+
+    def _rebuild_height_map(self, x_cells: slice, y_cells: slice) -> None:
+        """Odtwarza fragment mapy wysokości na podstawie załadowanych palet."""
+        self.height_map[x_cells, y_cells] = 0
+        nearby = self._spatial_index.query(
+            x_cells.start * self.resolution,
+            (x_cells.stop - x_cells.start) * self.resolution
+        )
+        for pallet in nearby:
+            px_cells, py_cells = self._footprint_cells(pallet)
+            # Część wspólna fragmentu i podstawy palety
+            x_from, x_to = max(x_cells.start, px_cells.start), min(x_cells.stop, px_cells.stop)
+            y_from, y_to = max(y_cells.start, py_cells.start), min(y_cells.stop, py_cells.stop)
+            if x_from < x_to and y_from < y_to:
+                top = pallet.position[2] + pallet.dimensions[2]
+                region = self.height_map[x_from:x_to, y_from:y_to]
+                np.maximum(region, top, out=region)
 
     def _update_weight_distribution(self) -> None:
-        """Aktualizuje rozkład masy dla załadowanych palet."""
+        """
+        Przelicza od nowa rozkład masy i sumy bieżące dla załadowanych palet.
+        
+        `add_pallet` i `remove_pallet` aktualizują te wartości przyrostowo; pełne
+        przeliczenie jest potrzebne tylko przy podmianie całego załadunku (`set_loaded_pallets`).
+        """
         # Reset rozkładu masy
         self.weight_distribution = {
             "left": 0.0,
@@ -278,38 +810,40 @@ class Trailer:
             "back": 0.0,
             "total": 0.0
         }
+        self._total_volume = 0
         
-        # Podział naczepy na strefy
-        middle_width = self.width / 2
-        middle_length = self.length / 2
-        
-        # Obliczanie rozkładu masy
         for pallet in self.loaded_pallets:
-            x, y, z = pallet.position
-            length, width, _ = pallet.dimensions
-            
-            # Określenie, w której strefie znajduje się środek palety
-            center_x = x + length / 2
-            center_y = y + width / 2
-            
-            # Lewa/prawa strona
-            if center_y < middle_width:
-                self.weight_distribution["left"] += pallet.total_weight
-            else:
-                self.weight_distribution["right"] += pallet.total_weight
-            
-            # Przód/tył
-            if center_x < middle_length:
-                self.weight_distribution["front"] += pallet.total_weight
-            else:
-                self.weight_distribution["back"] += pallet.total_weight
-            
-            # Łączna masa
-            self.weight_distribution["total"] += pallet.total_weight
+            self._accumulate_weight(pallet, 1)
+
+    def _accumulate_weight(self, pallet: Pallet, sign: int) -> None:
+        """Dodaje (sign=1) lub odejmuje (sign=-1) udział palety w rozkładzie masy."""
+        x, y, z = pallet.position
+        length, width, _ = pallet.dimensions
+        weight = sign * pallet.total_weight
+        
+        # Określenie, w której strefie znajduje się środek palety
+        center_x = x + length / 2
+        center_y = y + width / 2
+        
+        # Lewa/prawa strona
+        if center_y < self.width / 2:
+            self.weight_distribution["left"] += weight
+        else:
+            self.weight_distribution["right"] += weight
+        
+        # Przód/tył
+        if center_x < self.length / 2:
+            self.weight_distribution["front"] += weight
+        else:
+            self.weight_distribution["back"] += weight
+        
+        # Łączna masa i objętość
+        self.weight_distribution["total"] += weight
+        self._total_volume += sign * pallet.volume
 
     def _current_load(self) -> float:
         """Zwraca aktualną masę załadunku."""
-        return sum(pallet.total_weight for pallet in self.loaded_pallets)
+        return self.weight_distribution["total"]
 
     def _calculate_weight_balance_side(self) -> float:
         """Oblicza balans masy bok do boku (0-1, gdzie 0.5 to idealne zrównoważenie)."""
@@ -335,26 +869,10 @@ class Trailer:
 
     def _find_lowest_available_height(self, x: int, y: int, length: int, width: int) -> Optional[int]:
         """Znajduje najniższą dostępną wysokość dla palety o podanych wymiarach."""
-        # Konwersja do indeksów mapy przestrzeni
-        x_start = x // self.resolution
-        y_start = y // self.resolution
-        
-        x_end = (x + length) // self.resolution + 1
-        y_end = (y + width) // self.resolution + 1
-        
-        # Sprawdź, czy indeksy są w granicach mapy
-        if (x_end >= self.space_map.shape[0] or 
-            y_end >= self.space_map.shape[1]):
+        # Sprawdź, czy podstawa mieści się na podłodze naczepy
+        if x < 0 or y < 0 or x + length > self.length or y + width > self.width:
             return None
         
-        # Znajdź najwyższą zajętą wysokość
-        max_height = 0
-        for x_idx in range(x_start, x_end):
-            for y_idx in range(y_start, y_end):
-                # Znajdź najwyższy zajęty blok
-                occupied_heights = np.where(self.space_map[x_idx, y_idx, :] == 1)[0]
-                if len(occupied_heights) > 0:
-                    block_height = (occupied_heights[-1] + 1) * self.resolution
-                    max_height = max(max_height, block_height)
-        
-        return max_height 
\ No newline at end of file
+        # Najwyższy punkt ładunku pod podstawą palety
+        x_cells, y_cells = self._cells(x, y, length, width)
+        return int(self.height_map[x_cells, y_cells].max())
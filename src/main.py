@@ -30,7 +30,7 @@ from src.visualization.dashboard import (
 from src.utils.data_loader import generate_pallet_sets
 from src.algorithms.algorithm_factory import get_algorithm, list_available_algorithms
 from src.visualization.plotter import plot_3d_trailer_with_pallets, create_3d_visualization, create_weight_distribution_plot
-from src.config import PALLET_TYPES, TRAILER_DIMENSIONS
+from src.config import PALLET_TYPES, TRAILER_DIMENSIONS, VISUALIZATION
 from src.data.pallet import Pallet
 from src.algorithms.reinforcement_learning import ReinforcementLearningLoading
 
@@ -353,7 +353,8 @@ def run_algorithm(n_clicks, pallet_set_name, algorithm_name, rl_model_name=None)
     
     # Uruchomienie algorytmu
     try:
-        loaded_pallets = algorithm.run(pallets)
+        # Budżet czasu gwarantuje odpowiedź panelu także dla algorytmów iteracyjnych
+        loaded_pallets = algorithm.run(pallets, time_budget_s=VISUALIZATION["time_budget_s"])
         end_time = time.time()
         
         # Zapisz czas wykonania
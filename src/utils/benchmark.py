@@ -0,0 +1,72 @@
+"""
+Moduł zawierający benchmark metod wyszukiwania pozycji palet w algorytmach załadunku.
+"""
+
+import time
+from typing import Dict, List, Any, Optional, Sequence
+
+from src.data.pallet import Pallet
+from src.algorithms.algorithm_factory import get_algorithm
+from src.utils.data_loader import generate_pallet_sets
+
+
+def benchmark_placement(pallet_sets: Optional[Dict[str, List[Pallet]]] = None,
+                        algorithms: Sequence[str] = ("XY_Axis_Loading", "X_Distribution", "Y_Distribution"),
+                        placements: Sequence[str] = ("grid", "corner_points", "max_rects"),
+                        repeats: int = 3) -> List[Dict[str, Any]]:
+    """
+    Porównuje metody wyszukiwania pozycji (siatka, punkty narożne, MaxRects).
+
+    Args:
+        pallet_sets: Zestawy palet do załadunku (domyślnie `generate_pallet_sets()`)
+        algorithms: Nazwy algorytmów z `algorithm_factory`
+        placements: Metody wyszukiwania pozycji (wartości klucza konfiguracji "placement")
+        repeats: Liczba powtórzeń każdego pomiaru (raportowany jest najlepszy czas)
+
+    Returns:
+        List[Dict[str, Any]]: Wyniki pomiarów (czas, liczba palet, LDM) dla każdej kombinacji
+    """
+    if pallet_sets is None:
+        pallet_sets = generate_pallet_sets()
+
+    results = []
+    for algorithm_name in algorithms:
+        for placement in placements:
+            for set_name, pallets in pallet_sets.items():
+                best_time = float("inf")
+                for _ in range(repeats):
+                    algorithm = get_algorithm(algorithm_name, {"placement": placement})
+                    start_time = time.perf_counter()
+                    loaded_pallets = algorithm.run(pallets)
+                    best_time = min(best_time, time.perf_counter() - start_time)
+
+                results.append({
+                    "algorithm": algorithm_name,
+                    "placement": placement,
+                    "pallet_set": set_name,
+                    "time_s": best_time,
+                    "pallets_loaded": len(loaded_pallets),
+                    "pallets_total": len(pallets),
+                    "ldm": algorithm.trailer.get_loading_meters()
+                })
+
+    return results
+
+
+def print_benchmark(results: List[Dict[str, Any]]) -> None:
+    """
+    Wypisuje wyniki benchmarku w postaci tabeli.
+
+    Args:
+        results: Wyniki zwrócone przez `benchmark_placement`
+    """
+    print(f"{'Algorytm':<18} {'Metoda':<14} {'Zestaw':<34} {'Czas [ms]':>10} {'Palety':>8} {'LDM':>7}")
+    for row in results:
+        print(
+            f"{row['algorithm']:<18} {row['placement']:<14} {row['pallet_set'][:34]:<34} "
+            f"{row['time_s'] * 1000:>10.2f} {row['pallets_loaded']:>3}/{row['pallets_total']:<4} {row['ldm']:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    print_benchmark(benchmark_placement())
@@ -0,0 +1,110 @@
+"""
+Moduł zawierający grupowanie palet w klasy równoważności (redukcja symetrii w przeszukiwaniu).
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from src.data.pallet import Pallet
+
+# Klucz klasy: (typ, długość, szerokość, wysokość, rotacje, piętrowanie, kruchość, przedział masy)
+PalletClassKey = Tuple[str, int, int, int, Tuple[int, ...], bool, bool, int]
+
+
+@dataclass
+class PalletClass:
+    """
+    Klasa równoważności palet.
+
+    Palety tej samej klasy są dla planisty zamienne: zamiana ich miejscami daje
+    ten sam układ (z dokładnością do mas w obrębie przedziału). Przeszukiwanie
+    może więc rozgałęziać się po klasach z licznościami zamiast po paletach,
+    co usuwa permutacje identycznych palet.
+
+    Attributes:
+        key: Klucz klasy
+        pallets: Palety klasy (w kolejności z manifestu)
+    """
+
+    key: PalletClassKey
+    pallets: List[Pallet] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        """Zwraca liczbę palet w klasie."""
+        return len(self.pallets)
+
+    @property
+    def representative(self) -> Pallet:
+        """Zwraca pierwszą paletę klasy."""
+        return self.pallets[0]
+
+    @property
+    def rotations(self) -> Tuple[int, ...]:
+        """Zwraca rotacje dające różne układy (paleta kwadratowa ma tylko jedną)."""
+        return self.key[4]
+
+
+def rotation_options(pallet: Pallet) -> Tuple[int, ...]:
+    """Zwraca rotacje palety dające różne podstawy: (0,) dla palety kwadratowej, (0, 90) dla pozostałych."""
+    return (0,) if pallet.length == pallet.width else (0, 90)
+
+
+def pallet_class_key(pallet: Pallet, weight_bucket_kg: float = 10) -> PalletClassKey:
+    """
+    Zwraca klucz klasy równoważności palety.
+
+    Args:
+        pallet: Paleta
+        weight_bucket_kg: Szerokość przedziału masy całkowitej w kg
+
+    Returns:
+        PalletClassKey: Klucz klasy
+    """
+    return (
+        pallet.pallet_type, pallet.length, pallet.width, pallet.height, rotation_options(pallet),
+        pallet.stackable, pallet.fragile, int(pallet.total_weight // weight_bucket_kg)
+    )
+
+
+def group_pallets(pallets: List[Pallet], weight_bucket_kg: float = 10) -> List[PalletClass]:
+    """
+    Grupuje palety w klasy równoważności wg typu, wymiarów, rotacji i przedziału masy.
+
+    Args:
+        pallets: Lista palet
+        weight_bucket_kg: Szerokość przedziału masy całkowitej w kg
+
+    Returns:
+        List[PalletClass]: Klasy w kolejności pierwszego wystąpienia w liście palet
+
+    Raises:
+        ValueError: Gdy szerokość przedziału masy nie jest dodatnia
+    """
+    if weight_bucket_kg <= 0:
+        raise ValueError(f"Szerokość przedziału masy musi być dodatnia: {weight_bucket_kg}")
+
+    classes: Dict[PalletClassKey, PalletClass] = {}
+    for pallet in pallets:
+        key = pallet_class_key(pallet, weight_bucket_kg)
+        if key not in classes:
+            classes[key] = PalletClass(key)
+        classes[key].pallets.append(pallet)
+    return list(classes.values())
+
+
+def class_indices(pallets: List[Pallet], weight_bucket_kg: float = 10) -> List[int]:
+    """
+    Zwraca numer klasy równoważności każdej palety (dla planistów operujących na indeksach palet).
+
+    Args:
+        pallets: Lista palet
+        weight_bucket_kg: Szerokość przedziału masy całkowitej w kg
+
+    Returns:
+        List[int]: Numer klasy (indeks w wyniku `group_pallets`) dla kolejnych palet
+    """
+    numbers: Dict[PalletClassKey, int] = {}
+    for pallet_class in group_pallets(pallets, weight_bucket_kg):
+        numbers[pallet_class.key] = len(numbers)
+    return [numbers[pallet_class_key(p, weight_bucket_kg)] for p in pallets]
@@ -0,0 +1,109 @@
+"""
+Moduł zawierający funkcje pomocnicze do równoległego wykonywania obliczeń algorytmów załadunku.
+"""
+
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional, Tuple
+import os
+
+# Wspólne dane zadań w procesie roboczym puli procesów (ustawiane raz, przy starcie procesu)
+_worker_context: Any = None
+
+
+class SerialExecutor(Executor):
+    """
+    Pula wykonująca zadania od razu, w bieżącym wątku.
+
+    Pozwala algorytmom korzystać z tego samego kodu (`submit`, `map`) niezależnie
+    od tego, czy obliczenia są równoległe.
+    """
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        """Wykonuje zadanie i zwraca zakończony obiekt `Future`."""
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as error:
+            future.set_exception(error)
+        return future
+
+
+def create_executor(workers: Optional[int] = None, executor_type: str = "process",
+                    initializer: Optional[Callable] = None, initargs: Tuple[Any, ...] = ()) -> Executor:
+    """
+    Tworzy pulę procesów lub wątków do równoległych obliczeń.
+
+    Funkcja `initializer` jest wywoływana raz w każdym procesie roboczym (np. aby
+    przekazać manifest palet tylko raz, a nie z każdym zadaniem). Dla puli wątków
+    i obliczeń sekwencyjnych jest wywoływana raz, w bieżącym procesie - ustawiony
+    przez nią stan modułu jest wtedy wspólny dla wszystkich pul w procesie, więc
+    dane zadań należy przekazywać przez `create_context_executor`.
+
+    Args:
+        workers: Liczba procesów/wątków (None - liczba rdzeni); 1 oznacza obliczenia sekwencyjne
+        executor_type: Rodzaj puli: "process" lub "thread"
+        initializer: Funkcja przygotowująca stan procesu roboczego (opcjonalna)
+        initargs: Argumenty funkcji `initializer`
+
+    Returns:
+        Executor: Pula (do użycia jako menedżer kontekstu)
+
+    Raises:
+        ValueError: Gdy rodzaj puli jest nieznany
+    """
+    if executor_type not in ("process", "thread"):
+        raise ValueError(f"Nieznany rodzaj puli: {executor_type}. Dostępne: process, thread")
+
+    workers = workers or os.cpu_count() or 1
+    if executor_type == "process" and workers > 1:
+        return ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs)
+
+    if initializer is not None:
+        initializer(*initargs)
+    if workers > 1:
+        return ThreadPoolExecutor(max_workers=workers)
+    return SerialExecutor()
+
+
+def create_context_executor(workers: Optional[int], executor_type: str, task: Callable,
+                            context: Any) -> Tuple[Executor, Callable]:
+    """
+    Tworzy pulę i funkcję zadania korzystającego ze wspólnych danych (np. manifestu palet).
+
+    Zadanie jest wywoływane jako `task(context, *args)`. W puli procesów dane są
+    przekazywane raz, przy starcie każdego procesu roboczego. W puli wątków
+    i obliczeniach sekwencyjnych są dołączane do funkcji zadania, więc algorytmy
+    działające równocześnie w jednym procesie (np. `run_many` z pulą wątków)
+    nie nadpisują sobie danych.
+
+    Args:
+        workers: Liczba procesów/wątków (None - liczba rdzeni); 1 oznacza obliczenia sekwencyjne
+        executor_type: Rodzaj puli: "process" lub "thread"
+        task: Funkcja zadania na poziomie modułu (w puli procesów jest przesyłana do procesów roboczych)
+        context: Wspólne dane zadań
+
+    Returns:
+        Tuple[Executor, Callable]: Pula (do użycia jako menedżer kontekstu) i funkcja do przekazania
+            w `submit` lub `map` zamiast `task`
+
+    Raises:
+        ValueError: Gdy rodzaj puli jest nieznany
+    """
+    workers = workers or os.cpu_count() or 1
+    if executor_type == "process" and workers > 1:
+        executor = create_executor(workers, executor_type, _set_worker_context, (context,))
+        return executor, partial(_call_with_worker_context, task)
+
+    return create_executor(workers, executor_type), partial(task, context)
+
+
+def _set_worker_context(context: Any) -> None:
+    """Zapamiętuje wspólne dane zadań w procesie roboczym."""
+    global _worker_context
+    _worker_context = context
+
+
+def _call_with_worker_context(task: Callable, *args, **kwargs) -> Any:
+    """Wywołuje zadanie z danymi zapamiętanymi przez `_set_worker_context`."""
+    return task(_worker_context, *args, **kwargs)
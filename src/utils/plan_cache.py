@@ -0,0 +1,228 @@
+"""
+Moduł zawierający pamięć podręczną planów załadunku dla powtarzających się manifestów.
+"""
+
+from collections import OrderedDict
+from typing import List, Dict, Any, Tuple, Optional
+import hashlib
+import json
+import logging
+import os
+
+from src.data.pallet import Pallet
+from src.data.trailer import Trailer
+
+# Konfiguracja loggera
+logger = logging.getLogger(__name__)
+
+# Ustawienie w planie: (indeks palety w kolejności kanonicznej, pozycja (x, y, z), rotacja)
+CachedPlacement = Tuple[int, Tuple[int, int, int], int]
+
+# Klucze konfiguracji, które nie wpływają na plan (tylko na sposób obliczeń)
+IGNORED_CONFIG_KEYS = ("workers", "executor")
+
+
+class PlanCache:
+    """
+    Pamięć podręczna planów załadunku z kluczem w postaci kanonicznej sygnatury manifestu.
+
+    Sygnatura obejmuje nazwę i konfigurację algorytmu, wymiary i ładowność naczepy
+    oraz posortowane opisy palet (typ, wymiary, piętrowanie, kruchość, przedział masy
+    całkowitej o szerokości `weight_band_kg`). Manifesty różniące się tylko
+    identyfikatorami palet lub masami w tym samym przedziale mają więc ten sam klucz,
+    a zapamiętany plan jest przypisywany nowym paletom o tych samych opisach.
+
+    Plany są przechowywane w pamięci (LRU, `max_entries` wpisów) i opcjonalnie
+    na dysku, w katalogu `cache_dir` (plik JSON na klucz).
+
+    Konfiguracje z funkcjami (np. "objective" portfela) są odrzucane, bo funkcji
+    nie da się zapisać w sygnaturze niezależnie od procesu.
+
+    Attributes:
+        max_entries: Maksymalna liczba planów w pamięci
+        cache_dir: Katalog planów na dysku (None - tylko pamięć)
+        weight_band_kg: Szerokość przedziału masy całkowitej palety w kg
+        hits: Liczba trafień
+        misses: Liczba chybień
+    """
+
+    def __init__(self, max_entries: int = 256, cache_dir: Optional[str] = None, weight_band_kg: float = 25):
+        """
+        Inicjalizuje pamięć podręczną planów.
+
+        Args:
+            max_entries: Maksymalna liczba planów w pamięci
+            cache_dir: Katalog planów na dysku (opcjonalny)
+            weight_band_kg: Szerokość przedziału masy całkowitej palety w kg
+
+        Raises:
+            ValueError: Gdy liczba wpisów lub szerokość przedziału masy nie jest dodatnia
+        """
+        if max_entries <= 0:
+            raise ValueError(f"Liczba wpisów musi być dodatnia: {max_entries}")
+        if weight_band_kg <= 0:
+            raise ValueError(f"Szerokość przedziału masy musi być dodatnia: {weight_band_kg}")
+
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.weight_band_kg = weight_band_kg
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, List[CachedPlacement]]" = OrderedDict()
+
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def lookup(self, algorithm_name: str, config: Dict[str, Any], trailer: Trailer,
+               pallets: List[Pallet]) -> Optional[List[Pallet]]:
+        """
+        Wyszukuje plan dla manifestu i przypisuje zapamiętane pozycje paletom manifestu.
+
+        Args:
+            algorithm_name: Nazwa algorytmu
+            config: Konfiguracja algorytmu
+            trailer: Naczepa
+            pallets: Palety manifestu (pozycje i rotacje są ustawiane przy trafieniu)
+
+        Returns:
+            Optional[List[Pallet]]: Palety ujęte w planie, w kolejności załadunku, lub None przy chybieniu
+
+        Raises:
+            ValueError: Gdy konfiguracja zawiera funkcje
+        """
+        order, key = self._canonical(algorithm_name, config, trailer, pallets)
+        placements = self._get(key)
+        if placements is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        loaded_pallets = []
+        for index, position, rotation in placements:
+            pallet = pallets[order[index]]
+            pallet.position = position
+            pallet.rotation = rotation
+            loaded_pallets.append(pallet)
+        return loaded_pallets
+
+    def store(self, algorithm_name: str, config: Dict[str, Any], trailer: Trailer,
+              pallets: List[Pallet], loaded_pallets: List[Pallet]) -> None:
+        """
+        Zapamiętuje plan manifestu.
+
+        Args:
+            algorithm_name: Nazwa algorytmu
+            config: Konfiguracja algorytmu
+            trailer: Naczepa
+            pallets: Palety manifestu
+            loaded_pallets: Palety załadowane przez algorytm (z pozycjami i rotacjami)
+
+        Raises:
+            ValueError: Gdy konfiguracja zawiera funkcje
+        """
+        order, key = self._canonical(algorithm_name, config, trailer, pallets)
+
+        # Algorytmy mogą zwracać kopie palet, więc palety są dopasowywane po identyfikatorze
+        indices_by_id: Dict[str, List[int]] = {}
+        for index, pallet_index in enumerate(order):
+            indices_by_id.setdefault(pallets[pallet_index].pallet_id, []).append(index)
+
+        placements = []
+        for pallet in loaded_pallets:
+            indices = indices_by_id.get(pallet.pallet_id)
+            if not indices:
+                logger.debug(f"Pominięto plan: paleta {pallet.pallet_id} nie należy do manifestu")
+                return
+            placements.append((indices.pop(0), tuple(pallet.position), pallet.rotation))
+
+        self._put(key, placements)
+
+    def clear(self) -> None:
+        """Czyści plany w pamięci (plany na dysku pozostają)."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Zwraca liczbę planów w pamięci."""
+        return len(self._entries)
+
+    def _canonical(self, algorithm_name: str, config: Dict[str, Any], trailer: Trailer,
+                   pallets: List[Pallet]) -> Tuple[List[int], str]:
+        """
+        Wyznacza kanoniczną kolejność palet i klucz manifestu.
+
+        Returns:
+            Tuple[List[int], str]: Indeksy palet w kolejności kanonicznej i klucz (skrót SHA-256)
+
+        Raises:
+            ValueError: Gdy konfiguracja zawiera funkcje
+        """
+        descriptions = [
+            (p.pallet_type, p.length, p.width, p.height, p.stackable, p.fragile,
+             int(p.total_weight // self.weight_band_kg))
+            for p in pallets
+        ]
+        order = sorted(range(len(pallets)), key=lambda i: descriptions[i])
+
+        signature = json.dumps([
+            algorithm_name,
+            {k: v for k, v in config.items() if k not in IGNORED_CONFIG_KEYS},
+            [trailer.length, trailer.width, trailer.height, trailer.max_load],
+            [descriptions[i] for i in order]
+        ], sort_keys=True, default=_config_value)
+        return order, hashlib.sha256(signature.encode("utf-8")).hexdigest()
+
+    def _get(self, key: str) -> Optional[List[CachedPlacement]]:
+        """Zwraca plan z pamięci albo z dysku (przenosząc go do pamięci)."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        if self.cache_dir is None:
+            return None
+        path = os.path.join(self.cache_dir, f"{key}.json")
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                placements = [(index, tuple(position), rotation) for index, position, rotation in json.load(file)]
+        except (OSError, ValueError) as error:
+            logger.warning(f"Nie udało się odczytać planu {path}: {error}")
+            return None
+
+        self._remember(key, placements)
+        return placements
+
+    def _put(self, key: str, placements: List[CachedPlacement]) -> None:
+        """Zapisuje plan w pamięci i (opcjonalnie) na dysku."""
+        self._remember(key, placements)
+        if self.cache_dir is None:
+            return
+
+        # Zapis do pliku tymczasowego i podmiana - równoległe procesy nie odczytają niepełnego pliku
+        path = os.path.join(self.cache_dir, f"{key}.json")
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_path, "w", encoding="utf-8") as file:
+                json.dump(placements, file)
+            os.replace(temporary_path, path)
+        except OSError as error:
+            logger.warning(f"Nie udało się zapisać planu {path}: {error}")
+
+    def _remember(self, key: str, placements: List[CachedPlacement]) -> None:
+        """Zapisuje plan w pamięci, usuwając najdawniej używany po przekroczeniu limitu."""
+        self._entries[key] = placements
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def _config_value(value: Any) -> str:
+    """
+    Zapisuje w sygnaturze wartość konfiguracji nieobsługiwaną przez JSON.
+
+    Raises:
+        ValueError: Gdy wartość jest funkcją (jej `repr` zawiera adres w pamięci procesu)
+    """
+    if callable(value):
+        raise ValueError(f"Konfiguracji z funkcją nie można użyć w pamięci podręcznej planów: {value!r}")
+    return repr(value)
@@ -5,8 +5,9 @@ Moduł zawierający funkcje do walidacji załadunku palet.
 from typing import List, Dict, Tuple, Any
 import numpy as np
 
-from src.data.pallet import Pallet
+from src.data.pallet import Pallet, boxes_collide
 from src.data.trailer import Trailer
+from src.data.pallet_array import PalletArray
 from src.config import CONSTRAINTS
 
 
@@ -20,15 +21,14 @@ def check_collision(pallets: List[Pallet]) -> List[Tuple[str, str]]:
     Returns:
         List[Tuple[str, str]]: Lista par ID palet, które ze sobą kolidują
     """
-    collisions = []
+    # Macierz kolizji wszystkich par palet wyznaczona jednym testem wektorowym
+    boxes = PalletArray.from_pallets(pallets).boxes
+    collision_matrix = boxes_collide(boxes, boxes)
     
-    # Sprawdzenie kolizji dla każdej pary palet
-    for i, pallet1 in enumerate(pallets):
-        for j, pallet2 in enumerate(pallets[i+1:], i+1):
-            if pallet1.collides_with(pallet2):
-                collisions.append((pallet1.pallet_id, pallet2.pallet_id))
+    # Każda para tylko raz (i < j), w kolejności palet na liście
+    first, second = np.nonzero(np.triu(collision_matrix, k=1))
     
-    return collisions
+    return [(pallets[i].pallet_id, pallets[j].pallet_id) for i, j in zip(first, second)]
 
 
 def check_weight_distribution(pallets: List[Pallet], trailer: Trailer) -> Dict[str, Any]:
@@ -43,8 +43,7 @@ def check_weight_distribution(pallets: List[Pallet], trailer: Trailer) -> Dict[s
         Dict: Słownik z informacjami o poprawności rozkładu masy
     """
     # Wykorzystanie metody z klasy Trailer
-    trailer.loaded_pallets = pallets
-    trailer._update_weight_distribution()
+    trailer.set_loaded_pallets(pallets)
     
     return trailer.is_weight_distribution_valid()
 
@@ -61,7 +60,7 @@ def check_space_utilization(pallets: List[Pallet], trailer: Trailer) -> Dict[str
         Dict: Słownik z metrykami wykorzystania przestrzeni
     """
     # Wykorzystanie metody z klasy Trailer
-    trailer.loaded_pallets = pallets
+    trailer.set_loaded_pallets(pallets)
     
     return trailer.get_loading_efficiency()
 
@@ -170,14 +169,15 @@ def validate_loading(pallets: List[Pallet], trailer: Trailer = None) -> Dict[str
     # Sprawdzenie poprawności układania w stosy
     invalid_stacking = check_stacking_validity(pallets)
     
+    # Kolumnowa reprezentacja palet do obliczeń wektorowych
+    pallet_array = PalletArray.from_pallets(pallets)
+    
     # Sprawdzenie, czy palety mieszczą się w naczepie
-    out_of_bounds_pallets = []
-    for pallet in pallets:
-        if not trailer._check_bounds(pallet):
-            out_of_bounds_pallets.append(pallet.pallet_id)
+    in_bounds = pallet_array.in_bounds(trailer.length, trailer.width, trailer.height)
+    out_of_bounds_pallets = list(pallet_array.ids[~in_bounds])
     
     # Obliczenie łącznej masy załadunku
-    total_weight = sum(pallet.total_weight for pallet in pallets)
+    total_weight = float(pallet_array.total_weights.sum())
     weight_exceeded = total_weight > trailer.max_load
     
     return {
@@ -24,6 +24,7 @@ from src.visualization.plotter import create_3d_visualization, create_weight_dis
 from src.utils.data_loader import generate_pallet_sets
 from src.algorithms.algorithm_factory import get_algorithm, list_available_algorithms
 from src.algorithms.reinforcement_learning import ReinforcementLearningLoading
+from src.config import VISUALIZATION
 
 
 # Inicjalizacja aplikacji Dash
@@ -342,7 +343,8 @@ def run_algorithm(n_clicks: int, pallet_set_name: str, algorithm_name: str, rl_m
     
     # Uruchomienie algorytmu
     try:
-        loaded_pallets = algorithm.run(pallets)
+        # Budżet czasu gwarantuje odpowiedź panelu także dla algorytmów iteracyjnych
+        loaded_pallets = algorithm.run(pallets, time_budget_s=VISUALIZATION["time_budget_s"])
         end_time = time.time()
         
         # Zapisz czas wykonania
@@ -164,8 +164,7 @@ def create_weight_distribution_chart(pallets: List[Pallet], trailer: Optional[Tr
         trailer = Trailer()
     
     # Aktualizacja rozkładu masy
-    trailer.loaded_pallets = pallets
-    trailer._update_weight_distribution()
+    trailer.set_loaded_pallets(pallets)
     
     # Pobranie danych o rozkładzie masy
     weight_data = trailer.weight_distribution
@@ -244,7 +243,7 @@ def create_loading_efficiency_chart(pallets: List[Pallet], trailer: Optional[Tra
         trailer = Trailer()
     
     # Obliczenie metryk efektywności
-    trailer.loaded_pallets = pallets
+    trailer.set_loaded_pallets(pallets)
     efficiency = trailer.get_loading_efficiency()
     
     # Tworzenie wykresu słupkowego dla metryk efektywności
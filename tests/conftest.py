@@ -0,0 +1,78 @@
+"""
+Wspólne dane testowe: palety, manifesty i sprawdzenie poprawności planu załadunku.
+"""
+
+from typing import List, Tuple
+
+import pytest
+
+from src.data.pallet import Pallet
+from src.data.trailer import Trailer
+from src.config import PALLET_TYPES
+from src.utils.validation import validate_loading
+
+
+def build_pallet(pallet_id: str, pallet_type: str = "L1", cargo_weight: int = 200,
+                 position: Tuple[int, int, int] = (0, 0, 0), rotation: int = 0) -> Pallet:
+    """Tworzy paletę podanego typu w zadanej pozycji (domyślnie początkowej)."""
+    specs = PALLET_TYPES[pallet_type]
+    return Pallet(
+        pallet_id=pallet_id,
+        pallet_type=pallet_type,
+        length=specs["length"],
+        width=specs["width"],
+        height=specs["height"],
+        weight=specs["weight"],
+        cargo_weight=cargo_weight,
+        color=specs["color"],
+        stackable=False,
+        position=position,
+        rotation=rotation
+    )
+
+
+def build_manifest(count: int = 16, prefix: str = "P", offset: int = 0) -> List[Pallet]:
+    """Tworzy deterministyczny manifest palet wszystkich typów o zróżnicowanych masach."""
+    pallet_types = list(PALLET_TYPES.keys())
+    return [
+        build_pallet(
+            f"{prefix}{i}",
+            pallet_types[(i + offset) % len(pallet_types)],
+            cargo_weight=100 + (37 * (i + offset)) % 400
+        )
+        for i in range(count)
+    ]
+
+
+def check_plan(loaded_pallets: List[Pallet], trailer: Trailer) -> None:
+    """Sprawdza, że plan jest wykonalny: bez kolizji, w granicach naczepy i w ładowności."""
+    result = validate_loading(loaded_pallets, trailer)
+    assert result["collisions"] == []
+    assert result["out_of_bounds"] == []
+    assert result["invalid_stacking"] == []
+    assert not result["weight"]["exceeded"]
+    assert len({p.pallet_id for p in loaded_pallets}) == len(loaded_pallets)
+
+
+@pytest.fixture
+def make_pallet():
+    """Fabryka palet (`build_pallet`)."""
+    return build_pallet
+
+
+@pytest.fixture
+def make_manifest():
+    """Fabryka manifestów (`build_manifest`)."""
+    return build_manifest
+
+
+@pytest.fixture
+def manifest() -> List[Pallet]:
+    """Manifest 16 palet wszystkich typów."""
+    return build_manifest()
+
+
+@pytest.fixture
+def assert_valid_plan():
+    """Funkcja sprawdzająca wykonalność planu (`check_plan`)."""
+    return check_plan
@@ -0,0 +1,77 @@
+"""
+Testy algorytmu załadunku metodą przeszukiwania wiązkowego.
+"""
+
+from src.algorithms.beam_search_loading import BeamSearchLoading, _BeamState, _expand_state
+from src.data.trailer import Trailer
+from src.utils.pallet_classes import class_indices
+
+
+def expand_root(pallets, expansion_width):
+    """Rozszerza stan początkowy (pusta naczepa) i zwraca go wraz z dziećmi."""
+    classes = class_indices(pallets, 10)
+    root = _BeamState(Trailer(), tuple(range(len(pallets))), frozenset(), 0.0)
+    moves, dropped = _expand_state(pallets, classes, root.trailer, root.remaining, expansion_width, 0.5)
+    assert dropped == []
+    return classes, root, [(root, root.remaining, move) for move in moves]
+
+
+def test_select_children_prunes_to_beam_width(manifest):
+    classes, root, children = expand_root(manifest, expansion_width=len(manifest))
+    assert len(children) > 3
+    best_scores = sorted((move[0] for _, _, move in children), reverse=True)
+
+    beam = BeamSearchLoading()._select_children(manifest, classes, list(children), beam_width=3)
+
+    assert len(beam) == 3
+    assert [state.score for state in beam] == best_scores[:3]
+    for state in beam:
+        assert len(state.trailer.loaded_pallets) == 1
+        assert len(state.remaining) == len(manifest) - 1
+    # Rodzic nie jest modyfikowany przy tworzeniu dzieci
+    assert root.trailer.loaded_pallets == []
+
+
+def test_select_children_merges_identical_layouts(manifest):
+    classes, _, children = expand_root(manifest, expansion_width=2)
+
+    beam = BeamSearchLoading()._select_children(manifest, classes, children + children, beam_width=len(children) * 2)
+
+    assert len(beam) == len(children)
+    assert len({state.signature for state in beam}) == len(beam)
+
+
+def test_expand_state_leaves_parent_trailer_unchanged(manifest):
+    trailer = Trailer()
+    for pallet in manifest[:4]:
+        pallet.set_position(*trailer.find_free_space_position(pallet))
+        assert trailer.add_pallet(pallet)
+    pallets_before = [(p.pallet_id, p.position, p.rotation) for p in trailer.loaded_pallets]
+    height_map_before = trailer.height_map.copy()
+    distribution_before = dict(trailer.weight_distribution)
+    candidates = [(p.position, p.rotation) for p in manifest[4:]]
+
+    moves, _ = _expand_state(manifest, class_indices(manifest, 10), trailer, tuple(range(4, len(manifest))), 4, 0.5)
+
+    assert moves
+    assert [(p.pallet_id, p.position, p.rotation) for p in trailer.loaded_pallets] == pallets_before
+    assert (trailer.height_map == height_map_before).all()
+    assert trailer.weight_distribution == distribution_before
+    assert trailer._undo_log == [] and trailer._checkpoints == {}
+    # Palety manifestu nie są przestawiane podczas oceny ruchów
+    assert [(p.position, p.rotation) for p in manifest[4:]] == candidates
+
+
+def test_beam_never_exceeds_width(manifest, monkeypatch):
+    beam_sizes = []
+    select_children = BeamSearchLoading._select_children
+
+    def recording(self, *args):
+        beam = select_children(self, *args)
+        beam_sizes.append(len(beam))
+        return beam
+
+    monkeypatch.setattr(BeamSearchLoading, "_select_children", recording)
+    BeamSearchLoading({"workers": 1, "beam_width": 3}).run(manifest)
+
+    assert beam_sizes and max(beam_sizes) == 3
@@ -0,0 +1,98 @@
+"""
+Testy algorytmu genetycznego doboru kolejności i rotacji palet.
+"""
+
+import pytest
+
+from src.algorithms.genetic_loading import GeneticLoading, _canonical, _decode, _fitness
+from src.config import CONSTRAINTS
+
+# Naczepa dekodera: długość, szerokość, wysokość, maksymalna masa ładunku
+TRAILER = (10000, 2000, 2500, 1000.0)
+SPECS = [(1000, 1000, 1000, 100.0), (1000, 1000, 1000, 100.0)]
+
+
+@pytest.fixture(autouse=True)
+def thresholds(monkeypatch):
+    """Stałe progi balansu, od których zależą oczekiwane wartości przystosowania."""
+    monkeypatch.setitem(CONSTRAINTS, "weight_distribution_threshold", 0.1)
+    monkeypatch.setitem(CONSTRAINTS, "front_to_back_weight_distribution", 0.6)
+
+
+def test_fitness_counts_pallets_and_subtracts_ldm():
+    # Masa po równo z lewej i prawej, z przodu połowa (w progu wokół 0.6) - bez kary
+    placements = [(0, 0, 0, 0), (1, 8000, 1000, 0)]
+
+    assert _fitness(SPECS, TRAILER, placements, 1.0) == 2 * 2 * 10000 - 9000
+    assert _fitness(SPECS, TRAILER, [], 1.0) == 0.0
+
+
+def test_fitness_penalises_balance_threshold_excess():
+    # Obie palety z przodu: udział 1.0, przekroczenie progu o |1.0 - 0.6| - 0.1 = 0.3
+    placements = [(0, 0, 0, 0), (1, 0, 1000, 0)]
+    base = 2 * 2 * 10000 - 1000
+
+    assert _fitness(SPECS, TRAILER, placements, 0.0) == base
+    assert _fitness(SPECS, TRAILER, placements, 1.0) == pytest.approx(base - 10000 * 0.3)
+    assert _fitness(SPECS, TRAILER, placements, 2.0) == pytest.approx(base - 2 * 10000 * 0.3)
+
+    # Jedna paleta przy lewej ścianie: dodatkowo przekroczenie bok do boku |0.0 - 0.5| - 0.1 = 0.4
+    assert _fitness(SPECS, TRAILER, placements[:1], 1.0) == pytest.approx(2 * 10000 - 1000 - 10000 * 0.7)
+
+
+def test_fitness_prefers_more_pallets_over_ldm_and_balance():
+    # Najgorzej ułożone dwie palety są lepsze niż najlepiej ułożona jedna
+    worst_two = [(0, 0, 0, 0), (1, 9000, 0, 0)]
+    best_one = [(0, 0, 0, 0)]
+
+    assert _fitness(SPECS, TRAILER, worst_two, 1.0) > _fitness(SPECS, TRAILER, best_one, 0.0)
+
+
+def test_decode_skips_pallets_over_max_load():
+    specs = [(1000, 1000, 1000, 600.0), (1000, 1000, 1000, 600.0), (1000, 1000, 1000, 300.0)]
+
+    placements = _decode(specs, TRAILER, ((0, 1, 2), (0, 0, 0)))
+
+    assert [index for index, _, _, _ in placements] == [0, 2]
+
+
+def test_decode_falls_back_to_other_rotation():
+    # Obrócona paleta jest szersza niż naczepa, więc zostaje ustawiona bez obrotu
+    specs = [(2500, 2000, 1000, 100.0)]
+
+    assert _decode(specs, TRAILER, ((0,), (1,))) == [(0, 0, 0, 0)]
+
+
+def test_canonical_chromosome_ignores_permutations_of_identical_pallets():
+    # Palety 0 i 2 są równoważne, podobnie kwadratowe palety 3 i 4
+    classes = [0, 1, 0, 2, 2]
+    square = (False, False, False, True, True)
+
+    canonical = _canonical(((2, 1, 0, 4, 3), (1, 0, 0, 1, 0)), classes, square)
+    swapped = _canonical(((0, 1, 2, 3, 4), (0, 0, 1, 0, 1)), classes, square)
+
+    # Bit obrotu przechodzi z miejscem w kolejności; bity palet kwadratowych są zerowane
+    assert canonical == ((0, 1, 2, 3, 4), (0, 0, 1, 0, 0))
+    assert swapped == canonical
+    assert _canonical(canonical, classes, square) == canonical
+
+
+def test_identical_pallets_are_evaluated_once(make_pallet, monkeypatch):
+    evaluated = []
+    evaluate = _fitness
+
+    def counting(specs, trailer, placements, balance_weight):
+        evaluated.append(placements)
+        return evaluate(specs, trailer, placements, balance_weight)
+
+    # Osiem identycznych palet: każda kolejność jest tym samym chromosomem kanonicznym
+    monkeypatch.setattr("src.algorithms.genetic_loading._fitness", counting)
+    pallets = [make_pallet(f"P{i}", "L1") for i in range(8)]
+    loaded_pallets = GeneticLoading({
+        "population_size": 12, "generations": 5, "time_budget_s": None, "seed": 3, "workers": 1, "executor": "thread"
+    }).run(pallets)
+
+    assert len(loaded_pallets) == 8
+    # Żaden chromosom kanoniczny nie jest oceniany dwa razy, więc ocen jest mniej niż osobników
+    assert len({tuple(placements) for placements in evaluated}) == len(evaluated)
+    assert len(evaluated) < 12 + 5 * (12 - 2)
@@ -0,0 +1,30 @@
+"""
+Testy algorytmu załadunku pasami (Lane DP).
+"""
+
+from src.algorithms.lane_dp_loading import LaneDPLoading, _maximal_patterns
+
+
+def test_plan_is_valid(manifest, assert_valid_plan):
+    algorithm = LaneDPLoading()
+    loaded_pallets = algorithm.run(manifest)
+
+    assert loaded_pallets
+    assert_valid_plan(loaded_pallets, algorithm.trailer)
+
+
+def test_lane_limit_yields_capped_patterns():
+    patterns = list(_maximal_patterns([370, 720], 2450, max_lanes=2))
+
+    assert patterns
+    assert all(len(pattern) <= 2 for pattern in patterns)
+
+
+def test_lane_limit_below_trailer_width(make_pallet, assert_valid_plan):
+    # Pięć pasów L7 zmieściłoby się w poprzek naczepy, limit pozwala tylko na dwa
+    pallets = [make_pallet(f"L7_{i}", "L7") for i in range(20)]
+    algorithm = LaneDPLoading({"max_lanes": 2})
+    loaded_pallets = algorithm.run(pallets)
+
+    assert len(loaded_pallets) == len(pallets)
+    assert_valid_plan(loaded_pallets, algorithm.trailer)
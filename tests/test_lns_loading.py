@@ -0,0 +1,56 @@
+"""
+Testy algorytmu załadunku metodą przeszukiwania dużego sąsiedztwa (LNS)
+i poprawiania planu w `LoadingAlgorithm.run`.
+"""
+
+from typing import List
+
+from src.algorithms.base_algorithm import LoadingAlgorithm
+from src.algorithms.lns_loading import LNSLoading
+from src.data.pallet import Pallet
+
+FAST_CONFIG = {"time_budget_s": None, "max_iterations": 150, "seed": 5}
+
+
+def test_plan_is_valid(manifest, assert_valid_plan):
+    algorithm = LNSLoading(FAST_CONFIG)
+    loaded_pallets = algorithm.run(manifest)
+
+    assert loaded_pallets
+    assert_valid_plan(loaded_pallets, algorithm.trailer)
+
+
+def test_improvement_curve_is_monotonic(manifest):
+    algorithm = LNSLoading(FAST_CONFIG)
+    algorithm.run(manifest)
+
+    curve = algorithm.improvement_curve
+    assert curve
+    for (_, previous_count, previous_ldm), (_, count, ldm) in zip(curve, curve[1:]):
+        assert count > previous_count or (count == previous_count and ldm < previous_ldm)
+
+
+class _FixedPlanLoading(LoadingAlgorithm):
+    """Algorytm zwracający gotowy plan bez dodawania palet do naczepy."""
+
+    def __init__(self, plan: List[Pallet]):
+        super().__init__("Fixed Plan", {"polish": True})
+        self.fixed_plan = plan
+
+    def load_pallets(self, pallets: List[Pallet]) -> List[Pallet]:
+        return self.fixed_plan
+
+
+def test_polish_keeps_plan_when_it_cannot_be_rebuilt(make_pallet):
+    # Druga paleta koliduje z pierwszą, więc plan nie daje się odtworzyć w naczepie
+    first, second, third = (make_pallet(f"F{i}", "L1") for i in range(3))
+    second.set_position(700, 0, 0)
+    third.set_position(5000, 0, 0)
+    plan = [first, third, second]
+
+    algorithm = _FixedPlanLoading(plan)
+    polished = algorithm._polish(plan)
+
+    assert polished is plan
+    assert [p.pallet_id for p in algorithm.trailer.loaded_pallets] == ["F0", "F2", "F1"]
+    assert algorithm.trailer.get_loading_meters() == 6.4
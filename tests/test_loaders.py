@@ -0,0 +1,62 @@
+"""
+Wspólne testy algorytmów załadunku korzystających z puli procesów lub wątków.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.algorithms.beam_search_loading import BeamSearchLoading
+from src.algorithms.genetic_loading import GeneticLoading
+from src.algorithms.portfolio_loading import PortfolioLoading
+
+# Algorytm i szybka konfiguracja (bez liczby procesów i rodzaju puli)
+LOADERS = [
+    pytest.param(BeamSearchLoading, {"beam_width": 4}, id="beam_search"),
+    pytest.param(GeneticLoading, {"population_size": 12, "generations": 10, "time_budget_s": None, "seed": 7},
+                 id="genetic"),
+    pytest.param(PortfolioLoading, {"algorithms": ["XY_Axis_Loading", "X_Distribution", "Lane_DP_Loading"]},
+                 id="portfolio")
+]
+
+
+@pytest.mark.parametrize("algorithm_class, config", LOADERS)
+def test_plan_is_valid(algorithm_class, config, manifest, assert_valid_plan):
+    algorithm = algorithm_class({**config, "workers": 1})
+    loaded_pallets = algorithm.run(manifest)
+
+    assert loaded_pallets
+    assert_valid_plan(loaded_pallets, algorithm.trailer)
+
+
+@pytest.mark.parametrize("algorithm_class, config", LOADERS)
+def test_process_pool_matches_serial(algorithm_class, config, manifest):
+    serial = algorithm_class({**config, "workers": 1})
+    parallel = algorithm_class({**config, "workers": 2, "executor": "process"})
+    serial.run(manifest)
+    parallel.run(manifest)
+
+    assert parallel.plan == serial.plan
+
+
+@pytest.mark.parametrize("algorithm_class, config", LOADERS)
+def test_concurrent_runs_with_thread_pools(algorithm_class, config, make_manifest, assert_valid_plan):
+    # Każde uruchomienie ma własną pulę wątków i własny kontekst
+    manifests = [make_manifest(8 + 3 * i, prefix=f"M{i}_", offset=i) for i in range(6)]
+
+    def plan(pallets):
+        algorithm = algorithm_class({**config, "workers": 2, "executor": "thread"})
+        return algorithm.run(pallets), algorithm
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(plan, manifests))
+
+    for pallets, (loaded_pallets, algorithm) in zip(manifests, results):
+        assert loaded_pallets
+        assert {p.pallet_id for p in loaded_pallets} <= {p.pallet_id for p in pallets}
+        assert_valid_plan(loaded_pallets, algorithm.trailer)
+
+        # Plan z puli wątków jest taki sam jak sekwencyjny dla tego samego manifestu
+        serial = algorithm_class({**config, "workers": 1})
+        serial.run(pallets)
+        assert algorithm.plan == serial.plan
@@ -0,0 +1,70 @@
+"""
+Testy grupowania palet w klasy równoważności.
+"""
+
+import pytest
+
+from src.utils.pallet_classes import class_indices, group_pallets, pallet_class_key, rotation_options
+
+
+def square(pallet):
+    """Zwraca paletę z kwadratową podstawą."""
+    pallet.width = pallet.length
+    return pallet
+
+
+def test_rotation_options(make_pallet):
+    assert rotation_options(make_pallet("A", "L1")) == (0, 90)
+    assert rotation_options(square(make_pallet("B", "L1"))) == (0,)
+
+
+def test_group_pallets_by_type_and_weight_bucket(make_pallet):
+    # Masa palety L1 to 36 kg + ładunek; przedziały po 10 kg
+    pallets = [
+        make_pallet("A", "L1", cargo_weight=164),  # 200 kg
+        make_pallet("B", "L2", cargo_weight=164),
+        make_pallet("C", "L1", cargo_weight=173),  # 209 kg - ten sam przedział co A
+        make_pallet("D", "L1", cargo_weight=174),  # 210 kg - następny przedział
+        make_pallet("E", "L2", cargo_weight=164)
+    ]
+
+    classes = group_pallets(pallets, weight_bucket_kg=10)
+
+    assert [[p.pallet_id for p in pallet_class.pallets] for pallet_class in classes] == [["A", "C"], ["B", "E"], ["D"]]
+    assert [pallet_class.count for pallet_class in classes] == [2, 2, 1]
+    assert classes[0].representative.pallet_id == "A"
+    assert classes[0].rotations == (0, 90)
+    assert class_indices(pallets, weight_bucket_kg=10) == [0, 1, 0, 2, 1]
+
+
+def test_wider_bucket_merges_weights(make_pallet):
+    pallets = [make_pallet("A", "L1", cargo_weight=164), make_pallet("D", "L1", cargo_weight=174)]
+
+    assert class_indices(pallets, weight_bucket_kg=10) == [0, 1]
+    assert class_indices(pallets, weight_bucket_kg=50) == [0, 0]
+
+
+def test_key_separates_rotations_stacking_and_fragility(make_pallet):
+    base = make_pallet("A", "L1")
+    stackable = make_pallet("B", "L1")
+    stackable.stackable = True
+    fragile = make_pallet("C", "L1")
+    fragile.fragile = True
+    squared = square(make_pallet("D", "L1"))
+
+    keys = {pallet_class_key(p) for p in (base, stackable, fragile, squared)}
+    assert len(keys) == 4
+    assert group_pallets([squared])[0].rotations == (0,)
+
+
+def test_empty_manifest():
+    assert group_pallets([]) == []
+    assert class_indices([]) == []
+
+
+@pytest.mark.parametrize("weight_bucket_kg", [0, -5])
+def test_non_positive_bucket_is_rejected(make_pallet, weight_bucket_kg):
+    with pytest.raises(ValueError):
+        group_pallets([make_pallet("A")], weight_bucket_kg)
+    with pytest.raises(ValueError):
+        class_indices([make_pallet("A")], weight_bucket_kg)
@@ -0,0 +1,130 @@
+"""
+Testy pamięci podręcznej planów załadunku.
+"""
+
+import pytest
+
+from src.algorithms.lns_loading import LNSLoading
+from src.algorithms.portfolio_loading import PortfolioLoading
+from src.algorithms.xy_axis_loading import XYAxisLoading
+from src.data.trailer import Trailer
+from src.utils.plan_cache import PlanCache
+
+
+def renamed(pallets, prefix):
+    """Zwraca kopie palet z nowymi identyfikatorami, w odwróconej kolejności."""
+    copies = []
+    for pallet in reversed(pallets):
+        copy = pallet.copy()
+        copy.pallet_id = f"{prefix}{pallet.pallet_id}"
+        copies.append(copy)
+    return copies
+
+
+def layout(pallets):
+    """Zwraca ułożenia palet (typ, pozycja, rotacja) niezależnie od identyfikatorów i kolejności."""
+    return sorted((p.pallet_type, p.position, p.rotation) for p in pallets)
+
+
+def test_signature_ignores_ids_order_and_weights_within_band(manifest, make_pallet):
+    cache = PlanCache(weight_band_kg=25)
+    trailer = Trailer()
+    config = {"workers": 4, "executor": "thread", "beam_width": 8}
+    _, key = cache._canonical("Beam", config, trailer, manifest)
+
+    other = renamed(manifest, "X_")
+    other[0].cargo_weight += 1 if other[0].total_weight % 25 < 24 else -1
+    assert cache._canonical("Beam", {**config, "workers": 1, "executor": "process"}, trailer, other)[1] == key
+
+    # Inna konfiguracja, naczepa, typ palety lub przedział masy zmieniają sygnaturę
+    assert cache._canonical("Beam", {**config, "beam_width": 4}, trailer, manifest)[1] != key
+    assert cache._canonical("Other", config, trailer, manifest)[1] != key
+    assert cache._canonical("Beam", config, Trailer(length=12000), manifest)[1] != key
+    heavier = renamed(manifest, "H_")
+    heavier[0].cargo_weight += 25
+    assert cache._canonical("Beam", config, trailer, heavier)[1] != key
+    changed_type = manifest[:-1] + [make_pallet("T", "L7" if manifest[-1].pallet_type != "L7" else "L1")]
+    assert cache._canonical("Beam", config, trailer, changed_type)[1] != key
+
+
+def test_cached_plan_applies_to_reordered_manifest(manifest, assert_valid_plan):
+    cache = PlanCache()
+    algorithm = XYAxisLoading()
+    first = algorithm.run(manifest, plan_cache=cache)
+    assert (cache.hits, cache.misses, len(cache)) == (0, 1, 1)
+
+    reordered = renamed(manifest, "R_")
+    second = algorithm.run(reordered, plan_cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    assert len(second) == len(first)
+    assert {p.pallet_id for p in second} <= {p.pallet_id for p in reordered}
+    assert algorithm.trailer.get_loading_meters() == max(p.position[0] + p.dimensions[0] for p in first) / 1000
+    assert_valid_plan(second, algorithm.trailer)
+
+    # Palety o tym samym opisie dostają te same ułożenia co w pierwszym planie
+    assert layout(second) == layout(first)
+
+
+def test_lru_eviction(make_manifest):
+    cache = PlanCache(max_entries=2)
+    trailer = Trailer()
+    manifests = [make_manifest(4 + i) for i in range(3)]
+    for pallets in manifests:
+        cache.store("XY", {}, trailer, pallets, [])
+
+    assert len(cache) == 2
+    # Pierwszy manifest wypadł; odczyt drugiego czyni go najświeższym, więc wypada trzeci
+    assert cache.lookup("XY", {}, trailer, manifests[0]) is None
+    assert cache.lookup("XY", {}, trailer, manifests[1]) == []
+    cache.store("XY", {}, trailer, manifests[0], [])
+    assert cache.lookup("XY", {}, trailer, manifests[2]) is None
+    assert cache.lookup("XY", {}, trailer, manifests[1]) == []
+
+
+def test_disk_round_trip(tmp_path, manifest, assert_valid_plan):
+    algorithm = XYAxisLoading()
+    first = algorithm.run(manifest, plan_cache=PlanCache(cache_dir=str(tmp_path)))
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    # Nowa pamięć z tym samym katalogiem odczytuje plan z dysku
+    cache = PlanCache(cache_dir=str(tmp_path))
+    reordered = renamed(manifest, "D_")
+    second = XYAxisLoading().run(reordered, plan_cache=cache)
+
+    assert (cache.hits, cache.misses, len(cache)) == (1, 0, 1)
+    assert len(second) == len(first)
+    assert_valid_plan(second, Trailer())
+
+
+def test_plan_cut_short_by_time_budget_is_not_stored(manifest):
+    cache = PlanCache()
+    algorithm = LNSLoading({"max_iterations": 100000, "time_budget_s": None, "seed": 1})
+    algorithm.run(manifest, time_budget_s=0.1, plan_cache=cache)
+    assert (cache.misses, len(cache)) == (1, 0)
+
+    # Plan ukończony przed terminem jest zapamiętywany
+    XYAxisLoading().run(manifest, time_budget_s=10.0, plan_cache=cache)
+    assert (cache.misses, len(cache)) == (2, 1)
+
+
+def test_callable_config_is_rejected(manifest):
+    cache = PlanCache()
+    with pytest.raises(ValueError):
+        cache._canonical("Portfolio", {"objective": lambda result: result["loading_meters"]}, Trailer(), manifest)
+    with pytest.raises(ValueError):
+        cache._canonical("Portfolio", {"algorithm_configs": {"LNS": {"score": len}}}, Trailer(), manifest)
+
+    algorithm = PortfolioLoading({
+        "algorithms": ["XY_Axis_Loading"], "workers": 1, "objective": lambda result: result["loading_meters"]
+    })
+    with pytest.raises(ValueError):
+        algorithm.run(manifest, plan_cache=cache)
+    assert len(cache) == 0
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        PlanCache(max_entries=0)
+    with pytest.raises(ValueError):
+        PlanCache(weight_band_kg=0)
@@ -0,0 +1,104 @@
+"""
+Testy portfela algorytmów załadunku.
+"""
+
+import time
+
+from src.algorithms.portfolio_loading import PortfolioLoading, OBJECTIVES
+
+ALGORITHMS = ["XY_Axis_Loading", "X_Distribution", "Lane_DP_Loading"]
+
+
+def test_best_plan_is_valid(manifest, assert_valid_plan):
+    algorithm = PortfolioLoading({"algorithms": ALGORITHMS, "workers": 1})
+    loaded_pallets = algorithm.run(manifest)
+
+    assert algorithm.best_algorithm in ALGORITHMS
+    assert set(algorithm.results) == set(ALGORITHMS)
+    best = algorithm.results[algorithm.best_algorithm]
+    assert all(result["score"] <= best["score"] for result in algorithm.results.values())
+    assert len(loaded_pallets) == best["pallets_count"]
+    assert_valid_plan(loaded_pallets, algorithm.trailer)
+
+
+def test_objective_selects_best_plan(manifest):
+    for objective in OBJECTIVES:
+        algorithm = PortfolioLoading({"algorithms": ALGORITHMS, "workers": 1, "objective": objective})
+        algorithm.run(manifest)
+
+        scores = {name: OBJECTIVES[objective](result) for name, result in algorithm.results.items()}
+        assert scores[algorithm.best_algorithm] == max(scores.values())
+
+
+def test_callable_objective(manifest):
+    # Funkcja celu preferująca najdłuższy załadunek wybiera inny plan niż domyślna
+    algorithm = PortfolioLoading({
+        "algorithms": ALGORITHMS, "workers": 1, "objective": lambda result: result["loading_meters"]
+    })
+    loaded_pallets = algorithm.run(manifest)
+
+    longest = max(result["loading_meters"] for result in algorithm.results.values())
+    default = PortfolioLoading({"algorithms": ALGORITHMS, "workers": 1})
+    default.run(manifest)
+    assert algorithm.best_algorithm != default.best_algorithm
+    assert algorithm.results[algorithm.best_algorithm]["loading_meters"] == longest
+    assert algorithm.trailer.get_loading_meters() == longest
+    assert len(loaded_pallets) == algorithm.results[algorithm.best_algorithm]["pallets_count"]
+
+
+def test_results_report_time_per_algorithm(manifest):
+    algorithm = PortfolioLoading({"algorithms": ALGORITHMS, "workers": 1})
+    start_time = time.perf_counter()
+    algorithm.run(manifest)
+    elapsed = time.perf_counter() - start_time
+
+    assert all(0 < result["time_s"] <= elapsed for result in algorithm.results.values())
+    # Algorytmy wykonują się po kolei, więc ich czasy sumują się co najwyżej do czasu portfela
+    assert sum(result["time_s"] for result in algorithm.results.values()) <= elapsed
+
+
+def test_failing_algorithm_does_not_stop_others(manifest, assert_valid_plan):
+    algorithm = PortfolioLoading({
+        "algorithms": ALGORITHMS + ["Unknown_Loading"], "workers": 2, "executor": "thread"
+    })
+    loaded_pallets = algorithm.run(manifest)
+
+    failed = algorithm.results["Unknown_Loading"]
+    assert "error" in failed and "score" not in failed
+    assert all("error" not in algorithm.results[name] for name in ALGORITHMS)
+    assert algorithm.best_algorithm in ALGORITHMS
+    assert loaded_pallets
+    assert_valid_plan(loaded_pallets, algorithm.trailer)
+
+
+def test_time_budget_is_shared_by_queued_algorithms(make_manifest):
+    # Więcej algorytmów niż procesów: kolejne dostają tylko czas pozostały do terminu portfela
+    slow_configs = {
+        "Genetic_Loading": {"generations": 10000, "time_budget_s": None},
+        "LNS_Loading": {"max_iterations": 100000, "time_budget_s": None},
+        "Beam_Search_Loading": {"beam_width": 64, "expansion_width": 8},
+        "XY_Axis_Loading": {"polish": True, "polish_config": {"iterations": 10 ** 6, "time_budget_s": None}}
+    }
+    algorithm = PortfolioLoading({
+        "algorithms": list(slow_configs), "algorithm_configs": slow_configs, "workers": 2, "executor": "process"
+    })
+    start_time = time.perf_counter()
+    loaded_pallets = algorithm.run(make_manifest(40), time_budget_s=0.5)
+
+    assert time.perf_counter() - start_time < 0.5 + 0.5
+    assert loaded_pallets
+    assert set(algorithm.results) == set(slow_configs)
+
+
+def test_algorithm_queued_past_deadline_is_not_run(make_manifest):
+    # Pierwszy algorytm wykorzystuje cały budżet, więc na drugi nie starcza czasu
+    algorithm = PortfolioLoading({
+        "algorithms": ["LNS_Loading", "XY_Axis_Loading"],
+        "algorithm_configs": {"LNS_Loading": {"max_iterations": 100000, "time_budget_s": None}},
+        "workers": 1
+    })
+    algorithm.run(make_manifest(40), time_budget_s=0.2)
+
+    assert algorithm.best_algorithm == "LNS_Loading"
+    assert "error" in algorithm.results["XY_Axis_Loading"]
+    assert algorithm.results["XY_Axis_Loading"]["time_s"] == 0.0
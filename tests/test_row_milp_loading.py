@@ -0,0 +1,61 @@
+"""
+Testy algorytmu załadunku rzędami poprzecznymi (MILP).
+"""
+
+import time
+
+import pytest
+
+from src.algorithms.row_milp_loading import RowMILPLoading
+from src.config import CONSTRAINTS
+
+
+def test_plan_is_valid(manifest, assert_valid_plan):
+    algorithm = RowMILPLoading({"time_limit": 2.0})
+    loaded_pallets = algorithm.run(manifest)
+
+    assert loaded_pallets
+    assert_valid_plan(loaded_pallets, algorithm.trailer)
+
+
+def test_time_limit_within_budget(manifest, assert_valid_plan):
+    algorithm = RowMILPLoading({"time_limit": 30.0})
+    start_time = time.perf_counter()
+    loaded_pallets = algorithm.run(manifest, time_budget_s=0.5)
+
+    assert time.perf_counter() - start_time < 2.0
+    assert_valid_plan(loaded_pallets, algorithm.trailer)
+
+
+def test_solution_info_reports_status_gap_and_bound(manifest):
+    algorithm = RowMILPLoading({"time_limit": 2.0})
+    algorithm.run(manifest)
+    info = algorithm.solution_info
+
+    assert info["optimal"]
+    assert "Optimal" in info["status"]
+    assert info["gap"] == pytest.approx(0.0)
+    # Przy rozwiązaniu optymalnym ograniczenie dualne pokrywa się z wartością celu
+    assert info["bound"] == pytest.approx(info["objective"])
+    assert info["patterns"] > 0
+    assert info["time_s"] >= 0
+
+
+def test_front_back_balance_keeps_front_share_within_threshold(manifest, assert_valid_plan):
+    target = CONSTRAINTS["front_to_back_weight_distribution"]
+    threshold = CONSTRAINTS["weight_distribution_threshold"]
+
+    unbalanced = RowMILPLoading({"time_limit": 2.0})
+    unbalanced.run(manifest)
+    unbalanced_share = unbalanced.trailer.weight_distribution["front"] / unbalanced.trailer.weight_distribution["total"]
+
+    algorithm = RowMILPLoading({"time_limit": 2.0, "front_back_balance": True})
+    loaded_pallets = algorithm.run(manifest)
+    distribution = algorithm.trailer.weight_distribution
+    front_share = distribution["front"] / distribution["total"]
+
+    assert len(loaded_pallets) == len(manifest)
+    assert_valid_plan(loaded_pallets, algorithm.trailer)
+    # Bez ograniczenia przód jest przeciążony, z ograniczeniem udział mieści się w przedziale
+    assert abs(unbalanced_share - target) > threshold
+    assert target - threshold <= front_share <= target + threshold
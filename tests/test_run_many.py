@@ -0,0 +1,59 @@
+"""
+Testy planowania wielu manifestów (`LoadingAlgorithm.run_many`).
+"""
+
+import pytest
+
+from src.algorithms.beam_search_loading import BeamSearchLoading
+from src.algorithms.genetic_loading import GeneticLoading
+from src.algorithms.lns_loading import LNSLoading
+from src.algorithms.xy_axis_loading import XYAxisLoading
+from src.data.trailer import Trailer
+
+ALGORITHMS = [
+    pytest.param(lambda: XYAxisLoading(), id="xy_axis"),
+    pytest.param(lambda: BeamSearchLoading({"beam_width": 4}), id="beam_search"),
+    pytest.param(
+        lambda: GeneticLoading({"population_size": 10, "generations": 5, "time_budget_s": None, "seed": 1}),
+        id="genetic"
+    ),
+    pytest.param(lambda: LNSLoading({"time_budget_s": None, "max_iterations": 50, "seed": 1}), id="lns")
+]
+
+
+@pytest.fixture
+def manifests(make_manifest):
+    """Dwanaście manifestów o różnych liczbach i typach palet."""
+    return [make_manifest(6 + 2 * i, prefix=f"M{i}_", offset=i) for i in range(12)]
+
+
+def check_results(results, manifests, assert_valid_plan):
+    """Sprawdza, że każdy manifest ma wynik bez błędu i poprawny plan z własnych palet."""
+    assert sorted(result["index"] for result in results) == list(range(len(manifests)))
+    for result in results:
+        assert "error" not in result, result.get("error")
+        loaded_pallets = result["pallets"].to_pallets()
+        manifest_ids = {p.pallet_id for p in manifests[result["index"]]}
+        assert loaded_pallets
+        assert len(loaded_pallets) == result["pallets_count"]
+        assert {p.pallet_id for p in loaded_pallets} <= manifest_ids
+        assert_valid_plan(loaded_pallets, Trailer())
+
+
+@pytest.mark.parametrize("create_algorithm", ALGORITHMS)
+def test_thread_pool(create_algorithm, manifests, assert_valid_plan):
+    algorithm = create_algorithm()
+    results = list(algorithm.run_many(manifests, workers=4, executor_type="thread"))
+
+    check_results(results, manifests, assert_valid_plan)
+
+
+def test_process_pool_matches_thread_pool(manifests, assert_valid_plan):
+    algorithm = BeamSearchLoading({"beam_width": 4})
+    by_process = {r["index"]: r for r in algorithm.run_many(manifests, workers=2, executor_type="process")}
+    by_thread = {r["index"]: r for r in algorithm.run_many(manifests, workers=2, executor_type="thread")}
+
+    check_results(list(by_process.values()), manifests, assert_valid_plan)
+    for index, result in by_thread.items():
+        assert result["pallets_count"] == by_process[index]["pallets_count"]
+        assert result["loading_meters"] == by_process[index]["loading_meters"]
@@ -0,0 +1,31 @@
+"""
+Testy poprawiania planu załadunku metodą symulowanego wyżarzania.
+"""
+
+from src.algorithms.simulated_annealing import SimulatedAnnealingImprover
+from src.algorithms.xy_axis_loading import XYAxisLoading
+
+FAST_CONFIG = {"iterations": 400, "time_budget_s": None, "seed": 3}
+
+
+def test_improved_plan_is_valid(manifest, assert_valid_plan):
+    algorithm = XYAxisLoading()
+    loaded_pallets = algorithm.run(manifest)
+
+    improver = SimulatedAnnealingImprover(FAST_CONFIG)
+    improved_pallets = improver.improve(algorithm.trailer)
+
+    assert len(improved_pallets) == len(loaded_pallets)
+    assert improver.stats["final_cost"] <= improver.stats["initial_cost"]
+    assert_valid_plan(improved_pallets, algorithm.trailer)
+
+
+def test_polish_option_in_run(manifest, assert_valid_plan):
+    plain = XYAxisLoading()
+    plain.run(manifest)
+
+    polished = XYAxisLoading({"polish": True, "polish_config": FAST_CONFIG})
+    loaded_pallets = polished.run(manifest)
+
+    assert len(loaded_pallets) == len(plain.trailer.loaded_pallets)
+    assert_valid_plan(loaded_pallets, polished.trailer)
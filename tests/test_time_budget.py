@@ -0,0 +1,92 @@
+"""
+Testy budżetu czasu i wyników pośrednich (`progress`) w `LoadingAlgorithm.run`.
+"""
+
+import time
+
+import pytest
+
+from src.algorithms.beam_search_loading import BeamSearchLoading
+from src.algorithms.genetic_loading import GeneticLoading
+from src.algorithms.lns_loading import LNSLoading
+from src.algorithms.xy_axis_loading import XYAxisLoading
+
+TIME_BUDGET_S = 0.3
+# Zapas na ostatnią iterację przed sprawdzeniem budżetu i odtworzenie planu
+EPSILON_S = 0.3
+
+# Konfiguracje, które bez budżetu liczyłyby znacznie dłużej niż TIME_BUDGET_S
+GENETIC_CONFIG = {"generations": 10000, "time_budget_s": None, "seed": 1, "workers": 1}
+LNS_CONFIG = {"max_iterations": 100000, "time_budget_s": None, "seed": 1}
+BEAM_CONFIG = {"beam_width": 64, "expansion_width": 8, "workers": 1}
+POLISH_CONFIG = {"polish": True, "polish_config": {"iterations": 10 ** 6, "time_budget_s": None, "seed": 1}}
+
+SLOW_LOADERS = [
+    pytest.param(GeneticLoading, GENETIC_CONFIG, id="genetic"),
+    pytest.param(LNSLoading, LNS_CONFIG, id="lns"),
+    pytest.param(BeamSearchLoading, BEAM_CONFIG, id="beam_search"),
+    pytest.param(XYAxisLoading, POLISH_CONFIG, id="polish")
+]
+
+
+@pytest.mark.parametrize("algorithm_class, config", SLOW_LOADERS)
+def test_run_returns_within_time_budget(algorithm_class, config, make_manifest, assert_valid_plan):
+    algorithm = algorithm_class(config)
+    start_time = time.perf_counter()
+    loaded_pallets = algorithm.run(make_manifest(40), time_budget_s=TIME_BUDGET_S)
+
+    assert time.perf_counter() - start_time < TIME_BUDGET_S + EPSILON_S
+    assert loaded_pallets
+    assert_valid_plan(loaded_pallets, algorithm.trailer)
+
+
+@pytest.mark.parametrize("algorithm_class, config", SLOW_LOADERS)
+def test_progress_reports_intermediate_results_and_final_event(algorithm_class, config, make_manifest):
+    events = []
+    algorithm = algorithm_class(config)
+    loaded_pallets = algorithm.run(make_manifest(40), time_budget_s=TIME_BUDGET_S, progress=events.append)
+
+    intermediate, final = events[:-1], events[-1]
+    assert intermediate
+    assert all(event["algorithm"] == algorithm.name for event in events)
+    assert [event["elapsed_s"] for event in events] == sorted(event["elapsed_s"] for event in events)
+    assert not any(event.get("final") for event in intermediate)
+    assert final["final"] is True
+    assert final["pallets_count"] == len(loaded_pallets)
+    assert final["loading_meters"] == pytest.approx(algorithm.trailer.get_loading_meters())
+
+
+def test_genetic_progress_reports_improving_fitness(make_manifest):
+    events = []
+    GeneticLoading(GENETIC_CONFIG).run(make_manifest(40), time_budget_s=TIME_BUDGET_S, progress=events.append)
+
+    fitness = [event["fitness"] for event in events[:-1]]
+    assert fitness == sorted(set(fitness))
+    assert [event["generation"] for event in events[:-1]] == sorted(set(event["generation"] for event in events[:-1]))
+
+
+def test_lns_progress_reports_improving_plans(make_manifest):
+    events = []
+    LNSLoading(LNS_CONFIG).run(make_manifest(40), time_budget_s=TIME_BUDGET_S, progress=events.append)
+
+    # Każdy kolejny wynik ma więcej palet albo tyle samo przy mniejszym LDM
+    keys = [(event["pallets_count"], -event["loading_meters"]) for event in events[:-1]]
+    assert all(previous < current for previous, current in zip(keys, keys[1:]))
+
+
+def test_beam_progress_reports_growing_partial_plans(make_manifest):
+    events = []
+    BeamSearchLoading(BEAM_CONFIG).run(make_manifest(40), time_budget_s=TIME_BUDGET_S, progress=events.append)
+
+    # Najlepszy stan wiązki ma w każdym kroku o jedną paletę więcej
+    counts = [event["pallets_count"] for event in events[:-1]]
+    assert counts == list(range(1, len(counts) + 1))
+    assert all("score" in event for event in events[:-1])
+
+
+def test_polish_progress_is_reported_as_separate_stage(make_manifest):
+    events = []
+    XYAxisLoading(POLISH_CONFIG).run(make_manifest(40), time_budget_s=TIME_BUDGET_S, progress=events.append)
+
+    assert all(event["stage"] == "polish" for event in events[:-1])
+    assert "stage" not in events[-1]
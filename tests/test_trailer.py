@@ -0,0 +1,58 @@
+"""
+Testy zapytań naczepy o miejsce dla palety.
+"""
+
+import pytest
+
+from src.data.trailer import Trailer
+
+
+@pytest.fixture
+def trailer(make_pallet):
+    """Naczepa z jedną paletą L1 przy przedniej ścianie."""
+    trailer = Trailer()
+    assert trailer.add_pallet(make_pallet("a", "L1", position=(0, 0, 0)))
+    return trailer
+
+
+def test_can_place_checks_collisions(trailer, make_pallet):
+    pallet = make_pallet("b", "L1")
+
+    assert not trailer.can_place(pallet, 0, 0)
+    assert not trailer.can_place(pallet, 1399, 0)
+    assert trailer.can_place(pallet, 1400, 0)
+    assert trailer.can_place(pallet, 0, 720)
+    # Nad paletą "a" (wysokość 950 mm) jest wolne miejsce
+    assert trailer.can_place(pallet, 0, 0, 950)
+    assert not trailer.can_place(pallet, 0, 0, 949)
+
+
+def test_can_place_checks_bounds(trailer, make_pallet):
+    pallet = make_pallet("b", "L1")
+
+    assert trailer.can_place(pallet, trailer.length - 1400, trailer.width - 720)
+    assert not trailer.can_place(pallet, trailer.length - 1399, 720)
+    assert not trailer.can_place(pallet, 1400, trailer.width - 719)
+    assert not trailer.can_place(pallet, -1, 720)
+    assert not trailer.can_place(pallet, 1400, 0, trailer.height - 949)
+
+
+def test_can_place_with_rotation(trailer, make_pallet):
+    pallet = make_pallet("b", "L1")
+
+    # Obrócona paleta zajmuje 720 mm długości i 1400 mm szerokości
+    assert trailer.can_place(pallet, trailer.length - 720, 0, rotation=90)
+    assert not trailer.can_place(pallet, trailer.length - 720, 0, rotation=0)
+    assert not trailer.can_place(pallet, 1400, trailer.width - 1399, rotation=90)
+
+    # Badanie nie zmienia palety ani naczepy
+    assert pallet.rotation == 0 and pallet.position == (0, 0, 0)
+    assert [p.pallet_id for p in trailer.loaded_pallets] == ["a"]
+
+
+def test_can_place_agrees_with_add_pallet(trailer, make_pallet):
+    for x in range(0, 3000, 350):
+        for y in (0, 500, 720, 1730):
+            pallet = make_pallet(f"p{x}_{y}", "L2", position=(x, y, 0))
+            probe = trailer.copy()
+            assert probe.can_place(pallet, x, y) == probe.add_pallet(pallet)
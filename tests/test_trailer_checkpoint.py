@@ -0,0 +1,190 @@
+"""
+Testy punktów kontrolnych naczepy (checkpoint / rollback / release).
+"""
+
+import pytest
+
+from src.data.trailer import Trailer
+
+
+@pytest.fixture
+def snapshot(make_pallet):
+    """Funkcja zwracająca stan naczepy: załadunek, mapę wysokości, struktury pomocnicze i metryki."""
+    probe = make_pallet("probe", "L2")
+
+    def take(trailer):
+        return {
+            "pallets": [(p.pallet_id, p.position, p.rotation) for p in trailer.loaded_pallets],
+            "height_map": trailer.height_map.copy(),
+            "weight_distribution": dict(trailer.weight_distribution),
+            "efficiency": trailer.get_loading_efficiency(),
+            "loading_meters": trailer.get_loading_meters(),
+            "corner_points": trailer.get_corner_points(probe),
+            "free_space_position": trailer.find_free_space_position(probe),
+            "indexed": sorted(p.pallet_id for p in trailer._spatial_index.query(0, trailer.length))
+        }
+
+    return take
+
+
+def assert_same_state(actual, expected):
+    """Porównuje dwa stany naczepy zwrócone przez `snapshot`."""
+    assert actual["pallets"] == expected["pallets"]
+    assert (actual["height_map"] == expected["height_map"]).all()
+    assert actual["weight_distribution"] == pytest.approx(expected["weight_distribution"])
+    assert actual["efficiency"] == pytest.approx(expected["efficiency"])
+    assert actual["loading_meters"] == expected["loading_meters"]
+    assert actual["corner_points"] == expected["corner_points"]
+    assert actual["free_space_position"] == expected["free_space_position"]
+    assert actual["indexed"] == expected["indexed"]
+
+
+@pytest.fixture
+def trailer(make_pallet):
+    """Naczepa z kilkoma paletami na podłodze i jedną w stosie."""
+    trailer = Trailer()
+    for pallet in (
+        make_pallet("a", "L1", position=(0, 0, 0)),
+        make_pallet("b", "L1", position=(0, 720, 0)),
+        make_pallet("c", "L3", position=(1400, 0, 0)),
+        make_pallet("d", "L2", position=(0, 0, 950))
+    ):
+        assert trailer.add_pallet(pallet)
+    return trailer
+
+
+def test_rollback_restores_state_after_add(trailer, snapshot, make_pallet):
+    before = snapshot(trailer)
+
+    token = trailer.checkpoint()
+    assert trailer.add_pallet(make_pallet("e", "L4", position=(3200, 0, 0)))
+    assert trailer.add_pallet(make_pallet("f", "L2", position=(1400, 620, 0), rotation=90))
+    assert snapshot(trailer)["pallets"] != before["pallets"]
+
+    trailer.rollback(token)
+    assert_same_state(snapshot(trailer), before)
+    trailer.release(token)
+    assert_same_state(snapshot(trailer), before)
+
+
+def test_rollback_restores_removed_and_moved_pallets(trailer, snapshot):
+    before = snapshot(trailer)
+    moved = next(p for p in trailer.loaded_pallets if p.pallet_id == "c")
+
+    token = trailer.checkpoint()
+    assert trailer.remove_pallet("d")
+    assert trailer.remove_pallet("c")
+    moved.set_position(5000, 0, 0)
+    moved.rotate()
+    assert trailer.add_pallet(moved)
+
+    trailer.rollback(token)
+    assert moved.position == (1400, 0, 0) and moved.rotation == 0
+    assert_same_state(snapshot(trailer), before)
+
+
+def test_rollback_after_removing_all_pallets(trailer, snapshot):
+    before = snapshot(trailer)
+
+    token = trailer.checkpoint()
+    for pallet_id in ("d", "a", "b", "c"):
+        assert trailer.remove_pallet(pallet_id)
+    assert trailer.get_loading_meters() == 0
+
+    trailer.rollback(token)
+    assert_same_state(snapshot(trailer), before)
+
+
+def test_nested_checkpoints(trailer, snapshot, make_pallet):
+    before_outer = snapshot(trailer)
+    outer = trailer.checkpoint()
+    assert trailer.add_pallet(make_pallet("e", "L4", position=(3200, 0, 0)))
+
+    before_inner = snapshot(trailer)
+    inner = trailer.checkpoint()
+    assert trailer.add_pallet(make_pallet("f", "L1", position=(5450, 0, 0)))
+    assert trailer.remove_pallet("a")
+
+    # Cofnięcie wewnętrznego punktu zachowuje zmiany sprzed niego
+    trailer.rollback(inner)
+    assert_same_state(snapshot(trailer), before_inner)
+
+    # Punkt kontrolny pozostaje aktywny po cofnięciu
+    assert trailer.add_pallet(make_pallet("g", "L2", position=(5450, 0, 0)))
+    trailer.rollback(inner)
+    assert_same_state(snapshot(trailer), before_inner)
+    trailer.release(inner)
+
+    trailer.rollback(outer)
+    assert_same_state(snapshot(trailer), before_outer)
+    trailer.release(outer)
+
+
+def test_rollback_to_outer_checkpoint_discards_inner(trailer, snapshot, make_pallet):
+    before = snapshot(trailer)
+    outer = trailer.checkpoint()
+    assert trailer.add_pallet(make_pallet("e", "L4", position=(3200, 0, 0)))
+    inner = trailer.checkpoint()
+    assert trailer.add_pallet(make_pallet("f", "L1", position=(5450, 0, 0)))
+
+    trailer.rollback(outer)
+    assert_same_state(snapshot(trailer), before)
+    with pytest.raises(ValueError):
+        trailer.rollback(inner)
+
+
+def test_release_keeps_changes(trailer, snapshot, make_pallet):
+    token = trailer.checkpoint()
+    assert trailer.add_pallet(make_pallet("e", "L4", position=(3200, 0, 0)))
+    assert trailer.remove_pallet("b")
+    after = snapshot(trailer)
+
+    trailer.release(token)
+    assert_same_state(snapshot(trailer), after)
+    with pytest.raises(ValueError):
+        trailer.rollback(token)
+
+    # Bez aktywnych punktów kontrolnych dziennik cofania nie rośnie
+    assert trailer.add_pallet(make_pallet("f", "L1", position=(5450, 0, 0)))
+    assert trailer._undo_log == []
+
+
+def test_release_inner_checkpoint_keeps_outer_active(trailer, snapshot, make_pallet):
+    before = snapshot(trailer)
+    outer = trailer.checkpoint()
+    assert trailer.add_pallet(make_pallet("e", "L4", position=(3200, 0, 0)))
+    inner = trailer.checkpoint()
+    assert trailer.add_pallet(make_pallet("f", "L1", position=(5450, 0, 0)))
+    trailer.release(inner)
+
+    # Zmiany zatwierdzone w wewnętrznym punkcie nadal można cofnąć do zewnętrznego
+    trailer.rollback(outer)
+    assert_same_state(snapshot(trailer), before)
+
+
+def test_back_to_back_checkpoints_have_distinct_tokens(trailer, snapshot, make_pallet):
+    before = snapshot(trailer)
+    outer = trailer.checkpoint()
+    inner = trailer.checkpoint()
+    assert outer != inner
+
+    # Zwolnienie wewnętrznego punktu nie może zwolnić zewnętrznego ani wyczyścić dziennika
+    trailer.release(inner)
+    assert trailer.add_pallet(make_pallet("e", "L4", position=(3200, 0, 0)))
+    trailer.rollback(outer)
+    assert_same_state(snapshot(trailer), before)
+    with pytest.raises(ValueError):
+        trailer.rollback(inner)
+
+
+def test_release_outer_checkpoint_keeps_inner_active(trailer, snapshot, make_pallet):
+    outer = trailer.checkpoint()
+    inner = trailer.checkpoint()
+    trailer.release(outer)
+
+    before_add = snapshot(trailer)
+    assert trailer.add_pallet(make_pallet("e", "L4", position=(3200, 0, 0)))
+    trailer.rollback(inner)
+    assert_same_state(snapshot(trailer), before_add)
+    with pytest.raises(ValueError):
+        trailer.rollback(outer)